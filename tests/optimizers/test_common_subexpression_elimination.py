@@ -311,3 +311,61 @@ def test_common_subexpression_with_multiple_uses(
     assert add2_node.inputs == ["add1"]
     assert add3_node.inputs == ["add1"]
     assert result_node.inputs == ["add1", "add1", "add1"]
+
+
+def test_cse_distinguishes_node_attributes(
+    graph: Graph, strategy: CommonSubexpressionElimination
+) -> None:
+    a = Node("a", tensor=Tensor([[1, 2]]), op=OpType.CONST.value)
+    rows = Node("rows", op=OpType.SUM.value, inputs=["a"], attrs={"axis": 0})
+    cols = Node("cols", op=OpType.SUM.value, inputs=["a"], attrs={"axis": 1})
+    again = Node("again", op=OpType.SUM.value, inputs=["a"], attrs={"axis": 0})
+
+    for node in [a, rows, cols, again]:
+        graph.add_node(node)
+
+    strategy.apply(graph)
+
+    assert cols.op == OpType.SUM.value
+    assert again.inputs == ["rows"]
+
+
+def test_cse_handles_list_attributes(
+    graph: Graph, strategy: CommonSubexpressionElimination
+) -> None:
+    x = Node("x", tensor=Tensor.from_flat(range(16), (1, 1, 4, 4)))
+    w = Node("w", tensor=Tensor.from_flat([1] * 4, (1, 1, 2, 2)))
+    conv = OpType.CONV2D.value
+    first = Node("first", op=conv, inputs=["x", "w"], attrs={"stride": [2, 2]})
+    same = Node("same", op=conv, inputs=["x", "w"], attrs={"stride": (2, 2)})
+    other = Node("other", op=conv, inputs=["x", "w"], attrs={"stride": [1, 1]})
+    for node in [x, w, first, same, other]:
+        graph.add_node(node)
+
+    strategy.apply(graph)
+
+    assert same.inputs == ["first"]
+    assert other.op == conv
+
+
+def test_cse_compares_constant_dtypes_and_shapes(
+    graph: Graph, strategy: CommonSubexpressionElimination
+) -> None:
+    const = OpType.CONST.value
+    graph.add_node(Node("small", tensor=Tensor([100, 100], "int8"), op=const))
+    graph.add_node(Node("wide", tensor=Tensor([100, 100], "int64"), op=const))
+    graph.add_node(Node("same", tensor=Tensor([100, 100], "int64"), op=const))
+    graph.add_node(Node("flat", tensor=Tensor([1, 2, 3, 4]), op=const))
+    graph.add_node(Node("square", tensor=Tensor([[1, 2], [3, 4]]), op=const))
+    graph.add_node(Node("sum", op=OpType.ADD.value, inputs=["same", "same"]))
+
+    loaded = Graph.from_bytes(graph.to_bytes())
+    strategy.apply(loaded)
+
+    total = loaded.get_node("sum")
+    assert total is not None and total.inputs == ["wide", "wide"]
+    for node_id in ["small", "wide", "flat", "square"]:
+        node = loaded.get_node(node_id)
+        assert node is not None and node.inputs == []
+        # Signatures pack the mapped elements instead of nesting them.
+        assert node.tensor is not None and node.tensor._data is None
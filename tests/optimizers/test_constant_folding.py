@@ -160,3 +160,25 @@ def test_folding_with_commutative_operations(
     assert folded_node2.op == OpType.CONST.value
     assert folded_node1.tensor is not None and folded_node2.tensor is not None
     assert folded_node1.tensor.data == folded_node2.tensor.data == 8
+
+
+def test_folding_unary_and_reduction_nodes(
+    graph: Graph, strategy: ConstantFolding
+) -> None:
+    const = Node(
+        "const", tensor=Tensor([[1, -2], [3, 4]]), op=OpType.CONST.value
+    )
+    relu = Node("relu", op=OpType.RELU.value, inputs=["const"])
+    total = Node(
+        "total", op=OpType.SUM.value, inputs=["relu"], attrs={"axis": 1}
+    )
+
+    for node in [const, relu, total]:
+        graph.add_node(node)
+
+    strategy.apply(graph)
+
+    assert total.op == OpType.CONST.value
+    assert total.attrs == {}
+    assert total.tensor is not None
+    assert total.tensor.data == [1, 7]
@@ -197,3 +197,21 @@ def test_isolated_nodes(graph: Graph, strategy: DeadCodeElimination) -> None:
         graph.get_node(node_id) is not None
         for node_id in ["input1", "input2", "output"]
     )
+
+
+def test_dead_code_elimination_invalidates_the_execution_order(
+    graph: Graph, strategy: DeadCodeElimination
+) -> None:
+    graph.add_node(Node("input", tensor=Tensor(5), op=OpType.CONST.value))
+    graph.add_node(Node("dead", op=OpType.NEGATIVE.value, inputs=["input"]))
+    output = Node("output", op=OpType.EXP.value, inputs=["input"])
+    output.is_output = True
+    graph.add_node(output)
+    assert len(graph.topological_sort()) == 3
+
+    strategy.apply(graph)
+
+    assert [node.node_id for node in graph.topological_sort()] == [
+        "input",
+        "output",
+    ]
@@ -0,0 +1,95 @@
+import pytest
+
+from xla_lite.core import Graph, Node, OpType, Tensor
+from xla_lite.execution import Executor
+from xla_lite.optimizers import LinearFusion
+
+
+@pytest.fixture
+def graph() -> Graph:
+    graph = Graph()
+    const = OpType.CONST.value
+    graph.add_node(
+        Node("x", tensor=Tensor([[1.0, -2.0], [3.0, 4.0]]), op=const)
+    )
+    graph.add_node(
+        Node("w", tensor=Tensor([[1.0, 0.5], [-1.0, 2.0]]), op=const)
+    )
+    graph.add_node(Node("b", tensor=Tensor([[0.5, -9.0]]), op=const))
+    return graph
+
+
+@pytest.fixture
+def strategy() -> LinearFusion:
+    return LinearFusion()
+
+
+def test_fuses_matmul_bias_and_activation(
+    graph: Graph, strategy: LinearFusion
+) -> None:
+    graph.add_node(Node("mm", op=OpType.MATMUL.value, inputs=["x", "w"]))
+    graph.add_node(Node("biased", op=OpType.ADD.value, inputs=["b", "mm"]))
+    graph.add_node(Node("act", op=OpType.RELU.value, inputs=["biased"]))
+    graph.add_node(Node("out", op=OpType.SUM.value, inputs=["act"]))
+    expected = Executor(graph).execute()["out"].data
+
+    strategy.apply(graph)
+
+    assert [node.node_id for node in graph.nodes] == [
+        "x",
+        "w",
+        "b",
+        "act",
+        "out",
+    ]
+    act = graph.get_node("act")
+    assert act is not None
+    assert act.op == OpType.LINEAR.value
+    assert act.inputs == ["x", "w", "b"]
+    assert act.attrs == {"activation": "relu"}
+    assert Executor(graph).execute()["out"].data == expected
+
+
+def test_fuses_partial_chains(graph: Graph, strategy: LinearFusion) -> None:
+    graph.add_node(Node("mm1", op=OpType.MATMUL.value, inputs=["x", "w"]))
+    graph.add_node(Node("exp", op=OpType.EXP.value, inputs=["mm1"]))
+    graph.add_node(Node("mm2", op=OpType.MATMUL.value, inputs=["x", "w"]))
+    graph.add_node(Node("biased", op=OpType.ADD.value, inputs=["mm2", "b"]))
+
+    strategy.apply(graph)
+
+    exp, biased = graph.get_node("exp"), graph.get_node("biased")
+    assert exp is not None and biased is not None
+    assert (exp.op, exp.inputs, exp.attrs) == (
+        OpType.LINEAR.value,
+        ["x", "w"],
+        {"activation": "exp"},
+    )
+    assert (biased.op, biased.inputs, biased.attrs) == (
+        OpType.LINEAR.value,
+        ["x", "w", "b"],
+        {},
+    )
+
+
+def test_keeps_shared_and_output_intermediates(
+    graph: Graph, strategy: LinearFusion
+) -> None:
+    graph.add_node(Node("mm", op=OpType.MATMUL.value, inputs=["x", "w"]))
+    graph.add_node(Node("biased", op=OpType.ADD.value, inputs=["mm", "b"]))
+    graph.add_node(Node("act", op=OpType.RELU.value, inputs=["biased"]))
+    graph.add_node(Node("other", op=OpType.EXP.value, inputs=["biased"]))
+    graph.add_node(Node("mm2", op=OpType.MATMUL.value, inputs=["x", "w"]))
+    graph.add_node(Node("act2", op=OpType.RELU.value, inputs=["mm2"]))
+    mm2 = graph.get_node("mm2")
+    assert mm2 is not None
+    mm2.is_output = True
+
+    strategy.apply(graph)
+
+    # The biased sum has two consumers, so only the add is absorbed.
+    biased = graph.get_node("biased")
+    assert biased is not None and biased.op == OpType.LINEAR.value
+    assert graph.get_node("mm") is None
+    assert graph.get_node("act") is not None
+    assert mm2.op == OpType.MATMUL.value
@@ -0,0 +1,317 @@
+from math import prod
+from typing import Any
+
+import pytest
+
+from xla_lite.backends import (
+    BACKEND_ENV_VAR,
+    Backend,
+    PythonBackend,
+    available_backends,
+    get_backend,
+    register_backend,
+)
+from xla_lite.core import (
+    CSRTensor,
+    DType,
+    Graph,
+    Node,
+    OpType,
+    QuantizedTensor,
+    Tensor,
+)
+from xla_lite.execution import Executor
+from xla_lite.optimizers import ConstantFolding
+
+
+def _graph(op: OpType, a: Tensor, b: Tensor) -> Graph:
+    graph = Graph()
+    graph.add_node(Node("a", tensor=a, op=OpType.CONST.value))
+    graph.add_node(Node("b", tensor=b, op=OpType.CONST.value))
+    graph.add_node(Node("c", op=op.value, inputs=["a", "b"]))
+    return graph
+
+
+def test_registry_defaults_to_python(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(BACKEND_ENV_VAR, raising=False)
+
+    assert {"python", "numpy"} <= set(available_backends())
+    backend = get_backend()
+    assert isinstance(backend, PythonBackend)
+    assert get_backend("python") is backend
+    assert get_backend(backend) is backend
+    assert all(backend.supports(op) for op in OpType if op != OpType.CONST)
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unknown backend 'missing'"):
+        get_backend("missing")
+
+
+def test_environment_selects_backend(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Recording(Backend):
+        name = "recording"
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[OpType] = []
+            self.register(OpType.ADD, self.add)
+
+        def add(self, a: Tensor, b: Tensor) -> Tensor:
+            self.calls.append(OpType.ADD)
+            return Tensor(0)
+
+    register_backend("recording", Recording)
+    monkeypatch.setenv(BACKEND_ENV_VAR, "recording")
+
+    executor = Executor(_graph(OpType.ADD, Tensor(1), Tensor(2)))
+    results = executor.execute()
+
+    assert isinstance(executor.backend, Recording)
+    assert executor.backend.calls == [OpType.ADD]
+    assert results["c"].data == 0
+    with pytest.raises(ValueError, match="Unsupported operation: matmul"):
+        executor.exec_op(OpType.MATMUL.value, [Tensor(1), Tensor(2)])
+
+
+def test_constant_folding_uses_backend() -> None:
+    backend = Backend()
+    backend.register(OpType.MULTIPLY, lambda a, b: Tensor(42))
+    graph = _graph(OpType.MULTIPLY, Tensor(2), Tensor(3))
+
+    ConstantFolding(backend).apply(graph)
+
+    node = graph.get_node("c")
+    assert node is not None and node.tensor is not None
+    assert node.tensor.data == 42
+
+
+BINARY_OPS = [
+    OpType.ADD,
+    OpType.SUBTRACT,
+    OpType.MULTIPLY,
+    OpType.DIVIDE,
+    OpType.MATMUL,
+]
+
+
+@pytest.mark.parametrize("op", BINARY_OPS)
+def test_numpy_backend_matches_python(op: OpType) -> None:
+    pytest.importorskip("numpy")
+    cases = [
+        (Tensor([[1, 2], [3, 4]]), Tensor([[5, 0], [7, 8]])),
+        (Tensor([[1.5, 2.0]], dtype="float32"), Tensor([[2], [0]])),
+        (Tensor([[True, False]]), Tensor([[True], [True]])),
+        (Tensor([[1, 2], [3, 4]]).T, Tensor([[1, 2], [3, 4]])),
+    ]
+    if op != OpType.MATMUL:
+        cases = [(a, b.reshape(*a.shape)) for a, b in cases] + [
+            (Tensor([[1, 2], [3, 4]]), Tensor(2)),
+            (Tensor(3), Tensor(0)),
+        ]
+
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    for a, b in cases:
+        expected = python_backend.execute(op, [a, b])
+        result = numpy_backend.execute(op, [a, b])
+        assert result.shape == expected.shape
+        assert result.dtype is expected.dtype
+        assert result._values() == pytest.approx(expected._values())
+
+
+@pytest.mark.parametrize(
+    "op",
+    [OpType.EXP, OpType.RELU, OpType.NEGATIVE],
+)
+def test_numpy_backend_matches_python_unary(op: OpType) -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    for a in [
+        Tensor([[1, -2], [3, 0]]),
+        Tensor([[1.5, -2.0]], dtype="float32").T,
+        Tensor([[True, False]]),
+        Tensor(-3),
+    ]:
+        expected = python_backend.execute(op, [a])
+        result = numpy_backend.execute(op, [a])
+        assert result.shape == expected.shape
+        assert result.dtype is expected.dtype
+        assert result._values() == pytest.approx(expected._values())
+
+
+@pytest.mark.parametrize("op", [OpType.SUM, OpType.MEAN, OpType.MAX])
+@pytest.mark.parametrize(
+    "attrs",
+    [{}, {"axis": 0}, {"axis": -1, "keepdims": True}, {"keepdims": True}],
+)
+def test_numpy_backend_matches_python_reductions(
+    op: OpType, attrs: dict
+) -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    for a in [
+        Tensor([[1, -2, 5], [3, 0, 4]]),
+        Tensor([[1.5, -2.0], [0.5, 4.0]], dtype="float32").T,
+        Tensor([[True, False], [True, True]]),
+        Tensor.from_flat(range(24), (2, 3, 4)),
+    ]:
+        expected = python_backend.execute(op, [a], attrs=attrs)
+        result = numpy_backend.execute(op, [a], attrs=attrs)
+        assert result.shape == expected.shape
+        assert result.dtype is expected.dtype
+        assert result._values() == pytest.approx(expected._values())
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("attrs", [{}, {"axis": 0}, {"axis": 1}])
+def test_numpy_backend_mean_of_empty_tensor(attrs: dict) -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    empty = Tensor.from_flat([], (0, 3), "float32")
+    expected = python_backend.execute(OpType.MEAN, [empty], attrs=attrs)
+    result = numpy_backend.execute(OpType.MEAN, [empty], attrs=attrs)
+    assert result.shape == expected.shape
+    assert result.dtype is expected.dtype
+    assert result._values() == pytest.approx(expected._values(), nan_ok=True)
+
+
+@pytest.mark.parametrize("activation", [None, "relu", "exp", "negative"])
+def test_numpy_backend_linear_matches_python(activation: str | None) -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    attrs = {} if activation is None else {"activation": activation}
+    weights = Tensor([[0.5, -1.0], [2.0, 0.0]])
+    for inputs in [
+        [Tensor([[1, 2], [3, 4]]), Tensor([[1, 0], [0, 1]])],
+        [Tensor([[1.0, -2.0]]), weights, Tensor([[0.5, -1.0]])],
+        [Tensor.from_flat(range(8), (2, 2, 2)), weights, Tensor(1)],
+        [Tensor([[True, False]]), weights.T, Tensor([[True, True]])],
+    ]:
+        expected = python_backend.execute(OpType.LINEAR, inputs, attrs=attrs)
+        result = numpy_backend.execute(OpType.LINEAR, inputs, attrs=attrs)
+        assert result.shape == expected.shape
+        assert result.dtype is expected.dtype
+        assert result._values() == pytest.approx(expected._values())
+
+
+def test_numpy_backend_linear_with_packed_weights() -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    x = Tensor([[1.0, -2.0, 0.5], [3.0, 0.0, -1.5]])
+    weights = Tensor([[0.5, 0.0], [0.0, -1.0], [2.0, 0.0]])
+    bias = Tensor([[0.25, -0.5]])
+    for weight in [
+        QuantizedTensor.quantize(weights, axis=1),
+        CSRTensor.from_dense(weights),
+    ]:
+        inputs = [x, weight, bias]
+        attrs = {"activation": "relu"}
+        expected = python_backend.execute(OpType.LINEAR, inputs, attrs=attrs)
+        result = numpy_backend.execute(OpType.LINEAR, inputs, attrs=attrs)
+        assert type(result) is type(expected)
+        assert result.dtype is expected.dtype
+        assert result._values() == pytest.approx(expected._values())
+
+
+@pytest.mark.parametrize(
+    "equation, shapes",
+    [
+        ("ij,jk->ik", [(2, 3), (3, 4)]),
+        ("ij,jk,kl->il", [(2, 5), (5, 3), (3, 4)]),
+        ("bij,bjk->bik", [(2, 2, 3), (2, 3, 2)]),
+        ("ii->i", [(3, 3)]),
+        ("ij->", [(2, 3)]),
+    ],
+)
+def test_numpy_backend_einsum_matches_python(
+    equation: str, shapes: list[tuple[int, ...]]
+) -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    inputs = [
+        Tensor.from_flat([(i * 5) % 7 - 3 for i in range(prod(shape))], shape)
+        for shape in shapes
+    ]
+    attrs = {"equation": equation}
+    expected = python_backend.execute(OpType.EINSUM, inputs, attrs=attrs)
+    result = numpy_backend.execute(OpType.EINSUM, inputs, attrs=attrs)
+    assert result == expected
+
+
+def test_numpy_backend_conv2d_matches_python() -> None:
+    pytest.importorskip("numpy")
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    x = Tensor.from_flat([(i * 7) % 13 - 6 for i in range(90)], (2, 3, 5, 3))
+    w = Tensor.from_flat([(i * 5) % 11 - 5 for i in range(24)], (2, 3, 2, 2))
+    cases: list[tuple[list[Tensor], dict[str, Any]]] = [
+        ([x, w], {}),
+        ([x, w, Tensor([0.5, -1.0])], {"stride": 2, "padding": (1, 0)}),
+        ([x[1], w, Tensor([1, 2])], {"padding": 1}),
+    ]
+    for inputs, attrs in cases:
+        expected = python_backend.execute(OpType.CONV2D, inputs, attrs=attrs)
+        result = numpy_backend.execute(OpType.CONV2D, inputs, attrs=attrs)
+        assert result == expected
+
+    with pytest.raises(ValueError, match="channels"):
+        numpy_backend.execute(OpType.CONV2D, [x, w.transpose(1, 0, 2, 3)])
+
+
+def test_numpy_backend_sparse_and_errors() -> None:
+    pytest.importorskip("numpy")
+    backend = get_backend("numpy")
+    sparse = CSRTensor.from_dense(Tensor([[1, 0], [0, 2]]))
+
+    product = backend.execute(OpType.MATMUL, [sparse, sparse])
+    assert isinstance(product, CSRTensor)
+    assert product.data == [[1, 0], [0, 4]]
+    assert backend.execute(OpType.ADD, [sparse, Tensor(1)]).dtype is (
+        DType.INT64
+    )
+
+    with pytest.raises(ValueError, match="Number of columns"):
+        backend.execute(
+            OpType.MATMUL, [Tensor([[1, 2, 3]]), Tensor([[1, 2, 3]])]
+        )
+    with pytest.raises(ValueError, match="same dimensions"):
+        backend.execute(
+            OpType.ADD, [Tensor([[1, 2], [3, 4]]), Tensor([[1, 2, 3]])]
+        )
+
+
+def test_numpy_backend_writes_into_out() -> None:
+    pytest.importorskip("numpy")
+    backend = get_backend("numpy")
+    a = Tensor([[1, 2], [3, 4]])
+    out = Tensor.from_flat([0.0] * 4, (2, 2))
+    buffer = out.buffer
+
+    assert backend.execute(OpType.ADD, [a, Tensor(1)], out) is out
+    assert out.data == [[2.0, 3.0], [4.0, 5.0]]
+    backend.execute(OpType.DIVIDE, [a, Tensor([[0, 2]])], out)
+    assert out.data == [[float("inf"), 1.0], [float("inf"), 2.0]]
+    backend.execute(OpType.MATMUL, [a, a], out)
+    assert out.data == [[7.0, 10.0], [15.0, 22.0]]
+    assert out.buffer is buffer
+
+    with pytest.raises(TypeError, match="Cannot store"):
+        backend.execute(OpType.DIVIDE, [a, a], Tensor([[0, 0], [0, 0]]))
+
+
+def test_numpy_backend_batched_matmul() -> None:
+    pytest.importorskip("numpy")
+    batch = Tensor.from_flat(range(12), (3, 2, 2))
+    weights = Tensor([[1.5, 2.0], [3.0, 4.0]])
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+
+    for a, b in [(batch, weights), (weights, batch), (batch, batch)]:
+        expected = python_backend.execute(OpType.MATMUL, [a, b])
+        assert numpy_backend.execute(OpType.MATMUL, [a, b]) == expected
+
+    out = Tensor.from_flat([0.0] * 12, (3, 2, 2))
+    numpy_backend.execute(OpType.MATMUL, [batch, weights], out)
+    assert out == python_backend.execute(OpType.MATMUL, [batch, weights])
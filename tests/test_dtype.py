@@ -0,0 +1,64 @@
+import pytest
+
+from xla_lite.core import DType
+from xla_lite.core.dtype import (
+    arithmetic_type,
+    division_type,
+    promote_types,
+)
+
+
+def test_dtype_storage() -> None:
+    assert DType.of("float32") is DType.FLOAT32
+    assert DType.FLOAT32.itemsize == 4
+    assert DType.INT8.itemsize == 1
+    assert DType.from_typecode("d") is DType.FLOAT64
+    assert DType.from_typecode("<i") is DType.INT32
+    with pytest.raises(TypeError, match="Unsupported buffer format"):
+        DType.from_typecode("Z")
+
+
+def test_dtype_infer() -> None:
+    assert DType.infer([1, 2]) is DType.INT64
+    assert DType.infer([1, 2.5]) is DType.FLOAT64
+    assert DType.infer([True, False]) is DType.BOOL
+    assert DType.infer([]) is DType.INT64
+
+
+def test_dtype_pack_casts_and_wraps() -> None:
+    assert DType.INT32.pack([1.9, -2.7]).tolist() == [1, -2]
+    assert DType.INT8.pack([127, 128, -129], wrap=True).tolist() == [
+        127,
+        -128,
+        127,
+    ]
+    with pytest.raises(OverflowError, match="Integer 128 is out of range"):
+        DType.INT8.pack([127, 128, -129])
+    assert DType.BOOL.unpack(DType.BOOL.pack([0, 2, 0.0])) == [
+        False,
+        True,
+        False,
+    ]
+    assert DType.FLOAT32.pack([0.1])[0] != 0.1
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (DType.INT8, DType.INT32, DType.INT32),
+        (DType.BOOL, DType.INT8, DType.INT8),
+        (DType.INT8, DType.FLOAT32, DType.FLOAT32),
+        (DType.INT32, DType.FLOAT32, DType.FLOAT64),
+        (DType.FLOAT32, DType.FLOAT64, DType.FLOAT64),
+        (DType.FLOAT32, DType.FLOAT32, DType.FLOAT32),
+    ],
+)
+def test_promote_types(a: DType, b: DType, expected: DType) -> None:
+    assert promote_types(a, b) is expected
+    assert promote_types(b, a) is expected
+
+
+def test_arithmetic_and_division_types() -> None:
+    assert arithmetic_type(DType.BOOL, DType.BOOL) is DType.INT64
+    assert division_type(DType.INT32, DType.INT8) is DType.FLOAT64
+    assert division_type(DType.FLOAT32, DType.INT8) is DType.FLOAT32
@@ -0,0 +1,149 @@
+import pytest
+
+from xla_lite.core import DType, Tensor
+from xla_lite.core.einsum import contraction_plan, parse_equation
+from xla_lite.core.ops import (
+    add,
+    add_,
+    einsum,
+    matmul,
+    multiply,
+    reduce_sum,
+)
+from xla_lite.execution import Executor
+from xla_lite.frontend import EinsumNode, GraphBuilder
+
+
+def _tensor(*shape: int) -> Tensor:
+    size = 1
+    for dim in shape:
+        size *= dim
+    return Tensor.from_flat([(i * 7) % 11 - 5 for i in range(size)], shape)
+
+
+def test_parse_equation() -> None:
+    assert parse_equation("ij,jk->ik", (2, 2)) == (("ij", "jk"), "ik")
+    assert parse_equation("ji, kj", (2, 2)) == (("ji", "kj"), "ik")
+    assert parse_equation("ii", (2,)) == (("ii",), "")
+
+    with pytest.raises(ValueError, match="operands"):
+        parse_equation("ij,jk->ik", (2,))
+    with pytest.raises(ValueError, match="dimensions"):
+        parse_equation("ijk->i", (2,))
+    with pytest.raises(ValueError, match="ellipses"):
+        parse_equation("...i->i", (2,))
+    with pytest.raises(ValueError, match="unique"):
+        parse_equation("ij->ii", (2,))
+
+
+def test_einsum_matches_existing_kernels() -> None:
+    a, b, c = _tensor(3, 4), _tensor(4, 5), _tensor(5, 2)
+
+    assert einsum("ij,jk->ik", a, b) == matmul(a, b)
+    assert einsum("ij,jk,kl->il", a, b, c) == matmul(matmul(a, b), c)
+    assert einsum("ij->ji", a) == Tensor(a.T.data)
+    assert einsum("ij->", a).data == reduce_sum(a).data
+    assert einsum("ij,ij->ij", a, a) == multiply(a, a)
+    assert einsum("ij,ij->", a, a).data == reduce_sum(multiply(a, a)).data
+
+    batch = _tensor(2, 3, 4)
+    assert einsum("bij,jk->bik", batch, b) == matmul(batch, b)
+    assert einsum("bij,bjk->bik", batch, _tensor(2, 4, 5)) == matmul(
+        batch, _tensor(2, 4, 5)
+    )
+
+
+def test_einsum_diagonals_outer_products_and_dtypes() -> None:
+    square = Tensor([[1, 2], [3, 4]])
+    assert einsum("ii->i", square).data == [1, 4]
+    assert einsum("ii", square).data == 5
+    assert einsum("ij,kl->ijkl", square, square).shape == (2, 2, 2, 2)
+
+    flags = Tensor([[True, False], [True, True]])
+    assert einsum("ij->ji", flags).dtype is DType.INT64
+    halves = Tensor([[0.5, 1.5]])
+    assert einsum("ij,jk->ik", square, halves.T).dtype is DType.FLOAT64
+
+    out = Tensor.from_flat([0.0] * 4, (2, 2))
+    assert einsum("ij->ji", square, out=out) is out
+    assert out.data == [[1.0, 3.0], [2.0, 4.0]]
+    assert square.data == [[1, 2], [3, 4]]
+
+    with pytest.raises(ValueError, match="sizes"):
+        einsum("ij,jk->ik", square, _tensor(3, 2))
+    with pytest.raises(ValueError, match="at least one"):
+        einsum("->")
+
+
+def test_contraction_order_avoids_large_intermediates() -> None:
+    shapes = ((2, 30), (30, 3), (3, 40))
+    plan = contraction_plan("ij,jk,kl->il", shapes, "optimal")
+    assert plan.path == ((0, 1), (0, 1))
+    assert plan.cost == 2 * 30 * 3 + 2 * 3 * 40
+
+    # Contracting the last pair first costs far more.
+    plan = contraction_plan("ij,jk,kl->il", ((40, 3), (3, 30), (30, 2)))
+    assert plan.path == ((1, 2), (0, 1))
+
+    greedy = contraction_plan("ij,jk,kl->il", shapes, "greedy")
+    assert greedy.cost == plan.cost
+
+    chain = ",".join(a + b for a, b in zip("abcdefgh", "bcdefghi"))
+    sizes = tuple((2 + i, 3 + i) for i in range(8))
+    plan = contraction_plan(f"{chain}->ai", sizes, "greedy")
+    assert len(plan.path) == 7
+    tensors = [_tensor(*shape) for shape in sizes]
+    expected = tensors[0]
+    for tensor in tensors[1:]:
+        expected = matmul(expected, tensor)
+    assert einsum(f"{chain}->ai", *tensors) == expected
+
+    with pytest.raises(ValueError, match="strategy"):
+        contraction_plan("ij->ij", ((2, 2),), "fastest")  # type: ignore
+
+
+def test_contraction_plans_are_cached() -> None:
+    contraction_plan.cache_clear()
+    a, b = _tensor(3, 4), _tensor(4, 5)
+    einsum("ij,jk->ik", a, b)
+    einsum("ij,jk->ik", add(a, a), b)
+    einsum("ij,jk->ik", b.T, a.T)
+
+    info = contraction_plan.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_builder_einsum() -> None:
+    builder = GraphBuilder()
+    a = builder.constant(_tensor(2, 3))
+    b = builder.constant(_tensor(3, 4))
+    node = builder.einsum("ij,jk->ik", a, b)
+    assert isinstance(node, EinsumNode)
+
+    graph = builder.build()
+    built = graph.get_node(node.node_id)
+    assert built is not None
+    assert built.inputs == [a.node_id, b.node_id]
+    assert built.attrs == {"equation": "ij,jk->ik", "strategy": "auto"}
+
+    results = Executor(graph).execute()
+    assert results[node.node_id] == matmul(_tensor(2, 3), _tensor(3, 4))
+
+
+def test_identity_einsum_returns_a_new_tensor() -> None:
+    a = _tensor(2, 3)
+    for equation in ["ij->ij", "ij", "ji->ij"]:
+        result = einsum(equation, a)
+        assert result is not a
+        add_(result, Tensor(1))
+    assert a == _tensor(2, 3)
+
+    builder = GraphBuilder()
+    constant = builder.constant(_tensor(2, 3))
+    node = builder.einsum("ij->ij", constant)
+    executor = Executor(builder.build(), reuse_buffers=True)
+    for _ in range(2):
+        results = executor.execute()
+        assert results[node.node_id] is not results[constant.node_id]
+        add_(results[node.node_id], Tensor(1))
+    assert results[constant.node_id] == _tensor(2, 3)
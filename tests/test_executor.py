@@ -1,6 +1,7 @@
 import pytest
 
 from xla_lite.core import Graph, Node, OpType, Tensor
+from xla_lite.core.ops import MatrixMultiply
 from xla_lite.execution import Executor
 
 
@@ -243,3 +244,78 @@ def test_executor_graph_with_cycles() -> None:
 
     with pytest.raises(ValueError, match="Graph has cycles."):
         executor.execute()
+
+
+def test_executor_reuses_result_buffers() -> None:
+    graph = Graph()
+    weights = Tensor([[1, 2], [3, 4]])
+    graph.add_node(Node(node_id="w", tensor=weights))
+    graph.add_node(Node(node_id="x", tensor=Tensor([[1, 0], [0, 1]])))
+    graph.add_node(
+        Node(node_id="y", op=OpType.MATMUL.value, inputs=["w", "x"])
+    )
+    graph.add_node(Node(node_id="z", op=OpType.ADD.value, inputs=["y", "y"]))
+
+    executor = Executor(graph, reuse_buffers=True)
+    first = dict(executor.execute())
+    weights[0, 0] = 5
+    second = executor.execute()
+
+    assert second["y"] is first["y"]
+    assert second["z"] is first["z"]
+    assert second["z"].data == [[10, 4], [6, 8]]
+
+
+def test_executor_reuses_buffers_read_through_views() -> None:
+    graph = Graph()
+    inputs = Tensor([[1.0, -2.0], [3.0, 4.0]])
+    graph.add_node(Node(node_id="x", tensor=inputs))
+    graph.add_node(Node(node_id="r", op=OpType.RELU.value, inputs=["x"]))
+    graph.add_node(
+        Node(
+            node_id="s",
+            op=OpType.SUM.value,
+            inputs=["r"],
+            attrs={"axis": 0},
+        )
+    )
+
+    executor = Executor(graph, reuse_buffers=True)
+    first = executor.execute()
+    buffers = {key: first[key].buffer for key in ("r", "s")}
+    inputs[0, 1] = 2.0
+    second = executor.execute()
+
+    # The reduction reads ``r`` through a transposed view, which must
+    # not make the next run copy ``r`` before writing to it.
+    assert all(second[key].buffer is buffers[key] for key in buffers)
+    assert second["s"].data == [4.0, 6.0]
+
+
+def test_executor_writes_into_preallocated_outputs() -> None:
+    graph = Graph()
+    graph.add_node(Node(node_id="a", tensor=Tensor([[1, 2]])))
+    graph.add_node(Node(node_id="b", tensor=Tensor([[3, 4]])))
+    graph.add_node(Node(node_id="c", op=OpType.ADD.value, inputs=["a", "b"]))
+
+    out = Tensor([[0.0, 0.0]])
+    results = Executor(graph).execute(out={"c": out})
+
+    assert results["c"] is out
+    assert out.data == [[4.0, 6.0]]
+
+
+def test_executor_workers_select_parallel_matmul() -> None:
+    graph = Graph()
+    graph.add_node(Node(node_id="a", tensor=Tensor([[1, 2], [3, 4]])))
+    graph.add_node(
+        Node(node_id="b", op=OpType.MATMUL.value, inputs=["a", "a"])
+    )
+
+    executor = Executor(graph, workers=2)
+    kernel = executor.backend.kernel(OpType.MATMUL)
+
+    assert isinstance(kernel, MatrixMultiply)
+    assert kernel.workers == 2
+    assert executor.execute()["b"].data == [[7, 10], [15, 22]]
+    assert Executor(graph).backend.kernel(OpType.MATMUL) is not kernel
@@ -1,6 +1,10 @@
+import subprocess
+import sys
+
 import pytest
 
 from xla_lite.core.graph import Graph, Node, OpType, Tensor
+from xla_lite.frontend import GraphBuilder
 
 
 def test_add_node_success() -> None:
@@ -15,6 +19,16 @@ def test_add_node_success() -> None:
     assert node_a.tensor.data == [[1, 2, 3]]
 
 
+def test_nodes_returns_a_copy() -> None:
+    graph = Graph()
+    graph.add_node(Node(node_id="A", tensor=Tensor(1)))
+    graph.nodes.append(Node(node_id="B", tensor=Tensor(2)))
+    graph.nodes.clear()
+
+    assert [node.node_id for node in graph.nodes] == ["A"]
+    assert [node.node_id for node in graph.topological_sort()] == ["A"]
+
+
 def test_add_duplicate_node_raises_error() -> None:
     graph = Graph()
     tensor_a = Tensor(5)
@@ -48,3 +62,214 @@ def test_graph_nodes_order() -> None:
     graph.add_node(node_c)
     exec_order = graph.topological_sort()
     assert exec_order == [node_a, node_b, node_c]
+
+
+def test_topological_sort_handles_deep_graphs() -> None:
+    graph = Graph()
+    graph.add_node(Node("n0", op=OpType.CONST.value, tensor=Tensor(1)))
+    for i in range(1, 20000):
+        graph.add_node(
+            Node(f"n{i}", op=OpType.NEGATIVE.value, inputs=[f"n{i - 1}"])
+        )
+    # Insert the chain in reverse so every node waits on a long path.
+    reversed_graph = Graph()
+    for node in reversed(graph.nodes):
+        reversed_graph.add_node(node)
+
+    order = reversed_graph.topological_sort()
+    assert [node.node_id for node in order] == [f"n{i}" for i in range(20000)]
+
+
+def test_topological_sort_is_cached_until_the_graph_changes() -> None:
+    graph = Graph()
+    graph.add_node(Node("C", op=OpType.ADD.value, inputs=["A", "B"]))
+    graph.add_node(Node("B", op=OpType.CONST.value, tensor=Tensor(2)))
+    graph.add_node(Node("A", op=OpType.CONST.value, tensor=Tensor(1)))
+
+    order = graph.topological_sort()
+    assert [node.node_id for node in order] == ["A", "B", "C"]
+    order.clear()
+    assert graph.topological_sort() == graph.topological_sort()
+    assert len(graph.topological_sort()) == 3
+
+    graph.add_node(Node("D", op=OpType.NEGATIVE.value, inputs=["C"]))
+    assert graph.topological_sort()[-1].node_id == "D"
+
+    graph.get_node("C").inputs.reverse()  # type: ignore[union-attr]
+    assert graph.topological_sort()[0].node_id == "A"
+    graph.invalidate()
+    assert graph.topological_sort()[0].node_id == "B"
+
+
+def test_topological_sort_detects_cycles() -> None:
+    graph = Graph()
+    graph.add_node(Node("A", op=OpType.NEGATIVE.value, inputs=["C"]))
+    graph.add_node(Node("B", op=OpType.NEGATIVE.value, inputs=["A"]))
+    graph.add_node(Node("C", op=OpType.NEGATIVE.value, inputs=["B"]))
+    with pytest.raises(ValueError, match="Graph has cycles."):
+        graph.topological_sort()
+
+
+def _diamond() -> Graph:
+    graph = Graph()
+    graph.add_node(Node("A", op=OpType.CONST.value, tensor=Tensor(1)))
+    graph.add_node(Node("B", op=OpType.NEGATIVE.value, inputs=["A"]))
+    graph.add_node(Node("C", op=OpType.EXP.value, inputs=["A"]))
+    graph.add_node(Node("D", op=OpType.ADD.value, inputs=["B", "C"]))
+    return graph
+
+
+def test_users() -> None:
+    graph = _diamond()
+    assert [node.node_id for node in graph.users("A")] == ["B", "C"]
+    assert [node.node_id for node in graph.users("B")] == ["D"]
+    assert graph.users("D") == []
+
+    graph.add_node(Node("E", op=OpType.MULTIPLY.value, inputs=["A", "A"]))
+    assert [node.node_id for node in graph.users("A")] == ["B", "C", "E"]
+
+    graph.set_inputs("E", ["B", "B"])
+    assert [node.node_id for node in graph.users("A")] == ["B", "C"]
+    assert [node.node_id for node in graph.users("B")] == ["D", "E"]
+
+
+def test_replace_all_uses_with() -> None:
+    graph = _diamond()
+    graph.add_node(Node("E", op=OpType.MULTIPLY.value, inputs=["B", "B"]))
+    graph.topological_sort()
+
+    graph.replace_all_uses_with("B", "C")
+
+    assert graph.get_node("D").inputs == ["C", "C"]  # type: ignore[union-attr]
+    assert graph.get_node("E").inputs == ["C", "C"]  # type: ignore[union-attr]
+    assert graph.users("B") == []
+    assert [node.node_id for node in graph.users("C")] == ["D", "E"]
+    with pytest.raises(ValueError, match="'X' does not exist"):
+        graph.replace_all_uses_with("B", "X")
+
+
+def test_remove_node() -> None:
+    graph = _diamond()
+    with pytest.raises(ValueError, match="still used by \\['D'\\]"):
+        graph.remove_node("B")
+
+    graph.set_inputs("D", ["C", "C"])
+    graph.remove_node("B")
+
+    assert graph.get_node("B") is None
+    assert [node.node_id for node in graph.nodes] == ["A", "C", "D"]
+    assert [node.node_id for node in graph.users("A")] == ["C"]
+    assert [node.node_id for node in graph.topological_sort()] == [
+        "A",
+        "C",
+        "D",
+    ]
+    # The id can be reused once the node is gone.
+    graph.add_node(Node("B", op=OpType.RELU.value, inputs=["D"]))
+    assert [node.node_id for node in graph.users("D")] == ["B"]
+
+
+def test_direct_edits_require_invalidate() -> None:
+    graph = _diamond()
+    assert [node.node_id for node in graph.users("C")] == ["D"]
+
+    graph.get_node("D").inputs = ["B", "B"]  # type: ignore[union-attr]
+    graph.invalidate()
+
+    assert graph.users("C") == []
+
+
+def test_compact_storage() -> None:
+    graph = _diamond()
+    node = graph.get_node("A")
+    assert node is not None
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.label = "a"  # type: ignore[attr-defined]
+
+    graph.set_inputs("D", ["C", "C"])
+    graph.remove_node("B")
+    assert dict(graph.node_map) == {
+        "A": graph.get_node("A"),
+        "C": graph.get_node("C"),
+        "D": graph.get_node("D"),
+    }
+    assert "B" not in graph.node_map
+    with pytest.raises(KeyError):
+        graph.node_map["B"]
+    with pytest.raises(TypeError):
+        graph.node_map["B"] = node  # type: ignore[index]
+
+
+def test_topological_sort_follows_inputs_added_later() -> None:
+    graph = Graph()
+    graph.add_node(Node("B", op=OpType.NEGATIVE.value, inputs=["A"]))
+    graph.add_node(Node("C", op=OpType.ADD.value, inputs=["B", "A"]))
+    assert [node.node_id for node in graph.users("A")] == []
+    graph.add_node(Node("A", op=OpType.CONST.value, tensor=Tensor(1)))
+
+    assert [node.node_id for node in graph.users("A")] == ["B", "C"]
+    assert [node.node_id for node in graph.topological_sort()] == [
+        "A",
+        "B",
+        "C",
+    ]
+
+
+def _layer(scale: float = 0.5, activation: str = "relu") -> Graph:
+    builder = GraphBuilder()
+    x = builder.constant(Tensor([[1.0, -2.0], [3.0, 4.0]]))
+    w = builder.constant(Tensor([[scale, 0.0], [0.0, scale]]))
+    y = builder.linear(x, w, activation=activation)
+    builder.reduce_sum(y, axis=1)
+    return builder.build()
+
+
+def test_fingerprint_ignores_node_ids() -> None:
+    graph = _layer()
+    fingerprint = graph.fingerprint()
+    assert fingerprint == graph.fingerprint()
+    assert _layer().fingerprint() == fingerprint
+    assert [node.node_id for node in _layer().nodes] != [
+        node.node_id for node in graph.nodes
+    ]
+
+    reordered = Graph()
+    for node in reversed(graph.nodes):
+        reordered.add_node(node)
+    assert reordered.fingerprint() == fingerprint
+    assert Graph.from_bytes(graph.to_bytes()).fingerprint() == fingerprint
+
+    script = (
+        "from tests.test_graph import _layer; "
+        + "print(_layer().fingerprint())"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert output.stdout.strip() == fingerprint
+
+
+def test_fingerprint_reflects_structure() -> None:
+    fingerprint = _layer().fingerprint()
+    assert _layer(scale=0.25).fingerprint() != fingerprint
+    assert _layer(activation="exp").fingerprint() != fingerprint
+
+    graph = _layer()
+    graph.nodes[-1].is_output = True
+    assert graph.fingerprint() != fingerprint
+    graph.nodes[-1].is_output = False
+    graph.nodes[-1].attrs["axis"] = 0
+    assert graph.fingerprint() != fingerprint
+
+    # D reads one negation twice, or two equal negations once each.
+    shared, duplicated = _diamond(), _diamond()
+    for diamond in (shared, duplicated):
+        node = diamond.get_node("C")
+        assert node is not None
+        node.op = OpType.NEGATIVE.value
+    shared.set_inputs("D", ["B", "B"])
+    assert shared.fingerprint() != duplicated.fingerprint()
@@ -3,7 +3,15 @@ from unittest.mock import Mock, patch
 import pytest
 
 from xla_lite.core import Graph, Node, OpType, Tensor
-from xla_lite.frontend import BinOpNode, ConstantNode, GraphBuilder
+from xla_lite.execution import Executor
+from xla_lite.frontend import (
+    BinOpNode,
+    ConstantNode,
+    Conv2DNode,
+    GraphBuilder,
+    LinearNode,
+    UnaryOpNode,
+)
 
 
 @pytest.fixture
@@ -17,6 +25,15 @@ def test_constant(graph_builder: GraphBuilder) -> None:
     assert constant_node.value.data == 5
 
 
+def test_constant_from_tensor(graph_builder: GraphBuilder) -> None:
+    weights = Tensor([[1, 2]], dtype="int8")
+    constant_node = graph_builder.constant(weights)
+    assert constant_node.value is weights
+
+    typed = graph_builder.constant([1.5, 2.5], dtype="float32")
+    assert typed.value.dtype.value == "float32"
+
+
 def test_add(graph_builder: GraphBuilder) -> None:
     a = Mock(node_id="a")
     b = Mock(node_id="b")
@@ -67,6 +84,74 @@ def test_matmul(graph_builder: GraphBuilder) -> None:
     assert matmul_node.right == "b"
 
 
+def test_batch_matmul(graph_builder: GraphBuilder) -> None:
+    batch = graph_builder.constant(Tensor.from_flat(range(8), (2, 2, 2)))
+    weights = graph_builder.constant([[1, 0], [0, 2]])
+    node = graph_builder.batch_matmul(batch, weights)
+    assert node.op == OpType.MATMUL
+
+    results = Executor(graph_builder.build()).execute()
+    assert results[node.node_id].data == [
+        [[0, 2], [2, 6]],
+        [[4, 10], [6, 14]],
+    ]
+
+
+def test_unary_and_reduction_ops(graph_builder: GraphBuilder) -> None:
+    a = graph_builder.constant([[1.0, -2.0], [-3.0, 4.0]])
+    activated = graph_builder.relu(graph_builder.negative(a))
+    total = graph_builder.reduce_sum(activated, axis=0, keepdims=True)
+    largest = graph_builder.reduce_max(a)
+    assert isinstance(total, UnaryOpNode)
+    assert total.attrs == {"axis": 0, "keepdims": True}
+
+    graph = graph_builder.build()
+    node = graph.get_node(total.node_id)
+    assert node is not None and node.attrs == {"axis": 0, "keepdims": True}
+
+    results = Executor(graph).execute()
+    assert results[total.node_id].data == [[3.0, 2.0]]
+    assert results[largest.node_id].data == 4.0
+
+
+def test_linear(graph_builder: GraphBuilder) -> None:
+    x = graph_builder.constant([[1.0, -2.0], [3.0, 4.0]])
+    w = graph_builder.constant([[1.0, 0.5], [-1.0, 2.0]])
+    b = graph_builder.constant([[0.5, -9.0]])
+    layer = graph_builder.linear(x, w, b, activation=OpType.RELU)
+    plain = graph_builder.linear(x, w)
+    assert isinstance(layer, LinearNode)
+
+    graph = graph_builder.build()
+    node = graph.get_node(layer.node_id)
+    assert node is not None
+    assert node.inputs == [x.node_id, w.node_id, b.node_id]
+    assert node.attrs == {"activation": "relu"}
+
+    results = Executor(graph).execute()
+    assert results[layer.node_id].data == [[3.5, 0.0], [0.0, 0.5]]
+    assert results[plain.node_id].data == [[3.0, -3.5], [-1.0, 9.5]]
+
+    with pytest.raises(ValueError, match="Unsupported activation"):
+        graph_builder.linear(x, w, activation="matmul")
+
+
+def test_conv2d(graph_builder: GraphBuilder) -> None:
+    image = graph_builder.constant(Tensor.from_flat(range(16), (1, 1, 4, 4)))
+    kernel = graph_builder.constant(Tensor([[[[1, 0], [0, -1]]]]))
+    node = graph_builder.conv2d(image, kernel, stride=2)
+    assert isinstance(node, Conv2DNode)
+
+    graph = graph_builder.build()
+    built = graph.get_node(node.node_id)
+    assert built is not None
+    assert built.inputs == [image.node_id, kernel.node_id]
+    assert built.attrs == {"stride": 2, "padding": 0}
+    assert Executor(graph).execute()[node.node_id].data == [
+        [[[-5, -5], [-5, -5]]]
+    ]
+
+
 def test_build(graph_builder: GraphBuilder) -> None:
     with patch("xla_lite.frontend.builder.Graph") as MockGraph:
         mock_graph = MockGraph.return_value
@@ -0,0 +1,62 @@
+import sys
+from array import array
+
+import pytest
+
+from xla_lite.core import DType, Tensor
+
+
+def test_from_buffer_wraps_without_copy() -> None:
+    values = array("d", [1.0, 2.0, 3.0, 4.0])
+    tensor = Tensor.from_buffer(values, (2, 2))
+    assert tensor.dtype is DType.FLOAT64
+    assert tensor.data == [[1.0, 2.0], [3.0, 4.0]]
+
+    values[0] = 10.0  # the owner's writes are visible
+    assert tensor.data == [[10.0, 2.0], [3.0, 4.0]]
+
+    tensor[1, 1] = 0.0  # our writes copy first
+    assert values[3] == 4.0
+    assert tensor.data == [[10.0, 2.0], [3.0, 0.0]]
+
+
+def test_from_buffer_reinterprets_bytes() -> None:
+    raw = bytearray(array("f", [1.5, -2.5]).tobytes())
+    tensor = Tensor.from_buffer(raw, dtype="float32")
+    assert tensor.shape == (2,)
+    assert tensor.data == [1.5, -2.5]
+
+    with pytest.raises(TypeError, match="Unsupported buffer format"):
+        Tensor.from_buffer(array("H", [1, 2]))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688")
+def test_tensor_buffer_protocol() -> None:
+    tensor = Tensor([[1, 2], [3, 4]], dtype="int32")
+    view = memoryview(tensor)  # type: ignore[arg-type]
+    assert view.shape == (2, 2)
+    assert view.tolist() == [[1, 2], [3, 4]]
+    assert memoryview(tensor.T).tolist() == [[1, 3], [2, 4]]  # type: ignore
+
+
+def test_numpy_round_trip() -> None:
+    np = pytest.importorskip("numpy")
+
+    tensor = Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], dtype="float32")
+    exported = np.asarray(tensor)
+    assert exported.dtype == np.float32
+    assert np.shares_memory(exported, np.asarray(tensor))
+    assert np.asarray(tensor.T).tolist() == [[1, 4], [2, 5], [3, 6]]
+    assert np.asarray(tensor[1, 1:]).tolist() == [5.0, 6.0]
+    assert np.asarray(Tensor([True, False])).dtype == np.bool_
+
+    exported[0, 0] = 7.0
+    assert tensor.data == [[7.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+    source = np.arange(6, dtype=np.int64).reshape(2, 3)
+    wrapped = Tensor.from_buffer(source)
+    assert wrapped.dtype is DType.INT64
+    assert np.shares_memory(np.asarray(wrapped), source)
+    assert Tensor.from_buffer(source.T).data == [[0, 3], [1, 4], [2, 5]]
+    swapped = np.array([1, -2], dtype=">i4")
+    assert Tensor.from_buffer(swapped).data == [1, -2]
@@ -0,0 +1,210 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+from xla_lite.core import (
+    CSRTensor,
+    DType,
+    Graph,
+    Node,
+    OpType,
+    QuantizedTensor,
+    Tensor,
+)
+from xla_lite.execution import Executor
+from xla_lite.frontend import GraphBuilder
+
+
+def _write_npy(path: Path, descr: str, shape: str, payload: bytes) -> None:
+    header = (
+        f"{{'descr': '{descr}', 'fortran_order': "
+        + f"{shape.startswith('F')}, 'shape': {shape.lstrip('F')}, }}"
+    ).encode("latin1")
+    header += b" " * (-(10 + len(header) + 1) % 64) + b"\n"
+    path.write_bytes(
+        b"\x93NUMPY\x01\x00"
+        + struct.pack("<H", len(header))
+        + header
+        + payload
+    )
+
+
+def test_load_npy_mmap(tmp_path: Path) -> None:
+    path = tmp_path / "weights.npy"
+    _write_npy(path, "<f4", "(2, 3)", struct.pack("<6f", 1, 2, 3, 4, 5, 6))
+
+    tensor = Tensor.from_file(path)
+    assert isinstance(tensor.buffer, memoryview)
+    assert tensor.buffer.readonly
+    assert tensor.dtype is DType.FLOAT32
+    assert tensor.shape == (2, 3)
+    assert tensor.data == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+    tensor[0, 0] = 10.0  # copy-on-write, the file is left untouched
+    assert tensor.data == [[10.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert Tensor.from_file(path)[0].data == [1.0, 2.0, 3.0]
+
+
+def test_load_npy_layouts(tmp_path: Path) -> None:
+    fortran = tmp_path / "fortran.npy"
+    _write_npy(fortran, "<i8", "F(2, 3)", struct.pack("<6q", 1, 4, 2, 5, 3, 6))
+    assert Tensor.from_file(fortran).data == [[1, 2, 3], [4, 5, 6]]
+
+    big_endian = tmp_path / "big.npy"
+    _write_npy(big_endian, ">i4", "(3,)", struct.pack(">3i", 1, -2, 3))
+    tensor = Tensor.from_file(big_endian)
+    assert tensor.dtype is DType.INT32
+    assert tensor.data == [1, -2, 3]
+
+    flags = tmp_path / "flags.npy"
+    _write_npy(flags, "|b1", "(2,)", b"\x01\x00")
+    assert Tensor.from_file(flags).data == [True, False]
+
+    unsupported = tmp_path / "complex.npy"
+    _write_npy(unsupported, "<c16", "(1,)", b"\0" * 16)
+    with pytest.raises(TypeError, match="Unsupported dtype"):
+        Tensor.from_file(unsupported)
+
+
+@pytest.mark.parametrize("name", ["tensor.npy", "tensor.xlt"])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_tensor_file_round_trip(tmp_path: Path, name: str, mmap: bool) -> None:
+    original = Tensor([[1.5, -2.0], [3.25, 4.0]], dtype="float32")
+    original.T.to_file(tmp_path / name)
+
+    loaded = Tensor.from_file(tmp_path / name, mmap=mmap)
+    assert loaded.dtype is DType.FLOAT32
+    assert loaded.data == original.T.data
+
+    scalar = Tensor(7, dtype="int8")
+    scalar.to_file(tmp_path / name)
+    assert Tensor.from_file(tmp_path / name, mmap=mmap).data == 7
+
+
+def test_load_rejects_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "junk.bin"
+    path.write_bytes(b"not a tensor")
+    with pytest.raises(ValueError, match="Unrecognized tensor file format"):
+        Tensor.from_file(path)
+
+
+def test_numpy_reads_and_writes_npy(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+
+    np.save(tmp_path / "a.npy", np.arange(6, dtype=np.float64).reshape(2, 3))
+    assert Tensor.from_file(tmp_path / "a.npy").data == [
+        [0.0, 1.0, 2.0],
+        [3.0, 4.0, 5.0],
+    ]
+
+    Tensor([[1, 2], [3, 4]], dtype="int32").to_file(tmp_path / "b.npy")
+    loaded = np.load(tmp_path / "b.npy")
+    assert loaded.dtype == np.int32
+    assert loaded.tolist() == [[1, 2], [3, 4]]
+
+
+def _model() -> tuple[Graph, list[str]]:
+    builder = GraphBuilder()
+    image = builder.constant(
+        Tensor.from_flat(
+            [(i % 7) - 3.0 for i in range(2 * 3 * 5 * 5)], (2, 3, 5, 5)
+        )
+    )
+    kernel = builder.constant(
+        Tensor.from_flat(
+            [(i % 5) / 4 for i in range(4 * 3 * 3 * 3)], (4, 3, 3, 3)
+        )
+    )
+    conv = builder.conv2d(image, kernel, stride=(2, 1), padding=1)
+    pooled = builder.reduce_max(builder.reduce_mean(conv, axis=3), axis=2)
+    weight = builder.constant(
+        QuantizedTensor.quantize(
+            Tensor.from_flat([i / 3 - 2 for i in range(12)], (4, 3)), axis=1
+        )
+    )
+    mask = builder.constant(CSRTensor.from_dense(Tensor([[0.0, 1.0, 0.0]])))
+    hidden = builder.linear(pooled, weight, mask, "relu")
+    total = builder.reduce_sum(builder.einsum("ij,ij->i", hidden, hidden))
+    return builder.build(), [hidden.node_id, total.node_id]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_graph_file_round_trip(tmp_path: Path, mmap: bool) -> None:
+    graph, outputs = _model()
+    for node_id in outputs:
+        graph.get_node(node_id).is_output = True  # type: ignore[union-attr]
+    graph.save(tmp_path / "model.xlg")
+
+    loaded = Graph.load(tmp_path / "model.xlg", mmap=mmap)
+
+    assert [repr(node) for node in loaded.nodes] == [
+        repr(node) for node in graph.nodes
+    ]
+    for original, node in zip(graph.nodes, loaded.nodes):
+        assert node.attrs == original.attrs
+        assert node.is_output == original.is_output
+        assert type(node.tensor) is type(original.tensor)
+        if isinstance(node.tensor, QuantizedTensor):
+            quantized = original.tensor
+            assert isinstance(quantized, QuantizedTensor)
+            assert node.tensor.qvalues == quantized.qvalues
+            assert node.tensor.scales == quantized.scales
+    expected = Executor(graph).execute()
+    results = Executor(loaded).execute()
+    for node_id in outputs:
+        assert results[node_id].data == expected[node_id].data
+
+
+def test_graph_constants_are_mapped(tmp_path: Path) -> None:
+    graph = Graph()
+    weights = Tensor([[1.5, 2.5], [3.5, 4.5]], dtype="float32")
+    graph.add_node(Node("w", tensor=weights, op=OpType.CONST.value))
+    graph.save(tmp_path / "model.xlg")
+    data = graph.to_bytes()
+
+    mapped = Graph.load(tmp_path / "model.xlg").get_node("w")
+    assert mapped is not None and mapped.tensor is not None
+    buffer = mapped.tensor.buffer
+    assert isinstance(buffer, memoryview) and buffer.readonly
+    mapped.tensor[0, 0] = 0.0
+    assert mapped.tensor.data == [[0.0, 2.5], [3.5, 4.5]]
+    assert (tmp_path / "model.xlg").read_bytes() == data
+
+    parsed = Graph.from_bytes(data).get_node("w")
+    assert parsed is not None and parsed.tensor is not None
+    assert parsed.tensor.dtype is DType.FLOAT32
+    assert parsed.tensor.data == weights.data
+
+
+def test_graph_bytes_preserve_ids_and_missing_inputs() -> None:
+    graph = Graph()
+    graph.add_node(Node(1, tensor=Tensor(2.0), op=OpType.CONST.value))
+    graph.add_node(
+        Node(2, op=OpType.SUM.value, inputs=[1, "feed"], attrs={"axis": None})
+    )
+
+    loaded = Graph.from_bytes(graph.to_bytes())
+
+    node = loaded.get_node(2)
+    assert node is not None
+    assert node.inputs == [1, "feed"]
+    assert node.attrs == {"axis": None}
+    assert Graph.from_bytes(Graph().to_bytes()).nodes == []
+
+
+def test_graph_bytes_reject_invalid_data() -> None:
+    graph = Graph()
+    graph.add_node(Node("a", tensor=Tensor([1, 2, 3]), op=OpType.CONST.value))
+    data = graph.to_bytes()
+
+    with pytest.raises(ValueError, match="Unrecognized graph format"):
+        Graph.from_bytes(b"XLAT" + data[4:])
+    with pytest.raises(ValueError, match="truncated"):
+        Graph.from_bytes(data[:40])
+    with pytest.raises(ValueError, match="truncated"):
+        Graph.from_bytes(data[:-1])
+
+    graph.add_node(Node("b", op=OpType.SUM.value, attrs={"axis": object()}))
+    with pytest.raises(TypeError, match="Cannot serialize"):
+        graph.to_bytes()
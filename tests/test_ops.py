@@ -1,7 +1,33 @@
+import multiprocessing
+import subprocess
+import sys
+from typing import cast
+from unittest.mock import patch
+
 import pytest
 
-from xla_lite.core import Tensor
-from xla_lite.core.ops import add, matmul, multiply
+from xla_lite.core import DType, Tensor
+from xla_lite.core.ops import (
+    Conv2D,
+    MatrixMultiply,
+    add,
+    add_,
+    conv2d,
+    divide,
+    divide_,
+    exp,
+    linear,
+    matmul,
+    multiply,
+    multiply_,
+    negative,
+    reduce_max,
+    reduce_mean,
+    reduce_sum,
+    relu,
+    subtract,
+    subtract_,
+)
 
 
 def test_add_scalars() -> None:
@@ -117,6 +143,19 @@ def test_add_mismatched_shapes() -> None:
         add(tensor_c, tensor_d)
 
 
+def test_integer_overflow_raises() -> None:
+    big = Tensor([2**62])
+    with pytest.raises(OverflowError, match="out of range for int64"):
+        add(big, big)
+    with pytest.raises(OverflowError, match="out of range for int64"):
+        multiply(Tensor([[2**40]]), Tensor([[2**40]]))
+    with pytest.raises(OverflowError, match="out of range for int64"):
+        Tensor([2**64]).buffer
+
+    # Explicit casts still wrap, as fixed-width integers do.
+    assert Tensor([300]).astype("int8").data == [44]
+
+
 def test_multiply_scalars() -> None:
     tensor_a = Tensor(5)
     tensor_b = Tensor(10)
@@ -262,3 +301,371 @@ def test_matmul_single_element_matrices() -> None:
     assert result.is_matrix()
     assert result.data == [[6]]
     assert result.shape == (1, 1)
+
+
+def test_kernel_outputs_skip_validation() -> None:
+    tensor_a = Tensor([[1, 2], [3, 4]])
+    tensor_b = Tensor([[5, 6], [7, 8]])
+    with patch.object(Tensor, "validate_tensor") as validate:
+        add(tensor_a, tensor_b)
+        multiply(tensor_a, Tensor.from_flat([2], ()))
+        result = matmul(tensor_a, tensor_b)
+    validate.assert_not_called()
+    assert result.shape == (2, 2)
+    assert result.data == [[19, 22], [43, 50]]
+
+
+def test_ops_type_promotion() -> None:
+    ints = Tensor([[1, 2], [3, 4]])
+    halves = Tensor([[0.5, 0.5], [0.5, 0.5]], dtype="float32")
+    small = Tensor([[1, 2], [3, 4]], dtype="int8")
+
+    assert add(ints, ints).dtype is DType.INT64
+    assert add(small, halves).dtype is DType.FLOAT32
+    assert add(ints, halves).dtype is DType.FLOAT64
+    assert multiply(small, Tensor(2, dtype="int8")).data == [[2, 4], [6, 8]]
+    assert divide(ints, ints).dtype is DType.FLOAT64
+    assert divide(ints, Tensor(0)).data == [[float("inf")] * 2] * 2
+
+    product = matmul(ints, ints)
+    assert product.dtype is DType.INT64
+    assert product.data == [[7, 10], [15, 22]]
+    assert isinstance(cast(list[list[int]], product.data)[0][0], int)
+    assert matmul(halves, halves).dtype is DType.FLOAT32
+    assert matmul(ints, halves).data == [[1.5, 1.5], [3.5, 3.5]]
+
+
+def test_blocked_matmul_crosses_tile_boundaries() -> None:
+    m, k, n = 5, 4, 7
+    a = Tensor.from_flat(range(m * k), (m, k))
+    b = Tensor.from_flat(range(k * n), (k, n))
+    expected = [
+        [sum((i * k + p) * (p * n + j) for p in range(k)) for j in range(n)]
+        for i in range(m)
+    ]
+
+    with patch.object(MatrixMultiply, "block_size", 2):
+        assert matmul(a, b).data == expected
+        # Transposed views are packed into contiguous rows first.
+        assert matmul(b.T, a.T).data == [list(r) for r in zip(*expected)]
+
+
+def test_elementwise_broadcasting() -> None:
+    matrix = Tensor([[1, 2, 3], [4, 5, 6]])
+
+    assert add(matrix, Tensor([[10, 20, 30]])).data == [
+        [11, 22, 33],
+        [14, 25, 36],
+    ]
+    assert subtract(matrix, Tensor([[1], [4]])).data == [[0, 1, 2]] * 2
+    assert multiply(Tensor([[1], [2]]), Tensor([[1, 2, 3]])).data == [
+        [1, 2, 3],
+        [2, 4, 6],
+    ]
+    batch = Tensor.from_flat(range(12), (2, 2, 3))
+    assert add(batch, Tensor([[100, 200, 300]])).data == [
+        [[100, 201, 302], [103, 204, 305]],
+        [[106, 207, 308], [109, 210, 311]],
+    ]
+
+
+def test_elementwise_broadcasting_does_not_expand_operands() -> None:
+    activations = Tensor.from_flat(range(8), (4, 2))
+    bias = Tensor([[1, 2]])
+    with patch.object(
+        Tensor, "_values", side_effect=AssertionError("materialized")
+    ):
+        result = add(activations, bias)
+    assert result.data == [[1, 3], [3, 5], [5, 7], [7, 9]]
+
+
+def test_elementwise_rejects_mismatched_flat_shapes() -> None:
+    a = Tensor.from_flat([1, 2, 3], (3,))
+    b = Tensor.from_flat([1, 2], (2,))
+    with pytest.raises(
+        ValueError, match=r"Incompatible shapes for add: \(3,\) and \(2,\)"
+    ):
+        add(a, b)
+
+
+def test_ops_write_into_out() -> None:
+    a = Tensor([[1, 2], [3, 4]])
+    b = Tensor([[10, 20]])
+    out = Tensor.from_flat([0.0] * 4, (2, 2))
+    buffer = out.buffer
+
+    assert add(a, b, out=out) is out
+    assert out.buffer is buffer
+    assert out.data == [[11.0, 22.0], [13.0, 24.0]]
+    assert matmul(a, a, out=out).data == [[7.0, 10.0], [15.0, 22.0]]
+    assert out.dtype is DType.FLOAT64
+
+    with pytest.raises(ValueError, match="Output shape"):
+        add(a, b, out=Tensor([[0, 0]]))
+    with pytest.raises(TypeError, match="Cannot store a float64 result"):
+        divide(a, b, out=Tensor([[0, 0], [0, 0]]))
+
+
+def test_in_place_ops() -> None:
+    a = Tensor([[1, 2], [3, 4]], dtype="float64")
+    view = a[0]
+
+    assert add_(a, Tensor([[1, 1]])) is a
+    assert subtract_(a, Tensor(1)).data == [[1.0, 2.0], [3.0, 4.0]]
+    assert multiply_(a, a).data == [[1.0, 4.0], [9.0, 16.0]]
+    assert divide_(a, Tensor(2)).data == [[0.5, 2.0], [4.5, 8.0]]
+    # Views taken earlier keep their copy-on-write snapshot.
+    assert view.data == [1.0, 2.0]
+
+
+def test_parallel_matmul_matches_serial() -> None:
+    a = Tensor.from_flat([(i * 7) % 11 - 5 for i in range(30)], (6, 5))
+    b = Tensor.from_flat([(i * 3) % 7 * 0.5 for i in range(20)], (5, 4))
+    operation = MatrixMultiply(workers=2)
+
+    with patch.object(MatrixMultiply, "parallel_threshold", 0):
+        result = operation(a, b)
+    assert result.dtype is DType.FLOAT64
+    assert result.data == matmul(a, b).data
+
+    with patch("xla_lite.core.ops.parallel_matmul") as parallel:
+        assert operation(a, b).data == matmul(a, b).data
+    parallel.assert_not_called()
+
+
+PARALLEL_SCRIPT = """
+import multiprocessing
+from unittest.mock import patch
+
+from xla_lite.core import Tensor
+from xla_lite.core.ops import MatrixMultiply, matmul
+
+multiprocessing.set_start_method({method!r})
+a = Tensor.from_flat([float(i) for i in range(12)], (4, 3))
+b = Tensor.from_flat([float(i % 5) for i in range(6)], (3, 2))
+with patch.object(MatrixMultiply, "parallel_threshold", 0):
+    assert MatrixMultiply(workers=2)(a, b).data == matmul(a, b).data
+"""
+
+
+@pytest.mark.parametrize("method", ["spawn", "forkserver"])
+def test_parallel_matmul_start_methods(method: str) -> None:
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{method} is not available")
+    # A fresh interpreter, so the start method and the resource
+    # tracker's output are this run's alone.
+    result = subprocess.run(
+        [sys.executable, "-c", PARALLEL_SCRIPT.format(method=method)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "KeyError" not in result.stderr
+    assert "leaked shared_memory" not in result.stderr
+
+
+def test_batched_matmul() -> None:
+    batch = Tensor.from_flat(range(12), (3, 2, 2))
+    weights = Tensor([[1, 2], [3, 4]])
+    per_item = Tensor.from_flat(range(12, 24), (3, 2, 2))
+
+    def expected(a: Tensor, b: Tensor) -> list:
+        return [
+            matmul(a[i] if a.ndim == 3 else a, b[i] if b.ndim == 3 else b).data
+            for i in range(3)
+        ]
+
+    assert matmul(batch, weights).shape == (3, 2, 2)
+    assert matmul(batch, weights).data == expected(batch, weights)
+    assert matmul(weights, batch).data == expected(weights, batch)
+    assert matmul(batch, per_item).data == expected(batch, per_item)
+    assert (
+        matmul(batch, Tensor.from_flat(range(4), (1, 2, 2))).data
+        == matmul(batch, Tensor.from_flat(range(4), (2, 2))).data
+    )
+
+    with pytest.raises(ValueError, match="Batch sizes"):
+        matmul(batch, Tensor.from_flat(range(8), (2, 2, 2)))
+    with pytest.raises(ValueError, match="Number of columns"):
+        matmul(batch, Tensor([[1, 2, 3]]))
+
+    # An empty inner dimension sums nothing.
+    empty = Tensor.from_flat([], (2, 3, 0), "float64")
+    product = matmul(empty, Tensor.from_flat([], (0, 4), "float64"))
+    assert product.shape == (2, 3, 4)
+    assert list(product._values()) == [0.0] * 24
+
+
+def test_strassen_matmul_matches_classical() -> None:
+    a = Tensor.from_flat([(i * 7) % 13 - 6 for i in range(9 * 7)], (9, 7))
+    b = Tensor.from_flat([(i * 5) % 11 - 5 for i in range(7 * 10)], (7, 10))
+    with patch.object(MatrixMultiply, "strassen_cutoff", None):
+        expected = matmul(a, b).data
+
+    with patch.object(MatrixMultiply, "strassen_cutoff", 2):
+        assert matmul(a, b).data == expected
+        assert matmul(a, b).dtype is DType.INT64
+
+    skewed = Tensor.from_flat(range(40 * 4), (40, 4))
+    with (
+        patch.object(MatrixMultiply, "strassen_cutoff", 2),
+        patch("xla_lite.core.ops.strassen_matmul") as strassen,
+    ):
+        matmul(skewed, skewed.T)
+    strassen.assert_not_called()
+
+
+def test_unary_operations() -> None:
+    a = Tensor([[1, -2], [0, 3]])
+    assert relu(a).data == [[1, 0], [0, 3]]
+    assert relu(a).dtype is DType.INT64
+    assert negative(a).data == [[-1, 2], [0, -3]]
+    assert negative(Tensor([[True, False]])).data == [[-1, 0]]
+    assert exp(Tensor([[0, 1]]))._values() == pytest.approx([1.0, 2.718281828])
+    assert exp(Tensor([[0, 1]])).dtype is DType.FLOAT64
+    assert exp(Tensor(1000.0)).data == float("inf")
+    assert relu(a.T).data == [[1, 0], [0, 3]]
+
+    out = Tensor.from_flat([0.0] * 4, (2, 2))
+    assert negative(a, out=out) is out
+    assert out.data == [[-1.0, 2.0], [0.0, -3.0]]
+
+
+def test_reductions() -> None:
+    a = Tensor([[1, -2, 5], [3, 0, 4]])
+    assert reduce_sum(a).data == 11
+    assert reduce_sum(a).shape == ()
+    assert reduce_sum(a, axis=0).data == [4, -2, 9]
+    assert reduce_sum(a, axis=1, keepdims=True).data == [[4], [7]]
+    assert reduce_sum(a, keepdims=True).shape == (1, 1)
+    assert reduce_mean(a, axis=-1).data == pytest.approx([4 / 3, 7 / 3])
+    assert reduce_mean(a).dtype is DType.FLOAT64
+    assert reduce_max(a, axis=0).data == [3, 0, 5]
+    assert reduce_max(a.T, axis=1).data == [3, 0, 5]
+    assert reduce_sum(Tensor([[True, True, False]])).data == 2
+
+    cube = Tensor.from_flat(range(24), (2, 3, 4))
+    assert reduce_sum(cube, axis=1).shape == (2, 4)
+    assert reduce_sum(cube, axis=1)[1].data == [48, 51, 54, 57]
+
+    with pytest.raises(ValueError):
+        reduce_sum(a, axis=2)
+    with pytest.raises(ValueError, match="empty"):
+        reduce_max(Tensor.from_flat([], (0, 3)))
+
+
+def test_linear_matches_separate_ops() -> None:
+    x = Tensor([[1.0, -2.0], [3.0, 4.0], [0.0, 1.0]])
+    w = Tensor([[1.0, 2.0, 3.0], [-1.0, 0.0, 1.0]])
+    b = Tensor([[0.5, -10.0, 1.0]])
+
+    assert linear(x, w).data == matmul(x, w).data
+    assert linear(x, w, b).data == add(matmul(x, w), b).data
+    assert linear(x, w, b, "relu").data == relu(add(matmul(x, w), b)).data
+    assert linear(x, w, Tensor(1), "exp").dtype is DType.FLOAT64
+    assert linear(Tensor([[1, 2]]), Tensor([[1], [1]])).dtype is DType.INT64
+
+    batch = Tensor.from_flat(range(12), (2, 3, 2))
+    assert linear(batch, w, b, "negative") == negative(
+        add(matmul(batch, w), b)
+    )
+
+    out = Tensor.from_flat([0.0] * 9, (3, 3))
+    assert linear(x, w, b, "relu", out=out) is out
+    assert out.data == relu(add(matmul(x, w), b)).data
+
+    with pytest.raises(ValueError, match="Unsupported activation"):
+        linear(x, w, activation="sum")
+    with pytest.raises(ValueError, match="Number of columns"):
+        linear(x, x)
+
+
+def test_linear_tiles_rows_and_falls_back() -> None:
+    x = Tensor.from_flat([(i * 7) % 11 - 5 for i in range(10 * 4)], (10, 4))
+    w = Tensor.from_flat([(i * 3) % 7 - 3 for i in range(4 * 5)], (4, 5))
+    b = Tensor.from_flat(range(5), (1, 5))
+    expected = relu(add(matmul(x, w), b)).data
+
+    with patch.object(MatrixMultiply, "block_size", 3):
+        assert linear(x, w, b, "relu").data == expected
+    with patch.object(MatrixMultiply, "strassen_cutoff", 1):
+        assert linear(x[:4], w[:, :4], None, "relu").data == (
+            relu(matmul(x[:4], w[:, :4])).data
+        )
+
+    # A bias larger than the product broadcasts like a separate add.
+    wide = Tensor.from_flat(range(20), (2, 10, 1))
+    assert linear(x, w, wide).data == add(matmul(x, w), wide).data
+
+    # Without inputs only the bias and activation remain.
+    empty = linear(
+        Tensor.from_flat([], (3, 0), "float64"),
+        Tensor.from_flat([], (0, 2), "float64"),
+        Tensor([1.0, -2.0]),
+        "relu",
+    )
+    assert empty.data == [[1.0, 0.0], [1.0, 0.0], [1.0, 0.0]]
+
+
+def test_conv2d() -> None:
+    image = Tensor.from_flat(range(16), (1, 1, 4, 4))
+    edges = Tensor([[[[1, 0], [0, -1]]]])
+
+    result = conv2d(image, edges)
+    assert result.shape == (1, 1, 3, 3)
+    assert result.data == [[[[-5, -5, -5], [-5, -5, -5], [-5, -5, -5]]]]
+
+    strided = conv2d(image[0], edges, Tensor([10]), stride=2, padding=1)
+    assert strided.shape == (1, 3, 3)
+    assert strided.data == [[[10, 8, 10], [2, 5, 17], [10, 23, 25]]]
+    assert conv2d(image, edges, stride=(1, 3)).shape == (1, 1, 3, 1)
+
+    out = Tensor.from_flat([0.0] * 9, (1, 1, 3, 3))
+    assert conv2d(image, edges, out=out) is out
+    assert out.data == [[[[-5.0] * 3] * 3]]
+
+
+def test_conv2d_direct_and_im2col_paths_agree() -> None:
+    x = Tensor.from_flat(
+        [(i * 7) % 13 - 6 for i in range(2 * 3 * 6 * 5)], (2, 3, 6, 5)
+    )
+    w = Tensor.from_flat(
+        [(i * 5) % 11 - 5 for i in range(4 * 3 * 3 * 3)], (4, 3, 3, 3)
+    )
+    b = Tensor([1.5, -2.0, 0.0, 3.0])
+
+    with patch.object(Conv2D, "direct_threshold", 0):
+        im2col = conv2d(x, w, b, stride=(2, 1), padding=(1, 2))
+    with patch.object(Conv2D, "direct_threshold", 1000):
+        direct = conv2d(x, w, b, stride=(2, 1), padding=(1, 2))
+
+    assert im2col.shape == (2, 4, 3, 7)
+    assert im2col.dtype is DType.FLOAT64
+    assert im2col == direct
+
+    # One output pixel, computed by hand: the top-left window with
+    # stride 1 and no padding.
+    pixel = sum(
+        x[0, c, i, j].item() * w[1, c, i, j].item()
+        for c in range(3)
+        for i in range(3)
+        for j in range(3)
+    )
+    assert conv2d(x, w)[0, 1, 0, 0].item() == pixel
+
+
+def test_conv2d_rejects_invalid_arguments() -> None:
+    image = Tensor.from_flat(range(16), (1, 1, 4, 4))
+    kernel = Tensor.from_flat(range(4), (1, 1, 2, 2))
+
+    with pytest.raises(ValueError, match="expects input"):
+        conv2d(Tensor([[1, 2], [3, 4]]), kernel)
+    with pytest.raises(ValueError, match="channels"):
+        conv2d(image, Tensor.from_flat(range(8), (1, 2, 2, 2)))
+    with pytest.raises(ValueError, match="Bias"):
+        conv2d(image, kernel, Tensor([1, 2]))
+    with pytest.raises(ValueError, match="stride"):
+        conv2d(image, kernel, stride=0)
+    with pytest.raises(ValueError, match="does not fit"):
+        conv2d(image, Tensor.from_flat(range(25), (1, 1, 5, 5)))
@@ -0,0 +1,175 @@
+import pytest
+
+from xla_lite.core import DType, Graph, Node, OpType, QuantizedTensor, Tensor
+from xla_lite.core.ops import add, dequantize, linear, matmul, quantize
+from xla_lite.execution import Executor
+from xla_lite.frontend import GraphBuilder
+from xla_lite.optimizers import ConstantFolding
+from xla_lite.optimizers.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+
+WEIGHTS = Tensor.from_flat(
+    [((i * 37) % 23 - 11) * (1 + i % 4) / 8 for i in range(24)], (6, 4)
+)
+INPUTS = Tensor.from_flat([((i * 13) % 17 - 8) / 4 for i in range(18)], (3, 6))
+
+
+def _close(a: Tensor, b: Tensor, tolerance: float) -> bool:
+    return all(
+        abs(x - y) <= tolerance for x, y in zip(a._values(), b._values())
+    )
+
+
+def test_quantize_round_trip() -> None:
+    quantized = QuantizedTensor.quantize(WEIGHTS)
+
+    assert quantized.qvalues.itemsize == 1
+    assert quantized.dtype is DType.FLOAT64
+    assert quantized.axis is None and len(quantized.scales) == 1
+    assert _close(quantized.dequantize(), WEIGHTS, quantized.scales[0] / 2)
+    # Zero is always exactly representable.
+    zeros = QuantizedTensor.quantize(Tensor([[0.0, 1.0, -3.0]]))
+    assert zeros.dequantize().data[0][0] == 0.0  # type: ignore[index]
+
+
+def test_quantize_per_channel() -> None:
+    quantized = QuantizedTensor.quantize(WEIGHTS, axis=1)
+
+    assert quantized.axis == 1
+    assert len(quantized.scales) == len(quantized.zero_points) == 4
+    scales, _ = quantized.channel_params(1)
+    for j in range(4):
+        column = WEIGHTS[:, j]
+        error = max(
+            abs(x - y)
+            for x, y in zip(
+                quantized.dequantize()[:, j]._values(), column._values()
+            )
+        )
+        assert error <= scales[j] / 2
+    assert quantized.data == quantized.dequantize().data
+
+    with pytest.raises(ValueError, match="per channel along axis 1"):
+        quantized.channel_params(0)
+
+
+def test_invalid_quantized_construction() -> None:
+    with pytest.raises(ValueError, match="cannot fill"):
+        QuantizedTensor([1, 2, 3], (2, 2), 0.5)
+    with pytest.raises(ValueError, match="scales"):
+        QuantizedTensor([1, 2, 3, 4], (2, 2), [0.5, 0.25, 1.0], axis=0)
+    with pytest.raises(ValueError, match="positive"):
+        QuantizedTensor([1, 2, 3, 4], (2, 2), 0.0)
+    with pytest.raises(TypeError, match="floating"):
+        QuantizedTensor([1, 2, 3, 4], (2, 2), 0.5, dtype="int32")
+
+
+def test_quantized_tensors_are_immutable() -> None:
+    quantized = QuantizedTensor([1, 2, 3, 4], (2, 2), 0.5, 1)
+    with pytest.raises(TypeError):
+        quantized[0, 0] = 5
+    with pytest.raises(TypeError):
+        add(Tensor([[1.0, 1.0], [1.0, 1.0]]), quantized, out=quantized)
+    assert quantized.data == [[0.0, 0.5], [1.0, 1.5]]
+    assert repr(quantized) == (
+        "QuantizedTensor(shape=(2, 2), axis=None, dtype=float64)"
+    )
+
+
+def test_quantized_matmul_matches_dequantized_product() -> None:
+    weights = quantize(WEIGHTS, axis=1)
+    inputs = quantize(INPUTS, axis=0)
+    assert isinstance(weights, QuantizedTensor)
+    assert isinstance(inputs, QuantizedTensor)
+
+    expected = matmul(inputs.dequantize(), weights.dequantize())
+    result = matmul(inputs, weights)
+    assert not isinstance(result, QuantizedTensor)
+    assert result.dtype is DType.FLOAT64
+    assert _close(result, expected, 1e-9)
+
+    # Float activations are quantized per tensor on the fly.
+    dynamic = matmul(INPUTS, weights)
+    assert _close(dynamic, matmul(INPUTS, WEIGHTS), 0.5)
+
+    # Per-column activations cannot be factored out of the dot product.
+    columns = quantize(INPUTS, axis=1)
+    assert isinstance(columns, QuantizedTensor)
+    assert _close(
+        matmul(columns, weights),
+        matmul(columns.dequantize(), weights.dequantize()),
+        1e-9,
+    )
+
+    assert _close(
+        linear(INPUTS, weights, Tensor([[1.0, 0.0, -1.0, 2.0]]), "relu"),
+        linear(INPUTS, WEIGHTS, Tensor([[1.0, 0.0, -1.0, 2.0]]), "relu"),
+        0.5,
+    )
+    with pytest.raises(ValueError, match="Number of columns"):
+        matmul(weights, weights)
+
+
+def test_quantized_matmul_accumulates_in_int32() -> None:
+    k = 1 << 17
+    ones = QuantizedTensor([-128] * k, (1, k), 1.0)
+    column = QuantizedTensor([-128] * k, (k, 1), 1.0)
+    # 128 * 128 * 2**17 is 2**31, which wraps to -2**31 in int32.
+    assert matmul(ones, column).data == [[-float(1 << 31)]]
+
+
+def test_numpy_backend_quantized_matmul() -> None:
+    pytest.importorskip("numpy")
+    from xla_lite.backends import get_backend
+
+    numpy_backend, python_backend = get_backend("numpy"), get_backend()
+    weights = quantize(WEIGHTS, axis=1)
+    for a in [quantize(INPUTS, axis=0), quantize(INPUTS), INPUTS]:
+        expected = python_backend.execute(OpType.MATMUL, [a, weights])
+        result = numpy_backend.execute(OpType.MATMUL, [a, weights])
+        assert result.dtype is expected.dtype
+        assert _close(result, expected, 1e-9)
+
+
+def test_builder_quantize_folds_to_int8_constant() -> None:
+    builder = GraphBuilder()
+    x = builder.constant(INPUTS)
+    w = builder.quantize(builder.constant(WEIGHTS), axis=1)
+    y = builder.matmul(x, w)
+    restored = builder.dequantize(w)
+    graph = builder.build()
+
+    node = graph.get_node(w.node_id)
+    assert node is not None and node.attrs == {"axis": 1}
+    ConstantFolding().apply(graph)
+    assert node.op == OpType.CONST.value
+    assert isinstance(node.tensor, QuantizedTensor)
+
+    results = Executor(graph).execute()
+    assert _close(results[y.node_id], matmul(INPUTS, WEIGHTS), 0.5)
+    assert not isinstance(results[restored.node_id], QuantizedTensor)
+    assert results[restored.node_id] == dequantize(node.tensor)
+
+
+def test_quantized_graph_execution_and_cse() -> None:
+    graph = Graph()
+    const = OpType.CONST.value
+    graph.add_node(Node("x", tensor=INPUTS, op=const))
+    graph.add_node(Node("w", tensor=WEIGHTS, op=const))
+    graph.add_node(
+        Node("q", op=OpType.QUANTIZE.value, inputs=["w"], attrs={"axis": 1})
+    )
+    graph.add_node(Node("y", op=OpType.MATMUL.value, inputs=["x", "q"]))
+
+    executor = Executor(graph, reuse_buffers=True)
+    first = executor.execute()["q"]
+    assert isinstance(first, QuantizedTensor)
+    assert isinstance(executor.execute()["q"], QuantizedTensor)
+
+    signature = CommonSubexpressionElimination._get_node_signature
+    a = Node("a", QuantizedTensor.quantize(WEIGHTS, axis=1), op=const)
+    b = Node("b", QuantizedTensor.quantize(WEIGHTS, axis=1), op=const)
+    c = Node("c", QuantizedTensor.quantize(WEIGHTS), op=const)
+    assert signature(a) == signature(b) != signature(c)
+    assert a.tensor is not None and a.tensor._buffer is None
@@ -0,0 +1,204 @@
+import pytest
+
+from xla_lite.core import (
+    COOTensor,
+    CSRTensor,
+    Data,
+    DType,
+    Graph,
+    Node,
+    OpType,
+    SparseTensor,
+    Tensor,
+)
+from xla_lite.core.ops import add, divide, matmul, multiply, subtract
+from xla_lite.execution import Executor
+from xla_lite.optimizers.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+from xla_lite.optimizers.constant_folding import ConstantFolding
+
+DENSE_A: Data = [[1, 0, 0], [0, 0, 2], [0, 3, 0]]
+DENSE_B: Data = [[0, 4, 0], [5, 0, 0], [0, 0, 6]]
+
+
+def test_csr_from_dense_round_trip() -> None:
+    csr = CSRTensor.from_dense(Tensor(DENSE_A))
+
+    assert list(csr.indptr) == [0, 1, 2, 3]
+    assert list(csr.indices) == [0, 2, 1]
+    assert list(csr.values) == [1, 2, 3]
+    assert csr.nnz == 3
+    assert csr.shape == (3, 3)
+    assert csr.dtype is DType.INT64
+    assert csr.to_dense().data == DENSE_A
+    assert csr.data == DENSE_A
+
+
+def test_coo_to_csr_sorts_and_sums_duplicates() -> None:
+    coo = COOTensor([2, 0, 2, 0], [1, 0, 1, 2], [1.0, 2.0, 3.0, 4.0], (3, 3))
+    csr = coo.tocsr()
+
+    assert list(csr.indptr) == [0, 2, 2, 3]
+    assert list(csr.indices) == [0, 2, 1]
+    assert list(csr.values) == [2.0, 4.0, 4.0]
+    assert csr.dtype is DType.FLOAT64
+
+
+def test_invalid_sparse_construction() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        COOTensor([0, 1], [0], [1, 2], (2, 2))
+    with pytest.raises(ValueError, match="out of bounds"):
+        COOTensor([0], [5], [1], (2, 2))
+    with pytest.raises(ValueError, match="indptr"):
+        CSRTensor([0, 1], [0], [1], (2, 2))
+    with pytest.raises(ValueError, match="two-dimensional"):
+        CSRTensor([0], [], [], (1, 2, 3))
+    with pytest.raises(TypeError, match="abstract"):
+        SparseTensor([[0]])  # type: ignore[abstract]
+
+
+def test_sparse_tensors_are_immutable() -> None:
+    csr = CSRTensor.from_dense(Tensor(DENSE_A))
+    with pytest.raises(TypeError):
+        csr[0, 0] = 5
+
+
+def test_csr_transpose() -> None:
+    csr = CSRTensor.from_dense(Tensor([[1, 0, 2], [0, 3, 0]]))
+    transposed = csr.T
+
+    assert isinstance(transposed, CSRTensor)
+    assert transposed.shape == (3, 2)
+    assert transposed.data == [[1, 0], [0, 3], [2, 0]]
+
+
+def test_sparse_matmul_combinations() -> None:
+    a, b = Tensor(DENSE_A), Tensor(DENSE_B)
+    sa, sb = CSRTensor.from_dense(a), CSRTensor.from_dense(b)
+    expected = matmul(a, b).data
+
+    sparse_dense = matmul(sa, b)
+    dense_sparse = matmul(a, sb)
+    sparse_sparse = matmul(sa, sb)
+
+    assert not isinstance(sparse_dense, SparseTensor)
+    assert not isinstance(dense_sparse, SparseTensor)
+    assert isinstance(sparse_sparse, CSRTensor)
+    assert sparse_dense.data == expected
+    assert dense_sparse.data == expected
+    assert sparse_sparse.data == expected
+
+
+def test_sparse_matmul_rectangular_and_vector() -> None:
+    a = COOTensor([0, 1], [2, 0], [2.0, 3.0], (2, 3))
+    b = Tensor([[1], [2], [3]])
+
+    result = matmul(a, b)
+    assert result.shape == (2, 1)
+    assert result.data == [[6.0], [3.0]]
+
+    with pytest.raises(ValueError):
+        matmul(a, Tensor([[1, 2], [3, 4]]))
+
+
+def test_sparse_elementwise() -> None:
+    a, b = Tensor(DENSE_A), Tensor(DENSE_B)
+    sa, sb = CSRTensor.from_dense(a), CSRTensor.from_dense(b)
+
+    total = add(sa, sb)
+    assert isinstance(total, CSRTensor)
+    assert total.nnz == 6
+    assert total.data == add(a, b).data
+
+    difference = subtract(sa, sb)
+    assert isinstance(difference, CSRTensor)
+    assert difference.data == subtract(a, b).data
+
+    product = multiply(sa, sb)
+    assert isinstance(product, CSRTensor)
+    assert product.nnz == 0
+    assert product.data == multiply(a, b).data
+
+
+def test_sparse_scaling_keeps_pattern() -> None:
+    sa = CSRTensor.from_dense(Tensor(DENSE_A))
+
+    scaled = multiply(sa, Tensor(2))
+    assert isinstance(scaled, CSRTensor)
+    assert list(scaled.values) == [2, 4, 6]
+
+    masked = multiply(Tensor(DENSE_B), sa)
+    assert isinstance(masked, CSRTensor)
+    assert masked.data == multiply(Tensor(DENSE_B), Tensor(DENSE_A)).data
+
+    halved = divide(sa, Tensor(2))
+    assert isinstance(halved, CSRTensor)
+    assert halved.dtype is DType.FLOAT64
+    assert list(halved.values) == [0.5, 1.0, 1.5]
+
+
+def test_sparse_elementwise_dense_fallback() -> None:
+    a = Tensor(DENSE_A)
+    sa = CSRTensor.from_dense(a)
+
+    result = add(sa, Tensor(DENSE_B))
+    assert not isinstance(result, SparseTensor)
+    assert result.data == add(a, Tensor(DENSE_B)).data
+    assert divide(sa, Tensor(0)).data == divide(a, Tensor(0)).data
+
+    with pytest.raises(ValueError):
+        multiply(sa, Tensor([[1, 2], [3, 4]]))
+
+
+def test_executor_passes_sparse_tensors_through() -> None:
+    graph = Graph()
+    sparse = CSRTensor.from_dense(Tensor(DENSE_A))
+    graph.add_node(Node(node_id="a", tensor=sparse))
+    graph.add_node(
+        Node(node_id="b", tensor=CSRTensor.from_dense(Tensor(DENSE_B)))
+    )
+    graph.add_node(
+        Node(node_id="c", op=OpType.MATMUL.value, inputs=["a", "b"])
+    )
+
+    results = Executor(graph).execute()
+
+    assert results["a"] is sparse
+    assert isinstance(results["c"], CSRTensor)
+    assert results["c"].data == matmul(Tensor(DENSE_A), Tensor(DENSE_B)).data
+
+
+def test_constant_folding_keeps_sparse_results() -> None:
+    graph = Graph()
+    const = OpType.CONST.value
+    a = CSRTensor.from_dense(Tensor(DENSE_A))
+    b = CSRTensor.from_dense(Tensor(DENSE_B))
+    graph.add_node(Node(node_id="a", tensor=a, op=const))
+    graph.add_node(Node(node_id="b", tensor=b, op=const))
+    graph.add_node(Node(node_id="c", op=OpType.ADD.value, inputs=["a", "b"]))
+
+    ConstantFolding().apply(graph)
+
+    node = graph.get_node("c")
+    assert node is not None
+    assert node.op == OpType.CONST.value
+    assert isinstance(node.tensor, CSRTensor)
+
+
+def test_cse_signs_sparse_constants_without_densifying() -> None:
+    const = OpType.CONST.value
+    coo = COOTensor([0, 1, 2], [0, 2, 1], [1, 2, 3], (3, 3))
+    first = Node("a", CSRTensor.from_dense(Tensor(DENSE_A)), op=const)
+    second = Node("b", coo, op=const)
+    other = Node("c", CSRTensor.from_dense(Tensor(DENSE_B)), op=const)
+
+    signature = CommonSubexpressionElimination._get_node_signature
+    assert signature(first) == signature(second)
+    assert signature(first) != signature(other)
+    assert first.tensor is not None and first.tensor._buffer is None
+
+
+def test_sparse_repr() -> None:
+    csr = CSRTensor.from_dense(Tensor([[0.0, 1.5]]))
+    assert repr(csr) == "CSRTensor(shape=(1, 2), nnz=1, dtype=float64)"
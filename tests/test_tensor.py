@@ -1,6 +1,11 @@
+from array import array
+from typing import Any
+
 import pytest
 
-from xla_lite.core import Tensor
+from xla_lite.core import DType, Tensor
+from xla_lite.core.ops import reduce_sum
+from xla_lite.core.tensor import broadcast_shapes
 
 
 def test_tensor_scalar_creation() -> None:
@@ -44,6 +49,10 @@ def test_tensor_invalid_creation() -> None:
         TypeError, match="Tensor data must be an int, float, or nested list."
     ):
         Tensor("invalid")  # type: ignore
+    with pytest.raises(
+        TypeError, match="Tensor data must be an int, float, or nested list."
+    ):
+        Tensor(None)  # type: ignore
 
     with pytest.raises(
         TypeError, match="All elements must be of the same type."
@@ -54,3 +63,199 @@ def test_tensor_invalid_creation() -> None:
         TypeError, match="All elements must be of the same type."
     ):
         Tensor(data=[[1, 2], [3, "four"]])  # type: ignore
+
+
+def test_tensor_rejects_ragged_rows() -> None:
+    with pytest.raises(
+        ValueError, match="All rows must have the same length."
+    ):
+        Tensor([[1, 2], [3]])
+
+
+def test_tensor_from_flat() -> None:
+    tensor = Tensor.from_flat(
+        array("d", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]), (2, 3)
+    )
+    assert tensor.is_flat()
+    assert tensor.shape == (2, 3)
+    assert tensor.strides == (3, 1)
+    assert tensor.data == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert tensor == Tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    scalar = Tensor.from_flat([7], (), dtype="int64")
+    assert scalar.data == 7
+    assert scalar.shape == ()
+
+    empty = Tensor.from_flat([], (1, 0))
+    assert empty.data == [[]]
+
+    with pytest.raises(ValueError, match="cannot be viewed with shape"):
+        Tensor.from_flat([1.0, 2.0, 3.0], (2, 2))
+
+
+def test_tensor_buffer_packs_nested_data() -> None:
+    tensor = Tensor([[1, 2], [3, 4]])
+    assert not tensor.is_flat()
+    assert tensor.buffer == array("q", [1, 2, 3, 4])
+    assert tensor.is_flat()
+    assert tensor.data == [[1, 2], [3, 4]]
+
+    assert Tensor([1.5, 2.5]).buffer == array("d", [1.5, 2.5])
+
+
+def test_tensor_data_is_built_from_the_packed_buffer() -> None:
+    nested: list[Any] = [[1, 2], [3, 4]]
+    tensor = Tensor(nested)
+    assert tensor.dtype is DType.INT64  # packs the lists
+
+    nested[0][0] = 100
+    assert tensor.data == [[1, 2], [3, 4]]
+    assert tensor.data is not nested
+    assert tensor.buffer == array("q", [1, 2, 3, 4])
+    with pytest.raises(AttributeError):
+        tensor.data = [[5, 6], [7, 8]]  # type: ignore[misc]
+
+
+def test_tensor_strided_storage() -> None:
+    # Column-major layout of [[1, 2, 3], [4, 5, 6]].
+    buffer = array("q", [1, 4, 2, 5, 3, 6])
+    tensor = Tensor._from_storage(buffer, (2, 3), strides=(1, 2))
+    assert not tensor.is_contiguous()
+    assert tensor.data == [[1, 2, 3], [4, 5, 6]]
+
+    copied = tensor.copy()
+    assert copied.is_contiguous()
+    assert copied.buffer == array("q", [1, 2, 3, 4, 5, 6])
+
+
+def test_tensor_classification_uses_shape() -> None:
+    tensor = Tensor.from_flat(range(6), (3, 2), dtype="int64")
+    assert tensor.ndim == 2
+    assert tensor.is_matrix()
+    assert not tensor.is_vector()
+    assert not tensor.is_scalar()
+    assert tensor._data is None  # nothing was materialized
+
+    assert Tensor([[]]).is_matrix()
+    assert not Tensor([]).is_matrix()
+    assert not Tensor([1, 2, 3]).is_vector()
+    assert not Tensor([[[1, 2]]]).is_matrix()
+    assert Tensor.from_flat([1.0], ()).is_scalar()
+
+
+def test_tensor_views_share_buffer() -> None:
+    tensor = Tensor([[1, 2, 3], [4, 5, 6]])
+
+    transposed = tensor.T
+    assert transposed.buffer is tensor.buffer
+    assert transposed.shape == (3, 2)
+    assert transposed.strides == (1, 3)
+    assert transposed.data == [[1, 4], [2, 5], [3, 6]]
+
+    assert tensor[1].data == [4, 5, 6]
+    assert tensor[:, 1].data == [2, 5]
+    assert tensor[0, -1].data == 3
+    assert tensor[:, ::2].data == [[1, 3], [4, 6]]
+    assert tensor[:, 1].buffer is tensor.buffer
+
+    assert tensor.reshape(3, 2).data == [[1, 2], [3, 4], [5, 6]]
+    assert tensor.reshape(-1).buffer is tensor.buffer
+    assert transposed.reshape(6).data == [1, 4, 2, 5, 3, 6]
+
+    expanded = tensor.expand_dims(0)
+    assert expanded.shape == (1, 2, 3)
+    assert expanded.is_contiguous()
+    assert expanded.squeeze().data == tensor.data
+    assert tensor.expand_dims(-1).shape == (2, 3, 1)
+
+
+def test_tensor_invalid_views() -> None:
+    tensor = Tensor([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError, match="Cannot reshape"):
+        tensor.reshape(4, 2)
+    with pytest.raises(ValueError, match="not a permutation"):
+        tensor.transpose(0, 0)
+    with pytest.raises(ValueError, match="Cannot squeeze axis 1"):
+        tensor.squeeze(1)
+    with pytest.raises(IndexError, match="out of bounds"):
+        tensor[2]
+    with pytest.raises(IndexError, match="Too many indices"):
+        tensor[0, 0, 0]
+
+
+def test_tensor_copy_on_write() -> None:
+    tensor = Tensor([[1, 2, 3], [4, 5, 6]])
+    view = tensor.T
+
+    view[0, 1] = 100
+    assert view.data == [[1, 100], [2, 5], [3, 6]]
+    assert tensor.data == [[1, 2, 3], [4, 5, 6]]
+
+    row = tensor[0]
+    tensor[:, 0] = Tensor([7, 8])
+    tensor[1] = 0
+    assert tensor.data == [[7, 2, 3], [0, 0, 0]]
+    assert row.data == [1, 2, 3]
+
+    copied = tensor.copy()
+    copied[0, 0] = -1
+    assert tensor.data == [[7, 2, 3], [0, 0, 0]]
+
+    with pytest.raises(ValueError, match="Cannot assign a tensor of shape"):
+        tensor[0] = Tensor([1, 2])
+
+
+def test_tensor_writes_in_place_once_views_are_gone() -> None:
+    tensor = Tensor([[1, 2], [3, 4]], dtype="int64")
+    buffer = tensor.buffer
+    assert reduce_sum(tensor, axis=0).data == [4, 6]
+
+    tensor[0, 0] = 5
+    assert tensor.buffer is buffer
+
+    view = tensor[1]
+    view[0] = 7
+    assert view.buffer is not buffer
+    del view
+    tensor[1, 1] = 0
+    assert tensor.buffer is buffer
+    assert tensor.data == [[5, 2], [3, 0]]
+
+
+def test_tensor_dtype() -> None:
+    assert Tensor([[1, 2]]).dtype is DType.INT64
+    assert Tensor(2.5).dtype is DType.FLOAT64
+    assert Tensor([True, False]).dtype is DType.BOOL
+
+    tensor = Tensor([[1.5, 2.5], [3.5, 4.5]], dtype="float32")
+    assert tensor.dtype is DType.FLOAT32
+    assert tensor.buffer.itemsize == 4
+    assert tensor._data is None  # nested lists are not kept
+    assert tensor.data == [[1.5, 2.5], [3.5, 4.5]]
+
+    weights = Tensor([[1.9, -2.2]], dtype=DType.INT8)
+    assert weights.data == [[1, -2]]
+    assert weights.astype("float64").data == [[1.0, -2.0]]
+    assert weights.T.dtype is DType.INT8
+    assert Tensor([True, False], dtype="bool").data == [True, False]
+    assert Tensor(3, dtype="float32").item() == 3.0
+
+
+def test_tensor_broadcast_to() -> None:
+    row = Tensor([[1, 2, 3]])
+    view = row.broadcast_to(2, 2, 3)
+
+    assert view.shape == (2, 2, 3)
+    assert view.strides == (0, 0, 1)
+    assert view.buffer is row.buffer
+    assert view.data == [[[1, 2, 3]] * 2] * 2
+    assert Tensor([[1], [2]]).broadcast_to((2, 3)).data == [
+        [1, 1, 1],
+        [2, 2, 2],
+    ]
+
+    with pytest.raises(ValueError, match="Cannot broadcast"):
+        row.broadcast_to(3, 2)
+    assert broadcast_shapes((4, 1, 3), (5, 1), ()) == (4, 5, 3)
+    with pytest.raises(ValueError, match="cannot be broadcast"):
+        broadcast_shapes((2, 3), (3, 2))
@@ -0,0 +1,29 @@
+from .base import (
+    BACKEND_ENV_VAR,
+    Backend,
+    Kernel,
+    available_backends,
+    get_backend,
+    register_backend,
+)
+from .python import PythonBackend
+
+
+def _numpy_backend() -> Backend:
+    from .numpy_backend import NumpyBackend
+
+    return NumpyBackend()
+
+
+register_backend("python", PythonBackend)
+register_backend("numpy", _numpy_backend)
+
+__all__ = [
+    "BACKEND_ENV_VAR",
+    "Backend",
+    "Kernel",
+    "PythonBackend",
+    "available_backends",
+    "get_backend",
+    "register_backend",
+]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable
+
+from xla_lite.core import OpType, Tensor
+
+Kernel = Callable[..., Tensor]
+
+BACKEND_ENV_VAR = "XLA_LITE_BACKEND"
+DEFAULT_BACKEND = "python"
+
+
+class Backend:
+    """A named set of kernels, one per ``OpType``."""
+
+    name: str = ""
+
+    def __init__(self) -> None:
+        self.kernels: dict[OpType, Kernel] = {}
+
+    def register(self, op: OpType, kernel: Kernel) -> None:
+        self.kernels[op] = kernel
+
+    def supports(self, op: str | OpType) -> bool:
+        try:
+            return OpType(op) in self.kernels
+        except ValueError:
+            return False
+
+    def kernel(self, op: str | OpType) -> Kernel:
+        if not self.supports(op):
+            value = op.value if isinstance(op, OpType) else op
+            raise ValueError(f"Unsupported operation: {value}")
+        return self.kernels[OpType(op)]
+
+    def execute(
+        self,
+        op: str | OpType,
+        inputs: list[Tensor],
+        out: Tensor | None = None,
+        attrs: dict[str, Any] | None = None,
+    ) -> Tensor:
+        """Run the kernel for ``op``, writing into ``out`` if given.
+
+        ``attrs`` holds the node's static arguments, such as the axis of
+        a reduction, and is passed to the kernel as keywords.
+        """
+        kernel = self.kernel(op)
+        kwargs = dict(attrs or {})
+        if out is not None:
+            kwargs["out"] = out
+        return kernel(*inputs, **kwargs)
+
+    def with_workers(self, workers: int) -> Backend:
+        """Return a variant of this backend that uses ``workers`` cores.
+
+        Backends whose kernels are already multi-threaded, or that cannot
+        parallelize, return themselves.
+        """
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+_factories: dict[str, Callable[[], Backend]] = {}
+_instances: dict[str, Backend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], Backend]) -> None:
+    """Make a backend selectable by name.
+
+    The factory runs on first use, so backends with optional
+    dependencies only import them when they are actually selected.
+    """
+    _factories[name] = factory
+    _instances.pop(name, None)
+
+
+def available_backends() -> list[str]:
+    return sorted(_factories)
+
+
+def get_backend(backend: Backend | str | None = None) -> Backend:
+    """Resolve a backend instance, a registered name, or the default.
+
+    Without an explicit choice the ``XLA_LITE_BACKEND`` environment
+    variable is consulted, falling back to the pure-Python backend.
+    """
+    if isinstance(backend, Backend):
+        return backend
+    name = backend or os.environ.get(BACKEND_ENV_VAR) or DEFAULT_BACKEND
+    if name not in _instances:
+        if name not in _factories:
+            raise ValueError(
+                f"Unknown backend '{name}'. Available backends: "
+                + ", ".join(available_backends())
+            )
+        _instances[name] = _factories[name]()
+    return _instances[name]
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+import numpy as np
+
+from xla_lite.core import DType, OpType, QuantizedTensor, SparseTensor, Tensor
+from xla_lite.core.dtype import arithmetic_type, division_type
+from xla_lite.core.einsum import Strategy, contraction_plan
+from xla_lite.core.ops import (
+    Add,
+    Conv2D,
+    Dequantize,
+    Divide,
+    Einsum,
+    Exp,
+    Linear,
+    MatrixMultiply,
+    Max,
+    Mean,
+    Multiply,
+    Negative,
+    Quantize,
+    Relu,
+    Subtract,
+    Sum,
+    get_activation,
+    validate_out,
+)
+
+from .base import Backend
+
+
+def to_numpy(tensor: Tensor) -> Any:
+    """Wrap the tensor's storage in an ndarray without copying.
+
+    Strides carry over, so transposed and broadcast views stay views.
+    """
+    dtype = np.dtype(tensor.dtype.typestr)
+    if tensor.size == 0:
+        return np.zeros(tensor.shape, dtype=dtype)
+    return np.ndarray(
+        tensor.shape,
+        dtype=dtype,
+        buffer=tensor.buffer,
+        offset=tensor.offset * dtype.itemsize,
+        strides=tuple(stride * dtype.itemsize for stride in tensor.strides),
+    )
+
+
+def from_numpy(result: Any, dtype: DType) -> Tensor:
+    values = np.asarray(result, dtype=np.dtype(dtype.typestr))
+    buffer = array(dtype.typecode)
+    buffer.frombytes(values.tobytes())
+    return Tensor._from_storage(buffer, tuple(values.shape), dtype=dtype)
+
+
+def _operands(a: Tensor, b: Tensor, dtype: DType) -> tuple[Any, Any]:
+    # Compute in the result dtype so bools add as ints, as they do in the
+    # reference kernels.
+    target = np.dtype(dtype.typestr)
+    return (
+        to_numpy(a).astype(target, copy=False),
+        to_numpy(b).astype(target, copy=False),
+    )
+
+
+def _target(out: Tensor, shape: tuple[int, ...], dtype: DType) -> Any:
+    """Validate ``out`` and return an ndarray that writes into it."""
+    validate_out(out, shape, dtype)
+    out._make_writable()
+    out._data = None
+    return to_numpy(out)
+
+
+def _apply(
+    ufunc: Any, a: Tensor, b: Tensor, dtype: DType, out: Tensor | None
+) -> Tensor:
+    left, right = _operands(a, b, dtype)
+    if out is None:
+        return from_numpy(ufunc(left, right), dtype)
+    ufunc(left, right, out=_target(out, a.shape, dtype))
+    return out
+
+
+class NumpyAdd(Add):
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return _apply(np.add, a, b, arithmetic_type(a.dtype, b.dtype), out)
+
+
+class NumpySubtract(Subtract):
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        return _apply(np.subtract, a, b, dtype, out)
+
+
+class NumpyMultiply(Multiply):
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        return _apply(np.multiply, a, b, dtype, out)
+
+
+class NumpyDivide(Divide):
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        dtype = division_type(a.dtype, b.dtype)
+        left, right = _operands(a, b, dtype)
+        # Taken before writing, in case ``out`` is one of the operands.
+        zero = right == 0
+        target = None if out is None else _target(out, a.shape, dtype)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotient = np.asarray(np.true_divide(left, right, out=target))
+        # Match the reference kernel, which maps any x / 0 to +inf.
+        quotient[zero] = np.inf
+        return from_numpy(quotient, dtype) if out is None else out
+
+
+class NumpyMatrixMultiply(MatrixMultiply):
+    def matrix_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        if a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        return self._matmul(a, b, (a.shape[0], b.shape[1]), out)
+
+    def matrix_vector_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        if a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Length of the vector must equal number of rows in the matrix "
+                + "for multiplication."
+            )
+        return self._matmul(a, b, (a.shape[0],), out)
+
+    def vector_matrix_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        if a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Length of the vector must equal number of rows in the matrix "
+                + "for multiplication."
+            )
+        return self._matmul(a, b, (1, b.shape[1]), out)
+
+    def batch_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return self._matmul(a, b, self._batch_shape(a, b), out)
+
+    def quantized_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        if a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        qa, qb = (
+            x
+            if isinstance(x, QuantizedTensor)
+            else QuantizedTensor.quantize(x)
+            for x in (a, b)
+        )
+        if qa.axis not in (None, 0) or qb.axis not in (None, 1):
+            return super().quantized_multiply(a, b, out)
+        dtype = DType.FLOAT64
+        if all(
+            x.dtype is DType.FLOAT32 for x in (a, b) if x.dtype.is_floating
+        ):
+            dtype = DType.FLOAT32
+
+        (m, k), n = a.shape, b.shape[1]
+        left = np.frombuffer(qa.qvalues, dtype=np.int8).reshape(m, k)
+        right = np.frombuffer(qb.qvalues, dtype=np.int8).reshape(k, n)
+        sa, za = (np.array(p).reshape(-1, 1) for p in qa.channel_params(0))
+        sb, zb = (np.array(p).reshape(1, -1) for p in qb.channel_params(1))
+        acc = np.matmul(left, right, dtype=np.int32)
+        acc -= zb.astype(np.int32) * left.sum(axis=1, keepdims=True)
+        acc -= za.astype(np.int32) * right.sum(axis=0, keepdims=True)
+        acc += k * za.astype(np.int32) * zb.astype(np.int32)
+        result = (sa * sb) * acc
+        if out is None:
+            return from_numpy(result, dtype)
+        np.copyto(_target(out, (m, n), dtype), result)
+        return out
+
+    @staticmethod
+    def _matmul(
+        a: Tensor, b: Tensor, shape: tuple[int, ...], out: Tensor | None
+    ) -> Tensor:
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        left, right = _operands(a, b, dtype)
+        if out is None:
+            return from_numpy(np.matmul(left, right).reshape(shape), dtype)
+        target = _target(out, shape, dtype)
+        batch = np.broadcast_shapes(left.shape[:-2], right.shape[:-2])
+        if target.shape == batch + (left.shape[-2], right.shape[-1]):
+            np.matmul(left, right, out=target)
+        else:
+            np.copyto(target, np.matmul(left, right).reshape(shape))
+        return out
+
+
+def _apply_unary(
+    ufunc: Any, a: Tensor, dtype: DType, out: Tensor | None, *args: Any
+) -> Tensor:
+    operand = to_numpy(a).astype(np.dtype(dtype.typestr), copy=False)
+    if out is None:
+        return from_numpy(ufunc(operand, *args), dtype)
+    ufunc(operand, *args, out=_target(out, a.shape, dtype))
+    return out
+
+
+class NumpyExp(Exp):
+    def operate(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        with np.errstate(over="ignore"):
+            return _apply_unary(np.exp, a, self.result_type(a.dtype), out)
+
+
+class NumpyRelu(Relu):
+    def operate(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        dtype = self.result_type(a.dtype)
+        return _apply_unary(np.maximum, a, dtype, out, 0)
+
+
+class NumpyNegative(Negative):
+    def operate(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        return _apply_unary(np.negative, a, self.result_type(a.dtype), out)
+
+
+def _reduce(
+    function: Any,
+    a: Tensor,
+    axis: int | None,
+    shape: tuple[int, ...],
+    dtype: DType,
+    out: Tensor | None,
+    accumulate: bool = True,
+) -> Tensor:
+    # Accumulate in the result dtype so bools sum as ints, as they do in
+    # the reference kernels.
+    options = {"dtype": np.dtype(dtype.typestr)} if accumulate else {}
+    result = np.reshape(function(to_numpy(a), axis=axis, **options), shape)
+    if out is None:
+        return from_numpy(result, dtype)
+    np.copyto(_target(out, shape, dtype), result)
+    return out
+
+
+class NumpySum(Sum):
+    def reduce(
+        self,
+        a: Tensor,
+        axis: int | None,
+        shape: tuple[int, ...],
+        out: Tensor | None = None,
+    ) -> Tensor:
+        dtype = self.result_type(a.dtype)
+        return _reduce(np.sum, a, axis, shape, dtype, out)
+
+
+def _mean(x: Any, axis: int | None, dtype: Any) -> Any:
+    # ``np.mean`` warns about empty slices; their mean is 0 / 0, which is
+    # NaN as in the reference kernel.
+    count = x.size if axis is None else x.shape[axis]
+    with np.errstate(invalid="ignore"):
+        return np.divide(np.sum(x, axis=axis, dtype=dtype), count)
+
+
+class NumpyMean(Mean):
+    def reduce(
+        self,
+        a: Tensor,
+        axis: int | None,
+        shape: tuple[int, ...],
+        out: Tensor | None = None,
+    ) -> Tensor:
+        dtype = self.result_type(a.dtype)
+        return _reduce(_mean, a, axis, shape, dtype, out)
+
+
+class NumpyMax(Max):
+    def reduce(
+        self,
+        a: Tensor,
+        axis: int | None,
+        shape: tuple[int, ...],
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if a.size == 0:
+            raise ValueError("Cannot take the max of an empty tensor.")
+        return _reduce(np.max, a, axis, shape, a.dtype, out, False)
+
+
+# Ufuncs for each activation, applied in place on the layer's output.
+_ACTIVATIONS: dict[str, Any] = {
+    "exp": np.exp,
+    "relu": lambda x, out: np.maximum(x, 0, out=out),
+    "negative": np.negative,
+}
+
+
+class NumpyLinear(Linear):
+    def __init__(self) -> None:
+        super().__init__()
+        self.matmul = NumpyMatrixMultiply()
+
+    def __call__(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None = None,
+        activation: str | None = None,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if (
+            x.ndim not in (2, 3)
+            or weight.ndim != 2
+            or isinstance(x, SparseTensor)
+            or isinstance(weight, SparseTensor)
+            or isinstance(weight, QuantizedTensor)
+            or (activation is not None and activation not in _ACTIVATIONS)
+        ):
+            # The reference kernel takes the unfused path, with this
+            # backend's sparse and quantized matmul.
+            return super().__call__(x, weight, bias, activation, out)
+        if x.shape[-1] != weight.shape[0]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        shape = x.shape[:-1] + (weight.shape[1],)
+        dtype = arithmetic_type(x.dtype, weight.dtype)
+        if bias is not None:
+            if np.broadcast_shapes(bias.shape, shape) != shape:
+                return super().__call__(x, weight, bias, activation, out)
+            dtype = arithmetic_type(dtype, bias.dtype)
+        if activation is not None:
+            dtype = get_activation(activation).result_type(dtype)
+
+        # Every step writes into one buffer of the result dtype.
+        left, right = _operands(x, weight, dtype)
+        result = np.matmul(left, right)
+        if bias is not None:
+            np.add(result, to_numpy(bias), out=result, casting="unsafe")
+        if activation is not None:
+            with np.errstate(over="ignore"):
+                _ACTIVATIONS[activation](result, out=result)
+        if out is None:
+            return from_numpy(result, dtype)
+        np.copyto(_target(out, shape, dtype), result)
+        return out
+
+
+class NumpyEinsum(Einsum):
+    def __call__(
+        self,
+        *operands: Tensor,
+        equation: str,
+        strategy: Strategy = "auto",
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if not operands:
+            raise ValueError("einsum requires at least one operand.")
+        plan = contraction_plan(
+            equation, tuple(a.shape for a in operands), strategy
+        )
+        dtype = operands[0].dtype
+        for a in operands:
+            dtype = arithmetic_type(dtype, a.dtype)
+        target = np.dtype(dtype.typestr)
+        arrays = [to_numpy(a).astype(target, copy=False) for a in operands]
+        # Reuse the cached plan rather than letting numpy search again.
+        path = ["einsum_path", *plan.path] if plan.path else False
+        result = np.einsum(equation, *arrays, optimize=path)
+        if out is None:
+            return from_numpy(result, dtype)
+        np.copyto(_target(out, result.shape, dtype), result)
+        return out
+
+
+class NumpyConv2D(Conv2D):
+    def __call__(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None = None,
+        stride: int | tuple[int, int] = 1,
+        padding: int | tuple[int, int] = 0,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        batch = x if x.ndim == 4 else x.reshape(1, *x.shape)
+        self.output_size(batch, weight, bias, stride, padding)
+        sh, sw = (stride, stride) if isinstance(stride, int) else stride
+        ph, pw = (padding, padding) if isinstance(padding, int) else padding
+        dtype = arithmetic_type(x.dtype, weight.dtype)
+        if bias is not None:
+            dtype = arithmetic_type(dtype, bias.dtype)
+        target = np.dtype(dtype.typestr)
+        images, filters = _operands(batch, weight, dtype)
+        images = np.pad(images, ((0, 0), (0, 0), (ph, ph), (pw, pw)))
+        windows = np.lib.stride_tricks.sliding_window_view(
+            images, filters.shape[2:], axis=(2, 3)
+        )[:, :, ::sh, ::sw]
+        # im2col as a strided view: one tensordot over (C, KH, KW).
+        result = np.tensordot(windows, filters, axes=((1, 4, 5), (1, 2, 3)))
+        result = np.moveaxis(result, 3, 1)
+        if bias is not None:
+            result += to_numpy(bias).astype(target).reshape(1, -1, 1, 1)
+        if x.ndim == 3:
+            result = result[0]
+        if out is None:
+            return from_numpy(result, dtype)
+        np.copyto(_target(out, result.shape, dtype), result)
+        return out
+
+
+class NumpyBackend(Backend):
+    """Vectorized kernels; sparse operands keep their sparse kernels.
+
+    Shape checks, scalar broadcasting and result dtypes are inherited
+    from ``core.ops``, so results match the Python backend.
+    """
+
+    name = "numpy"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.register(OpType.ADD, NumpyAdd())
+        self.register(OpType.SUBTRACT, NumpySubtract())
+        self.register(OpType.MULTIPLY, NumpyMultiply())
+        self.register(OpType.DIVIDE, NumpyDivide())
+        self.register(OpType.MATMUL, NumpyMatrixMultiply())
+        self.register(OpType.SUM, NumpySum())
+        self.register(OpType.MEAN, NumpyMean())
+        self.register(OpType.MAX, NumpyMax())
+        self.register(OpType.EXP, NumpyExp())
+        self.register(OpType.RELU, NumpyRelu())
+        self.register(OpType.NEGATIVE, NumpyNegative())
+        self.register(OpType.LINEAR, NumpyLinear())
+        self.register(OpType.EINSUM, NumpyEinsum())
+        self.register(OpType.CONV2D, NumpyConv2D())
+        self.register(OpType.QUANTIZE, Quantize())
+        self.register(OpType.DEQUANTIZE, Dequantize())
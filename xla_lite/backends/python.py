@@ -0,0 +1,32 @@
+from xla_lite.core import OpType
+from xla_lite.core.ops import (
+    OPERATIONS,
+    Conv2D,
+    Einsum,
+    Linear,
+    MatrixMultiply,
+)
+
+from .base import Backend
+
+
+class PythonBackend(Backend):
+    """The reference kernels from ``core.ops``; no dependencies."""
+
+    name = "python"
+
+    def __init__(self, workers: int = 1) -> None:
+        super().__init__()
+        self.workers = workers
+        for op, operation in OPERATIONS.items():
+            self.register(OpType(op), operation)
+        if workers > 1:
+            self.register(OpType.MATMUL, MatrixMultiply(workers))
+            self.register(OpType.LINEAR, Linear(workers))
+            self.register(OpType.EINSUM, Einsum(workers))
+            self.register(OpType.CONV2D, Conv2D(workers))
+
+    def with_workers(self, workers: int) -> Backend:
+        if workers == self.workers:
+            return self
+        return PythonBackend(workers)
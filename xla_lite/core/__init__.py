@@ -1,4 +1,18 @@
+from .dtype import DType
 from .graph import Graph, Node, OpType
+from .quantized import QuantizedTensor
+from .sparse import COOTensor, CSRTensor, SparseTensor
 from .tensor import Data, Tensor
 
-__all__ = ["Graph", "Node", "OpType", "Tensor", "Data"]
+__all__ = [
+    "Graph",
+    "Node",
+    "OpType",
+    "Tensor",
+    "Data",
+    "DType",
+    "SparseTensor",
+    "CSRTensor",
+    "COOTensor",
+    "QuantizedTensor",
+]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from enum import Enum
+from typing import Iterable
+
+
+class DType(Enum):
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+    INT64 = "int64"
+    INT32 = "int32"
+    INT8 = "int8"
+    BOOL = "bool"
+
+    @classmethod
+    def of(cls, dtype: DType | str) -> DType:
+        return dtype if isinstance(dtype, DType) else cls(dtype)
+
+    @classmethod
+    def from_typecode(cls, typecode: str) -> DType:
+        try:
+            return _FROM_TYPECODE[typecode.lstrip("<=@")]
+        except KeyError:
+            raise TypeError(
+                f"Unsupported buffer format '{typecode}'."
+            ) from None
+
+    @classmethod
+    def from_format(cls, fmt: str, itemsize: int) -> DType:
+        """Map a struct-style buffer format, e.g. from a memoryview."""
+        kind = fmt.lstrip("<>=@!")
+        if kind == "?":
+            return cls.BOOL
+        if kind in ("f", "d"):
+            sizes = {8: cls.FLOAT64, 4: cls.FLOAT32}
+        elif kind in ("b", "h", "i", "l", "q"):
+            sizes = {8: cls.INT64, 4: cls.INT32, 1: cls.INT8}
+        else:
+            sizes = {}
+        if itemsize not in sizes:
+            raise TypeError(f"Unsupported buffer format '{fmt}'.")
+        return sizes[itemsize]
+
+    @classmethod
+    def from_typestr(cls, typestr: str) -> DType:
+        """Map an array-interface type string such as ``'<f4'``."""
+        try:
+            return _FROM_TYPESTR[typestr[1:]]
+        except KeyError:
+            raise TypeError(f"Unsupported dtype {typestr!r}.") from None
+
+    @classmethod
+    def infer(cls, values: Iterable[int | float]) -> DType:
+        values = list(values)
+        if values and all(isinstance(v, bool) for v in values):
+            return cls.BOOL
+        if any(isinstance(v, float) for v in values):
+            return cls.FLOAT64
+        return cls.INT64
+
+    @property
+    def typecode(self) -> str:
+        return _TYPECODES[self]
+
+    @property
+    def format(self) -> str:
+        """The memoryview format; bools read back as ``bool``."""
+        return "?" if self is DType.BOOL else self.typecode
+
+    @property
+    def typestr(self) -> str:
+        """The array-interface type string in native byte order."""
+        if self.itemsize == 1:
+            return "|" + _TYPESTR[self]
+        return ("<" if sys.byteorder == "little" else ">") + _TYPESTR[self]
+
+    @property
+    def itemsize(self) -> int:
+        return array(self.typecode).itemsize
+
+    @property
+    def is_floating(self) -> bool:
+        return self in (DType.FLOAT64, DType.FLOAT32)
+
+    @property
+    def is_integer(self) -> bool:
+        return self in (DType.INT64, DType.INT32, DType.INT8)
+
+    def pack(self, values: Iterable[int | float], wrap: bool = False) -> array:
+        """Store values in a new typed array, casting like ``astype``.
+
+        Floats are truncated when stored as integers. Integers that do not
+        fit the dtype raise ``OverflowError``, unless ``wrap`` is set for
+        an explicit cast; they then wrap around, as they would in
+        fixed-width arithmetic.
+        """
+        if self is DType.BOOL:
+            return array("B", [1 if v else 0 for v in values])
+        if self.is_floating:
+            return array(self.typecode, values)
+
+        values = list(values)
+        try:
+            return array(self.typecode, values)
+        except TypeError:
+            return self.pack([int(v) for v in values], wrap)
+        except OverflowError:
+            bits = self.itemsize * 8
+            mask, sign = (1 << bits) - 1, 1 << (bits - 1)
+            if not wrap:
+                value = next(v for v in values if not -sign <= v < sign)
+                raise OverflowError(
+                    f"Integer {value} is out of range for {self.value}."
+                ) from None
+            return array(
+                self.typecode,
+                [((int(v) + sign) & mask) - sign for v in values],
+            )
+
+    def unpack(self, values: Iterable[int | float]) -> list[int | float]:
+        """Convert stored values back to Python scalars of this dtype."""
+        if self is DType.BOOL:
+            return [bool(v) for v in values]
+        return list(values)
+
+
+_TYPECODES = {
+    DType.FLOAT64: "d",
+    DType.FLOAT32: "f",
+    DType.INT64: "q",
+    DType.INT32: "i",
+    DType.INT8: "b",
+    DType.BOOL: "B",
+}
+_FROM_TYPECODE = {code: dtype for dtype, code in _TYPECODES.items()} | {
+    "?": DType.BOOL,
+}
+_TYPESTR = {
+    DType.FLOAT64: "f8",
+    DType.FLOAT32: "f4",
+    DType.INT64: "i8",
+    DType.INT32: "i4",
+    DType.INT8: "i1",
+    DType.BOOL: "b1",
+}
+_FROM_TYPESTR = {code: dtype for dtype, code in _TYPESTR.items()}
+_RANK = [DType.BOOL, DType.INT8, DType.INT32, DType.INT64]
+
+
+def promote_types(a: DType, b: DType) -> DType:
+    """Return the smallest dtype both operands can be safely cast to."""
+    if a is b:
+        return a
+    if a.is_floating and b.is_floating:
+        return DType.FLOAT64
+    if a.is_floating or b.is_floating:
+        floating, other = (a, b) if a.is_floating else (b, a)
+        if floating is DType.FLOAT32 and other in (DType.BOOL, DType.INT8):
+            return DType.FLOAT32
+        return DType.FLOAT64
+    return max(a, b, key=_RANK.index)
+
+
+def arithmetic_type(a: DType, b: DType) -> DType:
+    """Result dtype of ``+``, ``-``, ``*`` and matmul; bools count as ints."""
+    dtype = promote_types(a, b)
+    return DType.INT64 if dtype is DType.BOOL else dtype
+
+
+def division_type(a: DType, b: DType) -> DType:
+    """Result dtype of true division, which is always floating point."""
+    dtype = promote_types(a, b)
+    return dtype if dtype.is_floating else DType.FLOAT64
@@ -0,0 +1,205 @@
+"""Parsing and contraction ordering for ``einsum``.
+
+A plan contracts the operands two at a time. The order matters a great
+deal: a poor one can create intermediates far larger than any input.
+For a handful of operands the cheapest order is found exactly by
+dynamic programming over subsets; beyond that a greedy search picks,
+at each step, the pair whose result shrinks the working set the most.
+Plans depend only on the equation and the operand shapes and are
+cached on those.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import prod
+from typing import Literal
+
+Strategy = Literal["auto", "greedy", "optimal"]
+
+# "auto" searches exhaustively up to this many operands; the search is
+# exponential in the operand count.
+OPTIMAL_LIMIT = 6
+
+
+@dataclass(frozen=True)
+class ContractionPlan:
+    """How to evaluate an einsum equation for fixed operand shapes.
+
+    ``path`` lists pairs of positions in the working list of operands.
+    Each step removes both operands and appends their contraction, as
+    in ``numpy.einsum_path``. ``cost`` estimates the multiply-adds of
+    all steps.
+    """
+
+    inputs: tuple[str, ...]
+    output: str
+    sizes: tuple[tuple[str, int], ...]
+    path: tuple[tuple[int, int], ...]
+    cost: int
+
+
+def parse_equation(
+    equation: str, ndims: tuple[int, ...]
+) -> tuple[tuple[str, ...], str]:
+    """Split an equation into per-operand and output subscripts.
+
+    Without ``->`` the output is every subscript used exactly once, in
+    alphabetical order.
+    """
+    equation = equation.replace(" ", "")
+    lhs, arrow, output = equation.partition("->")
+    inputs = tuple(lhs.split(","))
+    if len(inputs) != len(ndims):
+        raise ValueError(
+            f"Equation '{equation}' has {len(inputs)} operands but "
+            + f"{len(ndims)} were given."
+        )
+    letters = "".join(inputs)
+    if not all(c.isalpha() for c in letters + output):
+        raise ValueError(
+            f"Subscripts in '{equation}' must be letters; ellipses are not "
+            + "supported."
+        )
+    for subscripts, ndim in zip(inputs, ndims):
+        if len(subscripts) != ndim:
+            raise ValueError(
+                f"Subscripts '{subscripts}' do not match an operand with "
+                + f"{ndim} dimensions."
+            )
+    if not arrow:
+        output = "".join(
+            sorted(c for c in set(letters) if letters.count(c) == 1)
+        )
+    if len(set(output)) != len(output) or not set(output) <= set(letters):
+        raise ValueError(
+            f"Output subscripts '{output}' must be unique and appear in an "
+            + "operand."
+        )
+    return inputs, output
+
+
+@lru_cache(maxsize=256)
+def contraction_plan(
+    equation: str,
+    shapes: tuple[tuple[int, ...], ...],
+    strategy: Strategy = "auto",
+) -> ContractionPlan:
+    """Parse ``equation`` and choose a contraction order for ``shapes``."""
+    inputs, output = parse_equation(
+        equation, tuple(len(shape) for shape in shapes)
+    )
+    sizes: dict[str, int] = {}
+    for subscripts, shape in zip(inputs, shapes):
+        for c, dim in zip(subscripts, shape):
+            if sizes.setdefault(c, dim) != dim:
+                raise ValueError(
+                    f"Subscript '{c}' has sizes {sizes[c]} and {dim}."
+                )
+
+    if strategy not in ("auto", "greedy", "optimal"):
+        raise ValueError(f"Unknown contraction strategy: {strategy}")
+    if strategy == "optimal" or (
+        strategy == "auto" and len(inputs) <= OPTIMAL_LIMIT
+    ):
+        path, cost = _optimal_path(inputs, output, sizes)
+    else:
+        path, cost = _greedy_path(inputs, output, sizes)
+    return ContractionPlan(
+        inputs, output, tuple(sorted(sizes.items())), path, cost
+    )
+
+
+def _optimal_path(
+    inputs: tuple[str, ...], output: str, sizes: dict[str, int]
+) -> tuple[tuple[tuple[int, int], ...], int]:
+    n = len(inputs)
+    full = (1 << n) - 1
+    # Subscripts each subset of operands keeps: those also used by an
+    # operand outside the subset, or by the output.
+    kept: dict[int, frozenset[str]] = {}
+    for subset in range(1, full + 1):
+        inside = set().union(*(inputs[i] for i in range(n) if subset >> i & 1))
+        outside = set(output).union(
+            *(inputs[i] for i in range(n) if not subset >> i & 1)
+        )
+        kept[subset] = frozenset(inside & outside)
+
+    best: dict[int, tuple[int, int]] = {1 << i: (0, 0) for i in range(n)}
+    for subset in sorted(range(1, full + 1), key=lambda s: s.bit_count()):
+        if subset in best:
+            continue
+        lowest = subset & -subset
+        choice = (-1, 0)
+        # Enumerate splits once each by keeping the lowest operand left.
+        left = (subset - 1) & subset
+        while left:
+            right = subset ^ left
+            if left & lowest and right:
+                cost = (
+                    best[left][0]
+                    + best[right][0]
+                    + prod(sizes[c] for c in kept[left] | kept[right])
+                )
+                if choice[0] < 0 or cost < choice[0]:
+                    choice = (cost, left)
+            left = (left - 1) & subset
+        best[subset] = choice
+
+    steps: list[tuple[int, int]] = []
+
+    def visit(subset: int) -> None:
+        left = best[subset][1]
+        if left:
+            visit(left)
+            visit(subset ^ left)
+            steps.append((left, subset ^ left))
+
+    visit(full)
+    return _linearize(n, steps), best[full][0]
+
+
+def _greedy_path(
+    inputs: tuple[str, ...], output: str, sizes: dict[str, int]
+) -> tuple[tuple[tuple[int, int], ...], int]:
+    operands = [frozenset(subscripts) for subscripts in inputs]
+    path: list[tuple[int, int]] = []
+    total = 0
+    while len(operands) > 1:
+        choice: tuple[tuple[int, int], int, int, frozenset[str]] | None = None
+        for i in range(len(operands)):
+            for j in range(i + 1, len(operands)):
+                others = set(output).union(
+                    *(s for k, s in enumerate(operands) if k not in (i, j))
+                )
+                result = (operands[i] | operands[j]) & others
+                growth = (
+                    prod(sizes[c] for c in result)
+                    - prod(sizes[c] for c in operands[i])
+                    - prod(sizes[c] for c in operands[j])
+                )
+                cost = prod(sizes[c] for c in operands[i] | operands[j])
+                if choice is None or (growth, cost) < choice[1:3]:
+                    choice = ((i, j), growth, cost, frozenset(result))
+        assert choice is not None
+        (i, j), _, cost, result = choice
+        path.append((i, j))
+        total += cost
+        del operands[j], operands[i]
+        operands.append(result)
+    return tuple(path), total
+
+
+def _linearize(
+    n: int, steps: list[tuple[int, int]]
+) -> tuple[tuple[int, int], ...]:
+    """Turn subset contractions into positions in a working list."""
+    working = [1 << i for i in range(n)]
+    path = []
+    for left, right in steps:
+        i, j = sorted((working.index(left), working.index(right)))
+        path.append((i, j))
+        del working[j], working[i]
+        working.append(left | right)
+    return tuple(path)
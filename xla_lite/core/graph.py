@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
 from enum import Enum
 from typing import Any
 
@@ -13,20 +16,36 @@ class OpType(Enum):
     MULTIPLY = "multiply"
     DIVIDE = "divide"
     MATMUL = "matmul"
+    SUM = "sum"
+    MEAN = "mean"
+    MAX = "max"
+    EXP = "exp"
+    RELU = "relu"
+    NEGATIVE = "negative"
+    LINEAR = "linear"
+    EINSUM = "einsum"
+    CONV2D = "conv2d"
+    QUANTIZE = "quantize"
+    DEQUANTIZE = "dequantize"
 
 
 class Node:
+    __slots__ = ("node_id", "tensor", "op", "inputs", "attrs", "is_output")
+
     def __init__(
         self,
         node_id: Any,
         tensor: Tensor | None = None,
         op: str | None = None,
         inputs: list[Any] | None = None,
+        attrs: dict[str, Any] | None = None,
     ) -> None:
         self.node_id = node_id
         self.tensor = tensor
         self.op = op
         self.inputs = inputs or []
+        # Static kernel arguments, such as the axis of a reduction.
+        self.attrs = attrs or {}
         self.is_output = False
 
     def __repr__(self) -> str:
@@ -37,18 +56,179 @@ class Node:
 
 
 class Graph:
+    """Nodes and the edges between them.
+
+    Nodes are addressed by their ids in the public API. Internally each
+    node gets a dense integer index in insertion order: ``_table`` maps
+    indices to nodes, leaving ``None`` where a node was removed, and
+    the sort and the users index work on indices alone.
+    """
+
     def __init__(self) -> None:
-        self.nodes: list[Node] = []
-        self.node_map: dict[Any, Node] = {}
+        self._index: dict[Any, int] = {}
+        self._table: list[Node | None] = []
+        self._nodes: list[Node] | None = []
+        self._order: list[Node] | None = None
+        # The indices of the nodes using each node as an input, built
+        # on first use and then kept up to date by the editing methods.
+        # Inputs that are not in the graph (yet) are kept by id.
+        self._users: list[dict[int, None]] | None = None
+        self._pending: dict[Any, dict[int, None]] = {}
+
+    @property
+    def nodes(self) -> list[Node]:
+        """A copy of the nodes in insertion order.
+
+        Use ``add_node`` and ``remove_node`` to change the graph.
+        """
+        if self._nodes is None:
+            self._nodes = [node for node in self._table if node is not None]
+        return list(self._nodes)
+
+    @property
+    def node_map(self) -> Mapping[Any, Node]:
+        """A read-only mapping from node ids to nodes."""
+        return _NodeMap(self)
 
     def add_node(self, node: Node) -> None:
-        if node.node_id in self.node_map:
+        if node.node_id in self._index:
             raise ValueError(f"Node with id '{node.node_id}' already exists.")
-        self.nodes.append(node)
-        self.node_map[node.node_id] = node
+        i = len(self._table)
+        self._table.append(node)
+        self._index[node.node_id] = i
+        if self._nodes is not None:
+            self._nodes.append(node)
+        if self._users is not None:
+            self._users.append(self._pending.pop(node.node_id, {}))
+            self._link(i, node.inputs)
+        self._order = None
 
     def get_node(self, node_id: Any) -> Node | None:
-        return self.node_map.get(node_id, None)
+        i = self._index.get(node_id)
+        return None if i is None else self._table[i]
+
+    def users(self, node_id: Any) -> list[Node]:
+        """The nodes using ``node_id`` as an input, in insertion order."""
+        i = self._index.get(node_id)
+        if i is None:
+            return []
+        return [self._node(user) for user in self._user_index()[i]]
+
+    def set_inputs(self, node_id: Any, inputs: list[Any]) -> None:
+        """Replace the inputs of ``node_id``, updating the edges."""
+        i = self._require(node_id)
+        node = self._node(i)
+        self._unlink(i, set(node.inputs) - set(inputs))
+        node.inputs = list(inputs)
+        self._link(i, inputs)
+        self._order = None
+
+    def replace_all_uses_with(self, old_id: Any, new_id: Any) -> None:
+        """Make every user of ``old_id`` read ``new_id`` instead.
+
+        Only the users' edges are visited. Output markings are left as
+        they are.
+        """
+        old, new = self._require(old_id), self._require(new_id)
+        if old == new:
+            return
+        users = self._user_index()
+        moved, users[old] = users[old], {}
+        for user in moved:
+            node = self._node(user)
+            node.inputs = [
+                new_id if input_id == old_id else input_id
+                for input_id in node.inputs
+            ]
+        users[new].update(moved)
+        self._order = None
+
+    def remove_node(self, node_id: Any) -> None:
+        """Remove a node that no other node uses."""
+        i = self._require(node_id)
+        users = self._user_index()[i]
+        if users:
+            raise ValueError(
+                f"Node '{node_id}' is still used by "
+                + f"{[self._node(user).node_id for user in users]}."
+            )
+        self._unlink(i, set(self._node(i).inputs))
+        self._table[i] = None
+        del self._index[node_id]
+        self._nodes = None
+        self._order = None
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the graph in the xla_lite binary graph format."""
+        from .io import save_graph
+
+        save_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], mmap: bool = True) -> Graph:
+        """Load a graph file; with ``mmap`` constants are mapped lazily."""
+        from .io import load_graph
+
+        return load_graph(path, mmap=mmap)
+
+    def to_bytes(self) -> bytes:
+        from .io import graph_to_bytes
+
+        return graph_to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Graph:
+        from .io import graph_from_bytes
+
+        return graph_from_bytes(data)
+
+    def fingerprint(self) -> str:
+        """A stable hash of the graph that does not depend on node ids.
+
+        Equal graphs built in different processes, or with nodes added
+        in a different order, have equal fingerprints, so it can key
+        caches of optimized graphs and execution plans.
+        """
+        from .io import graph_fingerprint
+
+        return graph_fingerprint(self)
+
+    def _node(self, i: int) -> Node:
+        node = self._table[i]
+        assert node is not None
+        return node
+
+    def _require(self, node_id: Any) -> int:
+        i = self._index.get(node_id)
+        if i is None:
+            raise ValueError(f"Node with id '{node_id}' does not exist.")
+        return i
+
+    def _user_index(self) -> list[dict[int, None]]:
+        if self._users is None:
+            self._users = [{} for _ in self._table]
+            self._pending = {}
+            for i, node in enumerate(self._table):
+                if node is not None:
+                    self._link(i, node.inputs)
+        return self._users
+
+    def _users_of(self, input_id: Any) -> dict[int, None]:
+        assert self._users is not None
+        j = self._index.get(input_id)
+        if j is None:
+            return self._pending.setdefault(input_id, {})
+        return self._users[j]
+
+    def _link(self, i: int, inputs: Iterable[Any]) -> None:
+        if self._users is not None:
+            for input_id in inputs:
+                self._users_of(input_id)[i] = None
+
+    def _unlink(self, i: int, inputs: Iterable[Any]) -> None:
+        if self._users is not None:
+            for input_id in inputs:
+                self._users_of(input_id).pop(i, None)
 
     def __repr__(self) -> str:
         return "\n".join(
@@ -60,26 +240,99 @@ class Graph:
             ]
         )
 
+    def invalidate(self) -> None:
+        """Forget the cached execution order and users.
+
+        The editing methods keep both up to date; code that changes a
+        node's ``inputs`` directly must call this afterwards.
+        """
+        self._order = None
+        self._users = None
+
     def topological_sort(self) -> list[Node]:
-        visited = set()
-        stack = []
-        temp_marks = set()
-
-        def visit(node: Node) -> None:
-            if node.node_id in temp_marks:
-                raise ValueError("Graph has cycles.")
-            if node.node_id not in visited:
-                temp_marks.add(node.node_id)
+        """Every node after its inputs.
+
+        The order is a depth-first post-order visiting nodes in insertion
+        order and inputs in argument order, so it is deterministic. It
+        is computed without recursion and cached until the graph changes.
+        """
+        if self._order is None:
+            self._order = [self._node(i) for i in self._sort()]
+        return list(self._order)
+
+    def _adjacency(self) -> tuple[array, array, bool]:
+        """The edges as flat arrays of input indices.
+
+        The inputs of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``;
+        inputs that are not in the graph are left out. The flag tells
+        whether every input was added before its users.
+        """
+        indptr, indices = array("q", [0]), array("q")
+        lookup, append = self._index.get, indices.append
+        ordered = True
+        for i, node in enumerate(self._table):
+            if node is not None:
                 for input_id in node.inputs:
-                    input_node = self.get_node(input_id)
-                    if input_node:
-                        visit(input_node)
-                temp_marks.remove(node.node_id)
-                visited.add(node.node_id)
-                stack.append(node)
-
-        for node in self.nodes:
-            if node.node_id not in visited:
-                visit(node)
-
-        return stack
+                    j = lookup(input_id)
+                    if j is not None:
+                        append(j)
+                        if j >= i:
+                            ordered = False
+            indptr.append(len(indices))
+        return indptr, indices, ordered
+
+    def _sort(self) -> list[int]:
+        table = self._table
+        indptr, indices, ordered = self._adjacency()
+        if ordered:
+            # Each node's inputs are ordered by earlier roots, so the
+            # post-order is the insertion order.
+            return [i for i, node in enumerate(table) if node is not None]
+        order: list[int] = []
+        # 0 before a node is reached, 1 while it is on the stack and 2
+        # once it is ordered.
+        state = bytearray(len(table))
+        for root, node in enumerate(table):
+            if node is None or state[root]:
+                continue
+            state[root] = 1
+            # Each stack entry is a node and the position of its next
+            # input in ``indices``.
+            stack = [root]
+            positions = [indptr[root]]
+            while stack:
+                i, p, end = stack[-1], positions[-1], indptr[stack[-1] + 1]
+                while p < end:
+                    j = indices[p]
+                    p += 1
+                    if not state[j]:
+                        positions[-1] = p
+                        state[j] = 1
+                        stack.append(j)
+                        positions.append(indptr[j])
+                        break
+                    if state[j] == 1:
+                        raise ValueError("Graph has cycles.")
+                else:
+                    stack.pop()
+                    positions.pop()
+                    state[i] = 2
+                    order.append(i)
+        return order
+
+
+class _NodeMap(Mapping[Any, Node]):
+    def __init__(self, graph: Graph) -> None:
+        self._graph = graph
+
+    def __getitem__(self, node_id: Any) -> Node:
+        node = self._graph.get_node(node_id)
+        if node is None:
+            raise KeyError(node_id)
+        return node
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._graph._index)
+
+    def __len__(self) -> int:
+        return len(self._graph._index)
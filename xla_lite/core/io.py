@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import ast
+import mmap as mmap_module
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from hashlib import blake2b
+from math import prod
+from typing import Any
+
+from .dtype import DType
+from .graph import Graph, Node
+from .quantized import QuantizedTensor
+from .sparse import CSRTensor, SparseTensor
+from .tensor import Buffer, Tensor, contiguous_strides
+
+NPY_MAGIC = b"\x93NUMPY"
+RAW_MAGIC = b"XLAT"
+RAW_VERSION = 1
+GRAPH_MAGIC = b"XLAG"
+GRAPH_VERSION = 1
+ALIGNMENT = 64
+
+_RAW_CODES = list(DType)
+
+# Magic, version, node count, edge count, metadata size and the offset
+# of the constants blob.
+_GRAPH_HEADER = struct.Struct("<4sB3xIIQQ")
+# Per node: op index (-1 for none), first edge, edge count, constant
+# index (-1 for none) and flags.
+_NODE_FIELDS = 5
+_OUTPUT_FLAG = 1
+
+
+def load_tensor(path: str | os.PathLike[str], mmap: bool = True) -> Tensor:
+    """Load a tensor from a ``.npy`` file or an xla_lite raw file.
+
+    With ``mmap`` the elements are paged in lazily from a read-only
+    mapping shared through the OS page cache; writing to the tensor
+    copies it first. Files in a non-native byte order are always copied.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(NPY_MAGIC))
+        f.seek(0)
+        if magic == NPY_MAGIC:
+            dtype, shape, fortran, little, offset = _read_npy_header(f)
+        elif magic.startswith(RAW_MAGIC):
+            dtype, shape, offset = _read_raw_header(f)
+            fortran, little = False, True
+        else:
+            raise ValueError(f"Unrecognized tensor file format: {path}")
+
+        count = prod(shape)
+        native = little == (sys.byteorder == "little") or dtype.itemsize == 1
+        if mmap and native and count:
+            mapping = mmap_module.mmap(
+                f.fileno(), 0, access=mmap_module.ACCESS_READ
+            )
+            buffer: Buffer = memoryview(mapping)[
+                offset : offset + count * dtype.itemsize
+            ].cast(dtype.format)  # type: ignore[call-overload]
+        else:
+            f.seek(offset)
+            buffer = array(dtype.typecode)
+            buffer.frombytes(f.read(count * dtype.itemsize))
+            if not native:
+                buffer.byteswap()
+
+    if len(buffer) != count:
+        raise ValueError(f"Tensor file is truncated: {path}")
+    if fortran:
+        strides = tuple(reversed(contiguous_strides(tuple(reversed(shape)))))
+        return Tensor._from_storage(buffer, shape, strides, 0, dtype)
+    return Tensor._from_storage(buffer, shape, dtype=dtype)
+
+
+def save_tensor(tensor: Tensor, path: str | os.PathLike[str]) -> None:
+    """Write a tensor as ``.npy`` if the path says so, else as raw."""
+    dtype = tensor.dtype
+    values = tensor._pack()
+    if sys.byteorder != "little" and dtype.itemsize > 1:
+        values.byteswap()
+
+    if os.fspath(path).endswith(".npy"):
+        header = _npy_header(dtype, tensor.shape)
+    else:
+        header = _raw_header(dtype, tensor.shape)
+    with open(path, "wb") as f:
+        f.write(header)
+        values.tofile(f)
+
+
+def _read_npy_header(
+    f,
+) -> tuple[DType, tuple[int, ...], bool, bool, int]:
+    preamble = f.read(len(NPY_MAGIC) + 2)
+    major = preamble[len(NPY_MAGIC)]
+    if major == 1:
+        (length,) = struct.unpack("<H", f.read(2))
+    elif major in (2, 3):
+        (length,) = struct.unpack("<I", f.read(4))
+    else:
+        raise ValueError(f"Unsupported .npy format version {major}.")
+
+    header = ast.literal_eval(f.read(length).decode("latin1"))
+    descr = header["descr"]
+    if not isinstance(descr, str):
+        raise TypeError(f"Unsupported .npy dtype {descr!r}.")
+    little = descr[0] in "<|" or (
+        descr[0] == "=" and sys.byteorder == "little"
+    )
+    return (
+        DType.from_typestr(descr),
+        tuple(header["shape"]),
+        bool(header["fortran_order"]),
+        little,
+        f.tell(),
+    )
+
+
+def _npy_header(dtype: DType, shape: tuple[int, ...]) -> bytes:
+    descr = dtype.typestr.replace(">", "<")
+    shape_repr = f"({shape[0]},)" if len(shape) == 1 else repr(shape)
+    header = (
+        f"{{'descr': '{descr}', 'fortran_order': False, "
+        + f"'shape': {shape_repr}, }}"
+    ).encode("latin1")
+    # Pad so the data starts on an aligned boundary, ending with "\n".
+    size = len(NPY_MAGIC) + 4 + len(header) + 1
+    header += b" " * (-size % ALIGNMENT) + b"\n"
+    return NPY_MAGIC + bytes([1, 0]) + struct.pack("<H", len(header)) + header
+
+
+def _read_raw_header(f) -> tuple[DType, tuple[int, ...], int]:
+    magic, version, code, ndim = struct.unpack("<4sBBH", f.read(8))
+    if version != RAW_VERSION:
+        raise ValueError(f"Unsupported raw tensor version {version}.")
+    shape = struct.unpack(f"<{ndim}Q", f.read(8 * ndim))
+    return _RAW_CODES[code], shape, _aligned(8 + 8 * ndim)
+
+
+def _raw_header(dtype: DType, shape: tuple[int, ...]) -> bytes:
+    header = struct.pack(
+        f"<4sBBH{len(shape)}Q",
+        RAW_MAGIC,
+        RAW_VERSION,
+        _RAW_CODES.index(dtype),
+        len(shape),
+        *shape,
+    )
+    return header + b"\0" * (_aligned(len(header)) - len(header))
+
+
+def _aligned(size: int) -> int:
+    return size + (-size % ALIGNMENT)
+
+
+def graph_to_bytes(graph: Graph) -> bytes:
+    """Serialize a graph to the xla_lite binary graph format.
+
+    The file holds a header, a node table and an edge table of int32
+    columns, a small tagged encoding of ids, op names, attributes and
+    constant descriptors, then a blob of constant arrays, each aligned
+    to 64 bytes. All numbers are little-endian.
+    """
+    nodes = graph.nodes
+    position = {node.node_id: k for k, node in enumerate(nodes)}
+    ops: dict[str, int] = {}
+    externals: dict[Any, int] = {}
+    table, edges = array("i"), array("i")
+    attrs: dict[int, dict[str, Any]] = {}
+    constants: list[tuple[Any, ...]] = []
+    blob = bytearray()
+
+    for k, node in enumerate(nodes):
+        op = -1 if node.op is None else ops.setdefault(node.op, len(ops))
+        constant = -1
+        if node.tensor is not None:
+            constant = len(constants)
+            constants.append(_put_tensor(node.tensor, blob))
+        table.extend(
+            (
+                op,
+                len(edges),
+                len(node.inputs),
+                constant,
+                _OUTPUT_FLAG if node.is_output else 0,
+            )
+        )
+        for input_id in node.inputs:
+            j = position.get(input_id)
+            if j is None:
+                j = -1 - externals.setdefault(input_id, len(externals))
+            edges.append(j)
+        if node.attrs:
+            attrs[k] = node.attrs
+
+    ids: Any = [node.node_id for node in nodes]
+    # Join string ids, the common case, so loading can split them at once.
+    if all(isinstance(i, str) and "\0" not in i for i in ids):
+        ids = "\0".join(ids)
+    meta = bytearray()
+    _encode((ids, list(ops), attrs, list(externals), constants), meta)
+
+    header_size = (
+        _GRAPH_HEADER.size + 4 * (len(table) + len(edges)) + len(meta)
+    )
+    blob_offset = _aligned(header_size)
+    out = bytearray(
+        _GRAPH_HEADER.pack(
+            GRAPH_MAGIC,
+            GRAPH_VERSION,
+            len(nodes),
+            len(edges),
+            len(meta),
+            blob_offset,
+        )
+    )
+    out += _little(table) + _little(edges) + meta
+    out += b"\0" * (blob_offset - header_size)
+    out += blob
+    return bytes(out)
+
+
+def graph_from_bytes(data: bytes | bytearray | memoryview) -> Graph:
+    """Rebuild a graph written by ``graph_to_bytes``.
+
+    Dense constants are read-only views of ``data``; sparse and
+    quantized constants are copied into their compressed arrays.
+    """
+    return _read_graph(memoryview(data).toreadonly())
+
+
+def save_graph(graph: Graph, path: str | os.PathLike[str]) -> None:
+    with open(path, "wb") as f:
+        f.write(graph_to_bytes(graph))
+
+
+def load_graph(path: str | os.PathLike[str], mmap: bool = True) -> Graph:
+    """Load a graph file, mapping its constants blob with ``mmap``.
+
+    Mapped constants are paged in lazily and shared through the OS page
+    cache; writing to one copies it first.
+    """
+    with open(path, "rb") as f:
+        if not mmap:
+            return graph_from_bytes(f.read())
+        mapping = mmap_module.mmap(
+            f.fileno(), 0, access=mmap_module.ACCESS_READ
+        )
+    return _read_graph(memoryview(mapping))
+
+
+def graph_fingerprint(graph: Graph) -> str:
+    """A hash of the graph's structure that ignores node ids.
+
+    Each node is hashed from its op, attributes, output marking,
+    constant contents and the hashes of its inputs, using the encodings
+    of the binary format. The fingerprint combines the node hashes and
+    use counts in sorted order, so it does not depend on insertion
+    order either. Inputs that are not in the graph are hashed by id.
+    """
+    digests: dict[Any, bytes] = {}
+    uses = Counter(
+        input_id for node in graph.nodes for input_id in node.inputs
+    )
+    for node in graph.topological_sort():
+        meta, blob = bytearray(), bytearray()
+        _encode((node.op, sorted(node.attrs.items()), node.is_output), meta)
+        if node.tensor is not None:
+            _encode(_put_tensor(node.tensor, blob), meta)
+        for input_id in node.inputs:
+            digest = digests.get(input_id)
+            if digest is None:
+                meta += b"?"
+                _encode(input_id, meta)
+            else:
+                meta += b"@" + digest
+        hasher = blake2b(meta, digest_size=16)
+        hasher.update(blob)
+        digests[node.node_id] = hasher.digest()
+
+    fingerprint = blake2b(digest_size=16)
+    for digest, count in sorted(
+        (digest, uses[node_id]) for node_id, digest in digests.items()
+    ):
+        fingerprint.update(digest + struct.pack("<Q", count))
+    return fingerprint.hexdigest()
+
+
+def _read_graph(view: memoryview) -> Graph:
+    if len(view) < _GRAPH_HEADER.size:
+        raise ValueError("Graph data is truncated.")
+    magic, version, count, edge_count, meta_size, blob_offset = (
+        _GRAPH_HEADER.unpack_from(view)
+    )
+    if magic != GRAPH_MAGIC:
+        raise ValueError("Unrecognized graph format.")
+    if version != GRAPH_VERSION:
+        raise ValueError(f"Unsupported graph format version {version}.")
+
+    start = _GRAPH_HEADER.size
+    table = _read_array(view, start, "i", count * _NODE_FIELDS).tolist()
+    start += 4 * len(table)
+    edges = _read_array(view, start, "i", edge_count).tolist()
+    start += 4 * len(edges)
+    try:
+        meta, end = _decode(view[: start + meta_size], start)
+    except (IndexError, struct.error):
+        raise ValueError("Graph data is truncated.") from None
+    if end != start + meta_size or len(view) < blob_offset:
+        raise ValueError("Graph data is truncated.")
+    ids, ops, attrs, externals, constants = meta
+    if isinstance(ids, str):
+        ids = ids.split("\0") if count else []
+    if len(ids) != count:
+        raise ValueError("Corrupt graph data: node ids do not match.")
+
+    graph = Graph()
+    columns = [table[f::_NODE_FIELDS] for f in range(_NODE_FIELDS)]
+    for k, (node_id, op, first, n, constant, flags) in enumerate(
+        zip(ids, *columns)
+    ):
+        node = Node(
+            node_id,
+            tensor=None
+            if constant < 0
+            else _get_tensor(constants[constant], view, blob_offset),
+            op=None if op < 0 else ops[op],
+            inputs=[
+                ids[j] if j >= 0 else externals[-1 - j]
+                for j in edges[first : first + n]
+            ],
+            attrs=attrs.get(k),
+        )
+        node.is_output = bool(flags & _OUTPUT_FLAG)
+        graph.add_node(node)
+    return graph
+
+
+def _put_tensor(tensor: Tensor, blob: bytearray) -> tuple[Any, ...]:
+    """Append a constant's arrays to ``blob`` and describe them."""
+    code = _RAW_CODES.index(tensor.dtype)
+    if isinstance(tensor, QuantizedTensor):
+        return (
+            "quantized",
+            code,
+            tensor.shape,
+            tensor.axis,
+            _put_array(tensor.qvalues, blob),
+            _put_array(tensor.scales, blob),
+            _put_array(tensor.zero_points, blob),
+        )
+    if isinstance(tensor, SparseTensor):
+        csr = tensor.tocsr()
+        return (
+            "csr",
+            code,
+            csr.shape,
+            csr.nnz,
+            _put_array(csr.indptr, blob),
+            _put_array(csr.indices, blob),
+            _put_array(csr.values, blob),
+        )
+    return ("dense", code, tensor.shape, _put_array(tensor._pack(), blob))
+
+
+def _get_tensor(
+    descriptor: tuple[Any, ...], view: memoryview, blob_offset: int
+) -> Tensor:
+    kind, code, shape, *fields = descriptor
+    dtype = _RAW_CODES[code]
+
+    def read(offset: int, fmt: str, count: int) -> Buffer:
+        return _read_array(view, blob_offset + offset, fmt, count)
+
+    if kind == "dense":
+        return Tensor._from_storage(
+            read(fields[0], dtype.format, prod(shape)), shape, dtype=dtype
+        )
+    if kind == "csr":
+        nnz, indptr, indices, values = fields
+        return CSRTensor(
+            read(indptr, "q", shape[0] + 1),
+            read(indices, "q", nnz),
+            read(values, dtype.format, nnz),
+            shape,
+            dtype,
+        )
+    if kind == "quantized":
+        axis, qvalues, scales, zero_points = fields
+        channels = 1 if axis is None else shape[axis]
+        return QuantizedTensor(
+            read(qvalues, "b", prod(shape)),
+            shape,
+            read(scales, "d", channels),
+            read(zero_points, "b", channels),
+            axis,
+            dtype,
+        )
+    raise ValueError(f"Unknown constant kind '{kind}'.")
+
+
+def _put_array(values: array, blob: bytearray) -> int:
+    blob += b"\0" * (-len(blob) % ALIGNMENT)
+    offset = len(blob)
+    blob += _little(values)
+    return offset
+
+
+def _read_array(view: memoryview, offset: int, fmt: str, count: int) -> Buffer:
+    """``count`` items at ``offset``, as a view when the byte order is
+    native and as a byte-swapped copy otherwise."""
+    itemsize = struct.calcsize(fmt)
+    data = view[offset : offset + count * itemsize]
+    if len(data) != count * itemsize:
+        raise ValueError("Graph data is truncated.")
+    if sys.byteorder == "little" or itemsize == 1:
+        return data.cast(fmt)  # type: ignore[call-overload]
+    copied = array(fmt.replace("?", "b"))
+    copied.frombytes(data)
+    copied.byteswap()
+    return copied
+
+
+def _little(values: array) -> bytes:
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+# Tags of the metadata encoding.
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _TUPLE, _LIST, _DICT = b"NTFifstld"
+_CONSTANTS = {_NONE: None, _TRUE: True, _FALSE: False}
+_NUMBERS = {_INT: "<q", _FLOAT: "<d"}
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    """Append a tagged encoding of plain Python values to ``out``."""
+    if value is None or isinstance(value, bool):
+        out.append({None: _NONE, True: _TRUE, False: _FALSE}[value])
+    elif isinstance(value, (int, float)):
+        tag = _INT if isinstance(value, int) else _FLOAT
+        try:
+            out += bytes([tag]) + struct.pack(_NUMBERS[tag], value)
+        except struct.error:
+            raise ValueError(
+                f"Integer {value} does not fit in 64 bits."
+            ) from None
+    elif isinstance(value, str):
+        data = value.encode()
+        out.append(_STR)
+        out += struct.pack("<I", len(data)) + data
+    elif isinstance(value, (tuple, list)):
+        out.append(_TUPLE if isinstance(value, tuple) else _LIST)
+        out += struct.pack("<I", len(value))
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        out += struct.pack("<I", len(value))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    else:
+        raise TypeError(
+            f"Cannot serialize a value of type {type(value).__name__}."
+        )
+
+
+def _decode(data: memoryview, pos: int) -> tuple[Any, int]:
+    """Decode one value at ``pos``, returning it and the next position.
+
+    Reading past the end raises ``IndexError`` or ``struct.error``.
+    """
+    tag = data[pos]
+    pos += 1
+    if tag in _CONSTANTS:
+        return _CONSTANTS[tag], pos
+    if tag in _NUMBERS:
+        return struct.unpack_from(_NUMBERS[tag], data, pos)[0], pos + 8
+    (size,) = struct.unpack_from("<I", data, pos)
+    pos += 4
+    if tag == _STR:
+        if pos + size > len(data):
+            raise IndexError(pos + size)
+        return bytes(data[pos : pos + size]).decode(), pos + size
+    if tag == _DICT:
+        items = {}
+        for _ in range(size):
+            key, pos = _decode(data, pos)
+            items[key], pos = _decode(data, pos)
+        return items, pos
+    if tag in (_TUPLE, _LIST):
+        values = []
+        for _ in range(size):
+            value, pos = _decode(data, pos)
+            values.append(value)
+        return (tuple(values) if tag == _TUPLE else values), pos
+    raise ValueError(f"Corrupt graph data: unknown tag {tag!r}.")
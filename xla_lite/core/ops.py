@@ -1,72 +1,158 @@
 from __future__ import annotations
 
+import math
+import operator
 from abc import ABC, abstractmethod
+from functools import reduce
+from itertools import chain, repeat
 from numbers import Number
 from typing import (
     Any,
     Callable,
+    Iterable,
+    Iterator,
     Literal,
     Sequence,
     TypeVar,
-    cast,
     overload,
 )
 
-from xla_lite.core.tensor import Data, Tensor
+from xla_lite.core.dtype import (
+    DType,
+    arithmetic_type,
+    division_type,
+    promote_types,
+)
+from xla_lite.core.einsum import Strategy, contraction_plan
+from xla_lite.core.parallel import parallel_matmul
+from xla_lite.core.quantized import QuantizedTensor
+from xla_lite.core.sparse import (
+    SparseTensor,
+    dense_matmul_sparse,
+    sparse_combine,
+    sparse_matmul_dense,
+    sparse_matmul_sparse,
+    sparse_scale,
+)
+from xla_lite.core.tensor import Tensor, broadcast_shapes
 
 T = TypeVar("T", bound=int | float | Sequence[Any])
 
 
 class Operation(ABC):
+    """A kernel; subclasses fix the arity and any static arguments."""
+
     @abstractmethod
-    def __call__(self, a: Tensor, b: Tensor) -> Tensor:
+    def __call__(self, *args: Any, **kwargs: Any) -> Tensor:
         pass
 
 
+def validate_out(out: Tensor, shape: tuple[int, ...], dtype: DType) -> None:
+    """Check that a result of ``shape`` and ``dtype`` fits in ``out``."""
+    if out.shape != shape:
+        raise ValueError(
+            f"Output shape {out.shape} does not match the result shape "
+            + f"{shape}."
+        )
+    if promote_types(dtype, out.dtype) is not out.dtype:
+        raise TypeError(
+            f"Cannot store a {dtype.value} result in a {out.dtype.value} "
+            + "output."
+        )
+
+
+def _emit(
+    values: Iterable[Any],
+    shape: tuple[int, ...],
+    dtype: DType,
+    out: Tensor | None,
+) -> Tensor:
+    """Pack a kernel's row-major output into ``out`` or a new tensor."""
+    if out is None:
+        return Tensor._from_values(values, shape, dtype)
+    validate_out(out, shape, dtype)
+    out._write(values)
+    return out
+
+
+def _store(result: Tensor, out: Tensor | None) -> Tensor:
+    """Copy a result computed by a sparse kernel into ``out``, if given."""
+    if out is None:
+        return result
+    return _emit(result._values(), result.shape, result.dtype, out)
+
+
 class ElementWiseOperation(Operation):
-    def __call__(self, a: Tensor, b: Tensor) -> Tensor:
-        if a.is_scalar() and not b.is_scalar() and b.shape is not None:
-            a = Tensor(
-                self._broadcast_scalar(cast(int | float, a.data), b.shape)
-            )
-        elif b.is_scalar() and not a.is_scalar() and a.shape is not None:
-            b = Tensor(
-                self._broadcast_scalar(cast(int | float, b.data), a.shape)
-            )
-
-        if a.shape != b.shape:
-            op_name = self.__class__.__name__.lower()
-            if op_name in ("add", "subtract"):
-                if a.is_matrix() and b.is_matrix():
-                    raise ValueError(
-                        "Matrices and vectors must have the same dimensions "
-                        + "for addition or subtraction."
-                    )
-                elif a.is_vector() and b.is_vector():
-                    raise ValueError(
-                        "Vectors must be of the same length for addition or "
-                        + "subtraction."
-                    )
-            else:
-                raise ValueError(
-                    f"Incompatible shapes for {op_name}: {a.shape} and "
-                    + f"{b.shape}."
+    name: str
+
+    def __call__(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        try:
+            shape = broadcast_shapes(a.shape, b.shape)
+        except ValueError:
+            raise self._shape_error(a, b) from None
+
+        sparse = isinstance(a, SparseTensor) or isinstance(b, SparseTensor)
+        if sparse and (a.shape == b.shape or a.is_scalar() or b.is_scalar()):
+            result = self.operate_sparse(a, b)
+            if result is not None:
+                return _store(result, out)
+
+        # Broadcast operands are zero-stride views, never expanded copies.
+        if a.shape != shape:
+            a = a.broadcast_to(shape)
+        if b.shape != shape:
+            b = b.broadcast_to(shape)
+        return self.operate(a, b, out)
+
+    def _shape_error(self, a: Tensor, b: Tensor) -> ValueError:
+        if self.name in ("add", "subtract"):
+            if a.is_matrix() and b.is_matrix():
+                return ValueError(
+                    "Matrices and vectors must have the same dimensions "
+                    + "for addition or subtraction."
                 )
-        return self.operate(a, b)
+            elif a.is_vector() and b.is_vector():
+                return ValueError(
+                    "Vectors must be of the same length for addition or "
+                    + "subtraction."
+                )
+        return ValueError(
+            f"Incompatible shapes for {self.name}: {a.shape} and {b.shape}."
+        )
 
     @abstractmethod
-    def operate(self, a: Tensor, b: Tensor) -> Tensor:
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
         pass
 
-    def _broadcast_scalar(
-        self, scalar: int | float, shape: tuple[int, ...]
-    ) -> Data:
-        if len(shape) == 1:
-            return [scalar] * shape[0]
-        elif len(shape) == 2:
-            return [[scalar] * shape[1] for _ in range(shape[0])]
+    def operate_sparse(self, a: Tensor, b: Tensor) -> Tensor | None:
+        """Compute the result from sparse storage, or return ``None``.
+
+        Called when either operand is sparse. Returning ``None`` falls
+        back to ``operate`` on the densified operands.
+        """
+        return None
+
+    @staticmethod
+    def _combine(
+        a: Tensor,
+        b: Tensor,
+        op: Callable[[Any, Any], Any],
+        dtype: DType,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if a.is_contiguous() and b.is_contiguous():
+            values: Iterable[Any] = map(op, a._values(), b._values())
         else:
-            raise ValueError("Unsupported shape for broadcasting")
+            # Walk strided and broadcast operands one innermost row at a
+            # time instead of flattening them into full-size temporaries.
+            values = chain.from_iterable(
+                map(map, repeat(op), a._rows(), b._rows())
+            )
+        return _emit(values, a.shape, dtype, out)
 
     @overload
     def element_wise_operation(
@@ -98,81 +184,231 @@ class ElementWiseOperation(Operation):
 
 
 class Add(ElementWiseOperation):
-    def operate(self, a: Tensor, b: Tensor) -> Tensor:
-        result = self._element_wise_add(a.data, b.data)
-        return Tensor(result)
+    name = "add"
 
-    def _element_wise_add(self, a: Data, b: Data) -> Data:
-        if isinstance(a, Number) and isinstance(b, Number):
-            return a + b
-        elif isinstance(a, Sequence) and isinstance(b, Sequence):
-            return [self._element_wise_add(x, y) for x, y in zip(a, b)]
-        else:
-            raise TypeError("Unsupported types for addition")
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return self._combine(
+            a, b, operator.add, arithmetic_type(a.dtype, b.dtype), out
+        )
+
+    def operate_sparse(self, a: Tensor, b: Tensor) -> Tensor | None:
+        if isinstance(a, SparseTensor) and isinstance(b, SparseTensor):
+            dtype = arithmetic_type(a.dtype, b.dtype)
+            return sparse_combine(a, b, operator.add, dtype, union=True)
+        return None
 
 
 class Subtract(ElementWiseOperation):
-    def operate(self, a: Tensor, b: Tensor) -> Tensor:
-        result = self._element_wise_subtract(a.data, b.data)
-        return Tensor(result)
+    name = "subtract"
 
-    def _element_wise_subtract(self, a: Data, b: Data) -> Data:
-        if isinstance(a, Number) and isinstance(b, Number):
-            return a - b
-        elif isinstance(a, Sequence) and isinstance(b, Sequence):
-            return [self._element_wise_subtract(x, y) for x, y in zip(a, b)]
-        else:
-            raise TypeError("Unsupported types for subtraction")
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return self._combine(
+            a, b, operator.sub, arithmetic_type(a.dtype, b.dtype), out
+        )
+
+    def operate_sparse(self, a: Tensor, b: Tensor) -> Tensor | None:
+        if isinstance(a, SparseTensor) and isinstance(b, SparseTensor):
+            dtype = arithmetic_type(a.dtype, b.dtype)
+            return sparse_combine(a, b, operator.sub, dtype, union=True)
+        return None
 
 
 class Multiply(ElementWiseOperation):
-    def operate(self, a: Tensor, b: Tensor) -> Tensor:
-        result = self._element_wise_multiply(a.data, b.data)
-        return Tensor(result)
+    name = "multiply"
 
-    def _element_wise_multiply(self, a: Data, b: Data) -> Data:
-        if isinstance(a, Number) and isinstance(b, Number):
-            return a * b
-        elif isinstance(a, Sequence) and isinstance(b, Sequence):
-            return [self._element_wise_multiply(x, y) for x, y in zip(a, b)]
-        else:
-            raise TypeError("Unsupported types for multiplication")
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return self._combine(
+            a, b, operator.mul, arithmetic_type(a.dtype, b.dtype), out
+        )
+
+    def operate_sparse(self, a: Tensor, b: Tensor) -> Tensor | None:
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        if isinstance(a, SparseTensor) and isinstance(b, SparseTensor):
+            return sparse_combine(a, b, operator.mul, dtype, union=False)
+        # The product is zero wherever the sparse operand is.
+        if isinstance(a, SparseTensor):
+            return sparse_scale(a, b, operator.mul, dtype)
+        assert isinstance(b, SparseTensor)
+        return sparse_scale(b, a, operator.mul, dtype)
 
 
 class Divide(ElementWiseOperation):
-    def operate(self, a: Tensor, b: Tensor) -> Tensor:
-        result = self._element_wise_divide(a.data, b.data)
-        return Tensor(result)
+    name = "divide"
+
+    def operate(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        return self._combine(
+            a, b, _true_divide, division_type(a.dtype, b.dtype), out
+        )
+
+    def operate_sparse(self, a: Tensor, b: Tensor) -> Tensor | None:
+        # Only division by a nonzero scalar keeps the zeros zero.
+        if isinstance(a, SparseTensor) and b.is_scalar() and b.item() != 0:
+            dtype = division_type(a.dtype, b.dtype)
+            return sparse_scale(a, b, _true_divide, dtype)
+        return None
+
+
+def _true_divide(x: int | float, y: int | float) -> float:
+    return x / y if y != 0 else float("inf")
+
+
+def blocked_matmul(
+    a_rows: Sequence[Sequence[int | float]],
+    b_columns: Sequence[Sequence[int | float]],
+    block_size: int,
+) -> list[Any]:
+    """Multiply rows of A by packed columns of B, tile by tile.
+
+    Returns the product in row-major order.
+    """
+    m, n = len(a_rows), len(b_columns)
+    result: list[Any] = [0] * (m * n)
+    for j0 in range(0, n, block_size):
+        columns = b_columns[j0 : j0 + block_size]
+        for i0 in range(0, m, block_size):
+            for i in range(i0, min(i0 + block_size, m)):
+                row = a_rows[i]
+                start = i * n + j0
+                result[start : start + len(columns)] = [
+                    sum(map(operator.mul, row, column)) for column in columns
+                ]
+    return result
+
+
+def strassen_matmul(
+    a: list[list[Any]],
+    b: list[list[Any]],
+    cutoff: int,
+    block_size: int,
+) -> list[list[Any]]:
+    """Multiply row-major matrices with the Strassen-Winograd recursion.
+
+    Each level trades one of eight half-size products for 15 additions.
+    Once any dimension is at most ``cutoff`` the blocked classical
+    kernel takes over. Odd dimensions are padded with a zero row or
+    column for that level only, and the padding is dropped again from
+    the result.
+    """
+    m, k, n = len(a), len(b), len(b[0]) if b else 0
+    if min(m, k, n) <= cutoff:
+        flat = blocked_matmul(a, list(zip(*b)), block_size)
+        return [flat[i * n : (i + 1) * n] for i in range(m)]
+
+    if m % 2 or k % 2 or n % 2:
+        a = _pad(a, m % 2, k % 2)
+        b = _pad(b, k % 2, n % 2)
+        result = strassen_matmul(a, b, cutoff, block_size)
+        return [row[:n] for row in result[:m]]
+
+    a11, a12, a21, a22 = _quadrants(a)
+    b11, b12, b21, b22 = _quadrants(b)
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+
+    m1 = strassen_matmul(a11, b11, cutoff, block_size)
+    m2 = strassen_matmul(a12, b21, cutoff, block_size)
+    m3 = strassen_matmul(s4, b22, cutoff, block_size)
+    m4 = strassen_matmul(a22, t4, cutoff, block_size)
+    m5 = strassen_matmul(s1, t1, cutoff, block_size)
+    m6 = strassen_matmul(s2, t2, cutoff, block_size)
+    m7 = strassen_matmul(s3, t3, cutoff, block_size)
+
+    u2 = _add(m1, m6)
+    u3 = _add(u2, m7)
+    c11 = _add(m1, m2)
+    c12 = _add(_add(u2, m5), m3)
+    c21 = _sub(u3, m4)
+    c22 = _add(u3, m5)
+    return [left + right for left, right in zip(c11, c12)] + [
+        left + right for left, right in zip(c21, c22)
+    ]
+
+
+def _quadrants(
+    x: list[list[Any]],
+) -> tuple[list[list[Any]], ...]:
+    h, w = len(x) // 2, len(x[0]) // 2
+    top, bottom = x[:h], x[h:]
+    return (
+        [row[:w] for row in top],
+        [row[w:] for row in top],
+        [row[:w] for row in bottom],
+        [row[w:] for row in bottom],
+    )
 
-    def _element_wise_divide(self, a: Data, b: Data) -> Data:
-        if isinstance(a, Number) and isinstance(b, Number):
-            return a / b if b != 0 else float("inf")
-        elif isinstance(a, Sequence) and isinstance(b, Sequence):
-            return [self._element_wise_divide(x, y) for x, y in zip(a, b)]
-        else:
-            raise TypeError("Unsupported types for division")
+
+def _pad(x: list[list[Any]], rows: int, cols: int) -> list[list[Any]]:
+    padded = [row + [0] * cols for row in x] if cols else x
+    return padded + [[0] * len(padded[0])] * rows
+
+
+def _add(x: list[list[Any]], y: list[list[Any]]) -> list[list[Any]]:
+    return [list(map(operator.add, r, s)) for r, s in zip(x, y)]
+
+
+def _sub(x: list[list[Any]], y: list[list[Any]]) -> list[list[Any]]:
+    return [list(map(operator.sub, r, s)) for r, s in zip(x, y)]
 
 
 class MatrixMultiply(Operation):
-    def __call__(self, a: Tensor, b: Tensor) -> Tensor:
+    # Rows of A and packed columns of B are processed in square tiles of
+    # this many, so a tile of B is reused while it is still hot.
+    block_size = 64
+    # With more than one worker, products of at least this many
+    # multiply-adds are split by rows across a process pool.
+    parallel_threshold = 1 << 21
+    # Roughly square products whose dimensions all exceed this use the
+    # Strassen-Winograd recursion down to this size; None disables it.
+    strassen_cutoff: int | None = 128
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = workers
+
+    def __call__(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
         if a.shape is None or b.shape is None:
             raise ValueError(
                 "Tensors must have defined shapes for matrix multiplication."
             )
 
+        if a.ndim == 3 or b.ndim == 3:
+            return self.batch_multiply(a, b, out)
+        if (
+            isinstance(a, QuantizedTensor) or isinstance(b, QuantizedTensor)
+        ) and a.ndim == b.ndim == 2:
+            return self.quantized_multiply(a, b, out)
+        if isinstance(a, SparseTensor) or isinstance(b, SparseTensor):
+            return _store(self.sparse_multiply(a, b), out)
         if a.is_matrix() and b.is_matrix():
-            return self.matrix_multiply(a, b)
+            return self.matrix_multiply(a, b, out)
         elif a.is_matrix() and b.is_vector():
-            return self.matrix_vector_multiply(a, b)
+            return self.matrix_vector_multiply(a, b, out)
         elif a.is_vector() and b.is_matrix():
-            return self.vector_matrix_multiply(a, b)
+            return self.vector_matrix_multiply(a, b, out)
         else:
             raise TypeError(
                 "Matrix multiplication is only supported for matrices and "
                 + "vectors with compatible dimensions."
             )
 
-    def matrix_multiply(self, a: Tensor, b: Tensor) -> Tensor:
+    def matrix_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
         assert a.shape is not None and b.shape is not None
         if a.shape[1] != b.shape[0]:
             raise ValueError(
@@ -180,21 +416,170 @@ class MatrixMultiply(Operation):
                 + "rows in the second matrix."
             )
 
-        result: list[list[float]] = []
-        for i in range(a.shape[0]):
-            row: list[float] = []
-            for j in range(b.shape[1]):
-                sum_product = sum(
-                    float(cast(Sequence[Any], a.data)[i][k])
-                    * float(cast(Sequence[Any], b.data)[k][j])
-                    for k in range(a.shape[1])
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        result = self._product(a, b, dtype)
+        return _emit(result, (a.shape[0], b.shape[1]), dtype, out)
+
+    def batch_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        """Multiply stacks of matrices over a leading batch dimension.
+
+        Either operand may be a single matrix, or a batch of one, that
+        is shared by every matrix of the other.
+        """
+        shape = self._batch_shape(a, b)
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        k, batch = a.shape[-1], shape[0]
+        if b.ndim == 2 or b.shape[0] == 1:
+            # A shared weight matrix turns the batch into a single tall
+            # product, so B is packed only once.
+            weights = b if b.ndim == 2 else b[0]
+            stacked = (
+                a.reshape(math.prod(a.shape[:-1]), k) if a.ndim == 3 else a
+            )
+            result: Iterable[Any] = self._product(stacked, weights, dtype)
+        else:
+            result = chain.from_iterable(
+                self._product(
+                    a if a.ndim == 2 else a[i % a.shape[0]], b[i], dtype
                 )
-                row.append(sum_product)
-            result.append(row)
+                for i in range(batch)
+            )
+        return _emit(result, shape, dtype, out)
+
+    def _product(self, a: Tensor, b: Tensor, dtype: DType) -> Iterable[Any]:
+        """The row-major product of two matrices, in parallel if large."""
+        (m, k), n = a.shape, b.shape[1]
+        if self.workers > 1 and m > 1 and m * k * n >= self.parallel_threshold:
+            b_columns = b.dtype.pack(
+                v for column in self._pack_columns(b) for v in column
+            )
+            return parallel_matmul(
+                a._pack(),
+                b_columns,
+                (m, k, n),
+                dtype,
+                min(self.workers, m),
+                self.block_size,
+            )
+        if self._use_strassen(m, k, n):
+            assert self.strassen_cutoff is not None
+            rows = strassen_matmul(
+                [list(row) for row in self._pack_rows(a)],
+                [list(row) for row in self._pack_rows(b)],
+                self.strassen_cutoff,
+                self.block_size,
+            )
+            return chain.from_iterable(rows)
+        return blocked_matmul(
+            self._pack_rows(a), self._pack_columns(b), self.block_size
+        )
 
-        return Tensor(cast(Data, result))
+    def _use_strassen(self, m: int, k: int, n: int) -> bool:
+        cutoff = self.strassen_cutoff
+        smallest = min(m, k, n)
+        # Skewed shapes waste most of each recursion level on padding.
+        return (
+            cutoff is not None
+            and smallest > cutoff
+            and max(m, k, n) <= 2 * smallest
+        )
 
-    def matrix_vector_multiply(self, a: Tensor, b: Tensor) -> Tensor:
+    @staticmethod
+    def _batch_shape(a: Tensor, b: Tensor) -> tuple[int, ...]:
+        if a.ndim not in (2, 3) or b.ndim not in (2, 3):
+            raise TypeError(
+                "Batched matrix multiplication is only supported for "
+                + "tensors of rank 2 or 3."
+            )
+        if a.shape[-1] != b.shape[-2]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        try:
+            batch = broadcast_shapes(a.shape[:-2], b.shape[:-2])
+        except ValueError:
+            raise ValueError(
+                f"Batch sizes of {a.shape} and {b.shape} do not match."
+            ) from None
+        return batch + (a.shape[-2], b.shape[-1])
+
+    def quantized_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
+        """Multiply int8 values with int32 accumulation.
+
+        A float operand is quantized per tensor on the fly. With
+        ``A = sa * (qa - za)`` and ``B = sb * (qb - zb)``, each output
+        is ``sa * sb * (sum(qa * qb) - zb * sum(qa) - za * sum(qb) +
+        k * za * zb)``, so the integer dot products run untouched and
+        every output is dequantized once. This needs A's parameters per
+        row and B's per column (or per tensor); other layouts are
+        dequantized and multiplied as floats.
+        """
+        if a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        qa, qb = (
+            x
+            if isinstance(x, QuantizedTensor)
+            else QuantizedTensor.quantize(x)
+            for x in (a, b)
+        )
+        if qa.axis not in (None, 0) or qb.axis not in (None, 1):
+            return self.matrix_multiply(qa.dequantize(), qb.dequantize(), out)
+        dtype = reduce(
+            promote_types,
+            (x.dtype for x in (a, b) if x.dtype.is_floating),
+        )
+
+        (m, k), n = a.shape, b.shape[1]
+        rows = [qa.qvalues[i * k : (i + 1) * k] for i in range(m)]
+        columns = [qb.qvalues[j::n] for j in range(n)]
+        # Stored as int32, wrapping like a fixed-width accumulator.
+        acc = DType.INT32.pack(
+            blocked_matmul(rows, columns, self.block_size), wrap=True
+        )
+        sa, za = qa.channel_params(0)
+        sb, zb = qb.channel_params(1)
+        row_sums = [sum(row) for row in rows]
+        column_sums = [sum(column) for column in columns]
+        values = (
+            sa[i]
+            * sb[j]
+            * (
+                acc[i * n + j]
+                - zb[j] * row_sums[i]
+                - za[i] * column_sums[j]
+                + k * za[i] * zb[j]
+            )
+            for i in range(m)
+            for j in range(n)
+        )
+        return _emit(values, (m, n), dtype, out)
+
+    def sparse_multiply(self, a: Tensor, b: Tensor) -> Tensor:
+        if a.ndim != 2 or b.ndim != 2 or a.shape[1] != b.shape[0]:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+
+        dtype = arithmetic_type(a.dtype, b.dtype)
+        if isinstance(a, SparseTensor) and isinstance(b, SparseTensor):
+            return sparse_matmul_sparse(a, b, dtype)
+        if isinstance(a, SparseTensor):
+            return sparse_matmul_dense(a, b, dtype)
+        assert isinstance(b, SparseTensor)
+        return dense_matmul_sparse(a, b, dtype)
+
+    def matrix_vector_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
         assert a.shape is not None and b.shape is not None
         if a.shape[1] != b.shape[0]:
             raise ValueError(
@@ -202,17 +587,17 @@ class MatrixMultiply(Operation):
                 + "for multiplication."
             )
 
+        vector = b._values()
         result = [
-            sum(
-                float(cast(Sequence[Any], a.data)[i][j])
-                * float(cast(Sequence[Any], b.data)[j][0])
-                for j in range(a.shape[1])
-            )
-            for i in range(a.shape[0])
+            sum(map(operator.mul, row, vector)) for row in self._pack_rows(a)
         ]
-        return Tensor(cast(Data, result))
+        return _emit(
+            result, (a.shape[0],), arithmetic_type(a.dtype, b.dtype), out
+        )
 
-    def vector_matrix_multiply(self, a: Tensor, b: Tensor) -> Tensor:
+    def vector_matrix_multiply(
+        self, a: Tensor, b: Tensor, out: Tensor | None = None
+    ) -> Tensor:
         assert a.shape is not None and b.shape is not None
         if a.shape[1] != b.shape[0]:
             raise ValueError(
@@ -220,29 +605,618 @@ class MatrixMultiply(Operation):
                 + "for multiplication."
             )
 
+        n = b.shape[1]
+        vector = a._values()
         result = [
-            sum(
-                float(cast(Sequence[Any], a.data)[0][i])
-                * float(cast(Sequence[Any], b.data)[i][j])
-                for i in range(b.shape[0])
+            sum(map(operator.mul, vector, column))
+            for column in self._pack_columns(b)
+        ]
+        return _emit(result, (1, n), arithmetic_type(a.dtype, b.dtype), out)
+
+    @staticmethod
+    def _pack_rows(a: Tensor) -> list[Sequence[int | float]]:
+        """Split A into its rows, each a contiguous slice of storage."""
+        m, k = a.shape
+        values = a._values()
+        return [values[i * k : (i + 1) * k] for i in range(m)]
+
+    @staticmethod
+    def _pack_columns(b: Tensor) -> list[Sequence[int | float]]:
+        """Pack B transposed, so every column is read as a contiguous row."""
+        n = b.shape[1]
+        values = b._values()
+        return [values[j::n] for j in range(n)]
+
+
+def _exp(x: int | float) -> float:
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return float("inf")
+
+
+def _relu(x: int | float) -> int | float:
+    return x if x > 0 else 0
+
+
+class UnaryOperation(Operation):
+    name: str
+    # Applied to one element at a time; also used by fused kernels.
+    function: Callable[[Any], Any]
+
+    def __call__(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        return self.operate(a, out)
+
+    @abstractmethod
+    def result_type(self, dtype: DType) -> DType:
+        pass
+
+    def operate(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        fn = self.function
+        if a.is_contiguous():
+            values: Iterable[Any] = map(fn, a._values())
+        else:
+            values = chain.from_iterable(map(map, repeat(fn), a._rows()))
+        return _emit(values, a.shape, self.result_type(a.dtype), out)
+
+
+class Exp(UnaryOperation):
+    name = "exp"
+    function = staticmethod(_exp)
+
+    def result_type(self, dtype: DType) -> DType:
+        return division_type(dtype, dtype)
+
+
+class Relu(UnaryOperation):
+    name = "relu"
+    function = staticmethod(_relu)
+
+    def result_type(self, dtype: DType) -> DType:
+        return arithmetic_type(dtype, dtype)
+
+
+class Negative(UnaryOperation):
+    name = "negative"
+    function = staticmethod(operator.neg)
+
+    def result_type(self, dtype: DType) -> DType:
+        return arithmetic_type(dtype, dtype)
+
+
+class Reduction(Operation):
+    """Reduce over one axis, or over every element when ``axis`` is None.
+
+    Each output element is computed in one pass over its input row: the
+    reduced axis is moved last with a transposed view, so every
+    innermost row of that view is exactly one reduction group.
+    """
+
+    name: str
+
+    def __call__(
+        self,
+        a: Tensor,
+        axis: int | None = None,
+        keepdims: bool = False,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if axis is None:
+            shape = (1,) * a.ndim if keepdims else ()
+        else:
+            axis = a._normalize_axis(axis, a.ndim)
+            shape = (
+                a.shape[:axis]
+                + ((1,) if keepdims else ())
+                + (a.shape[axis + 1 :])
+            )
+        return self.reduce(a, axis, shape, out)
+
+    @abstractmethod
+    def result_type(self, dtype: DType) -> DType:
+        pass
+
+    @abstractmethod
+    def combine(self, values: Sequence[int | float]) -> int | float:
+        pass
+
+    def reduce(
+        self,
+        a: Tensor,
+        axis: int | None,
+        shape: tuple[int, ...],
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if axis is None:
+            groups: Iterable[Sequence[int | float]] = [a._values()]
+        else:
+            axes = [i for i in range(a.ndim) if i != axis] + [axis]
+            groups = a.transpose(*axes)._rows()
+        values = map(self.combine, groups)
+        return _emit(values, shape, self.result_type(a.dtype), out)
+
+
+class Sum(Reduction):
+    name = "sum"
+
+    def result_type(self, dtype: DType) -> DType:
+        return arithmetic_type(dtype, dtype)
+
+    def combine(self, values: Sequence[int | float]) -> int | float:
+        return sum(values)
+
+
+class Mean(Reduction):
+    name = "mean"
+
+    def result_type(self, dtype: DType) -> DType:
+        return division_type(dtype, dtype)
+
+    def combine(self, values: Sequence[int | float]) -> int | float:
+        return sum(values) / len(values) if len(values) else float("nan")
+
+
+class Max(Reduction):
+    name = "max"
+
+    def result_type(self, dtype: DType) -> DType:
+        return dtype
+
+    def combine(self, values: Sequence[int | float]) -> int | float:
+        if not len(values):
+            raise ValueError("Cannot take the max of an empty tensor.")
+        return max(values)
+
+
+class Linear(Operation):
+    """``activation(x @ weight + bias)`` as one kernel.
+
+    The bias and activation are applied to each row of the product as
+    it is produced, so the biased intermediate is never materialized.
+    Products below the Strassen and parallel thresholds are also
+    computed one tile of ``block_size`` rows at a time, so the bare
+    product never exists either. ``x`` may be a batch of matrices
+    sharing ``weight``; ``activation`` names any unary operation.
+    Operands the fused loop does not cover, such as sparse or batched
+    weights, fall back to the separate kernels.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        self.matmul = MatrixMultiply(workers)
+
+    def __call__(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None = None,
+        activation: str | None = None,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        unary = get_activation(activation) if activation else None
+        if (
+            x.ndim not in (2, 3)
+            or weight.ndim != 2
+            or isinstance(x, SparseTensor)
+            or isinstance(weight, SparseTensor)
+            or isinstance(weight, QuantizedTensor)
+        ):
+            return _store(self._unfused(x, weight, bias, unary), out)
+
+        k, n = weight.shape
+        if x.shape[-1] != k:
+            raise ValueError(
+                "Number of columns in the first matrix must equal number of "
+                + "rows in the second matrix."
+            )
+        shape = x.shape[:-1] + (n,)
+        dtype = arithmetic_type(x.dtype, weight.dtype)
+        bias_rows: Iterable[Sequence[Any]] = repeat([0] * n)
+        if bias is not None:
+            if broadcast_shapes(bias.shape, shape) != shape:
+                return _store(self._unfused(x, weight, bias, unary), out)
+            dtype = arithmetic_type(dtype, bias.dtype)
+            bias_rows = bias.broadcast_to(*shape)._rows()
+
+        fn = unary.function if unary else None
+        values = self._rows(
+            self._chunks(x.reshape(math.prod(x.shape[:-1]), k), weight, dtype),
+            n,
+            bias_rows,
+            fn,
+        )
+        if unary is not None:
+            dtype = unary.result_type(dtype)
+        return _emit(values, shape, dtype, out)
+
+    def _chunks(
+        self, x: Tensor, weight: Tensor, dtype: DType
+    ) -> Iterator[Sequence[Any]]:
+        """Row-major pieces of ``x @ weight``, each a whole number of rows."""
+        (m, k), n = x.shape, weight.shape[1]
+        matmul = self.matmul
+        if matmul._use_strassen(m, k, n) or (
+            matmul.workers > 1
+            and m > 1
+            and m * k * n >= matmul.parallel_threshold
+        ):
+            yield list(matmul._product(x, weight, dtype))
+            return
+        rows = matmul._pack_rows(x)
+        columns = matmul._pack_columns(weight)
+        for i0 in range(0, m, matmul.block_size):
+            yield blocked_matmul(
+                rows[i0 : i0 + matmul.block_size], columns, matmul.block_size
             )
-            for j in range(b.shape[1])
+
+    @staticmethod
+    def _rows(
+        chunks: Iterable[Sequence[Any]],
+        n: int,
+        bias_rows: Iterable[Sequence[Any]],
+        fn: Callable[[Any], Any] | None,
+    ) -> Iterator[Any]:
+        bias_rows = iter(bias_rows)
+        for chunk in chunks:
+            for start in range(0, len(chunk), n or 1):
+                row: Iterable[Any] = map(
+                    operator.add, chunk[start : start + n], next(bias_rows)
+                )
+                yield from row if fn is None else map(fn, row)
+
+    def _unfused(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None,
+        unary: UnaryOperation | None,
+    ) -> Tensor:
+        result = self.matmul(x, weight)
+        if bias is not None:
+            result = OPERATIONS["add"](result, bias)
+        return result if unary is None else unary(result)
+
+
+class Einsum(Operation):
+    """Evaluate an einsum equation two operands at a time.
+
+    The order comes from ``core.einsum.contraction_plan``. Each pairwise
+    step is lowered to the existing kernels: subscripts shared by both
+    operands and still needed later become a batch dimension, those
+    needed by neither are contracted, and the operands are transposed
+    and reshaped into a (batched) matmul, or a broadcast multiply when
+    nothing is contracted. Subscripts used by a single operand only are
+    summed out before it takes part in any product.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        self.matmul = MatrixMultiply(workers)
+
+    def __call__(
+        self,
+        *operands: Tensor,
+        equation: str,
+        strategy: Strategy = "auto",
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if not operands:
+            raise ValueError("einsum requires at least one operand.")
+        plan = contraction_plan(
+            equation, tuple(a.shape for a in operands), strategy
+        )
+        dtype = reduce(
+            arithmetic_type, (a.dtype for a in operands), operands[0].dtype
+        )
+        work = [
+            (a.to_dense() if isinstance(a, SparseTensor) else a, subscripts)
+            for a, subscripts in zip(operands, plan.inputs)
         ]
-        return Tensor(cast(Data, [result]))
+        for i, j in plan.path:
+            (a, sa), (b, sb) = work[i], work[j]
+            del work[j], work[i]
+            keep = set(plan.output).union(*(s for _, s in work))
+            work.append(self._contract(a, sa, b, sb, keep, dtype))
+
+        [(result, subscripts)] = work
+        result, subscripts = self._reduce(result, subscripts, set(plan.output))
+        result = self._permute(result, subscripts, plan.output)
+        if result.dtype is not dtype:
+            result = result.astype(dtype)
+        elif result._shared or any(result is a for a in operands):
+            # An operand itself, for an identity equation, or a view of
+            # one, e.g. from a plain transpose.
+            result = result.copy()
+        return _store(result, out)
+
+    def _contract(
+        self,
+        a: Tensor,
+        sa: str,
+        b: Tensor,
+        sb: str,
+        keep: set[str],
+        dtype: DType,
+    ) -> tuple[Tensor, str]:
+        a, sa = self._reduce(a, sa, keep | set(sb))
+        b, sb = self._reduce(b, sb, keep | set(sa))
+        batch = "".join(c for c in sa if c in sb and c in keep)
+        contracted = "".join(c for c in sa if c in sb and c not in keep)
+        left = "".join(c for c in sa if c not in sb)
+        right = "".join(c for c in sb if c not in sa)
+        dims = dict(zip(sa, a.shape)) | dict(zip(sb, b.shape))
+        nb, nl, nc, nr = (
+            math.prod(dims[c] for c in part)
+            for part in (batch, left, contracted, right)
+        )
+
+        a = self._permute(a, sa, batch + left + contracted)
+        b = self._permute(b, sb, batch + contracted + right)
+        if not nb * nl * nc * nr:
+            product = Tensor._from_values(
+                repeat(0, nb * nl * nr), (nb, nl, nr), dtype
+            )
+        elif not contracted:
+            product = OPERATIONS["multiply"](
+                _reshape(a, (nb, nl, 1)), _reshape(b, (nb, 1, nr))
+            )
+        elif nb == 1:
+            product = self.matmul(_reshape(a, (nl, nc)), _reshape(b, (nc, nr)))
+        else:
+            product = self.matmul(
+                _reshape(a, (nb, nl, nc)), _reshape(b, (nb, nc, nr))
+            )
+        subscripts = batch + left + right
+        shape = tuple(dims[c] for c in subscripts)
+        return _reshape(product, shape), subscripts
+
+    @staticmethod
+    def _reduce(
+        a: Tensor, subscripts: str, keep: set[str]
+    ) -> tuple[Tensor, str]:
+        """Take diagonals of repeated subscripts, then sum out the rest."""
+        shape, strides = list(a.shape), list(a.strides)
+        unique = ""
+        for axis, c in enumerate(subscripts):
+            if c in unique:
+                # Stepping along both axes at once walks the diagonal.
+                strides[unique.index(c)] += a.strides[axis]
+            else:
+                unique += c
+        if unique != subscripts:
+            axes = [subscripts.index(c) for c in unique]
+            a = a._view(
+                tuple(shape[i] for i in axes),
+                tuple(strides[i] for i in axes),
+                a.offset,
+            )
+            subscripts = unique
+        for axis in reversed(range(len(subscripts))):
+            if subscripts[axis] not in keep:
+                a = OPERATIONS["sum"](a, axis=axis)
+                subscripts = subscripts[:axis] + subscripts[axis + 1 :]
+        return a, subscripts
+
+    @staticmethod
+    def _permute(a: Tensor, subscripts: str, order: str) -> Tensor:
+        if subscripts == order:
+            return a
+        return a.transpose(*(subscripts.index(c) for c in order))
+
+
+def _reshape(a: Tensor, shape: tuple[int, ...]) -> Tensor:
+    return a if a.shape == shape else a.reshape(shape)
+
+
+class Conv2D(Operation):
+    """2-D cross-correlation of NCHW input with OIHW weights.
+
+    ``x`` is ``(N, C, H, W)``, or ``(C, H, W)`` for a single image, and
+    ``weight`` is ``(O, C, KH, KW)``; ``bias`` has one entry per output
+    channel. ``stride`` and ``padding`` are an int or an ``(h, w)``
+    pair, and padding adds zeros on both sides.
+
+    Every output pixel is the dot product of a ``C * KH * KW`` patch of
+    the input with each filter. Patches up to ``direct_threshold``
+    elements are gathered and multiplied one at a time; larger ones are
+    unrolled into an im2col matrix with one patch per row and handed to
+    the matmul kernel in a single product.
+    """
+
+    direct_threshold = 32
+
+    def __init__(self, workers: int = 1) -> None:
+        self.matmul = MatrixMultiply(workers)
+
+    def __call__(
+        self,
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None = None,
+        stride: int | tuple[int, int] = 1,
+        padding: int | tuple[int, int] = 0,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        batched = x.ndim == 4
+        if not batched:
+            x = x.reshape(1, *x.shape)
+        oh, ow = self.output_size(x, weight, bias, stride, padding)
+        n, c, _, _ = x.shape
+        o, _, kh, kw = weight.shape
+        (sh, sw), (ph, pw) = _pair(stride), _pair(padding)
+        dtype = arithmetic_type(x.dtype, weight.dtype)
+        biases: Sequence[Any] = [0] * o
+        if bias is not None:
+            dtype = arithmetic_type(dtype, bias.dtype)
+            biases = bias._values()
+
+        patches = _patches(x._values(), x.shape, (kh, kw), (sh, sw), (ph, pw))
+        filters = MatrixMultiply._pack_rows(weight.reshape(o, c * kh * kw))
+        if c * kh * kw <= self.direct_threshold:
+            pixels: Iterable[Any] = (
+                sum(map(operator.mul, patch, row))
+                for patch in patches
+                for row in filters
+            )
+        else:
+            columns = Tensor._from_values(
+                chain.from_iterable(patches),
+                (n * oh * ow, c * kh * kw),
+                x.dtype,
+            )
+            pixels = self.matmul(columns, weight.reshape(o, -1).T)._values()
+        if bias is not None:
+            pixels = map(
+                operator.add,
+                pixels,
+                chain.from_iterable(repeat(biases, n * oh * ow)),
+            )
+
+        # Pixels come out channel-last; move channels after the batch.
+        result = Tensor._from_values(pixels, (n, oh, ow, o), dtype)
+        result = result.transpose(0, 3, 1, 2)
+        shape = result.shape if batched else result.shape[1:]
+        return _emit(result._values(), shape, dtype, out)
+
+    @staticmethod
+    def output_size(
+        x: Tensor,
+        weight: Tensor,
+        bias: Tensor | None,
+        stride: int | tuple[int, int],
+        padding: int | tuple[int, int],
+    ) -> tuple[int, int]:
+        """Validate the operands and return the output height and width.
+
+        ``x`` is the input with its batch dimension.
+        """
+        if x.ndim != 4:
+            raise ValueError(
+                "conv2d expects input of shape (N, C, H, W) or (C, H, W), "
+                + f"not {x.shape[1:]}."
+            )
+        if weight.ndim != 4 or weight.shape[1] != x.shape[1]:
+            raise ValueError(
+                f"Weights of shape {weight.shape} do not match input with "
+                + f"{x.shape[1]} channels."
+            )
+        if bias is not None and bias.size != weight.shape[0]:
+            raise ValueError(
+                f"Bias of shape {bias.shape} does not match "
+                + f"{weight.shape[0]} output channels."
+            )
+        (h, w), (kh, kw) = x.shape[2:], weight.shape[2:]
+        (sh, sw), (ph, pw) = _pair(stride), _pair(padding)
+        if sh < 1 or sw < 1 or ph < 0 or pw < 0:
+            raise ValueError(
+                f"Invalid stride {stride} or padding {padding} for conv2d."
+            )
+        oh, ow = (h + 2 * ph - kh) // sh + 1, (w + 2 * pw - kw) // sw + 1
+        if oh < 1 or ow < 1:
+            raise ValueError(
+                f"Kernel of size {(kh, kw)} does not fit the padded input "
+                + f"of size {(h + 2 * ph, w + 2 * pw)}."
+            )
+        return oh, ow
+
+
+def _pair(value: int | Sequence[int]) -> tuple[int, int]:
+    if isinstance(value, int):
+        return value, value
+    height, width = value
+    return height, width
+
+
+def _patches(
+    values: Sequence[Any],
+    shape: tuple[int, ...],
+    kernel: tuple[int, int],
+    stride: tuple[int, int],
+    padding: tuple[int, int],
+) -> Iterator[list[Any]]:
+    """Yield each receptive field, flattened in (C, KH, KW) order."""
+    n, c, h, w = shape
+    (kh, kw), (sh, sw), (ph, pw) = kernel, stride, padding
+    width = w + 2 * pw
+    for image in range(n):
+        # Rows of every channel, padded with zeros on all four sides.
+        rows = []
+        for channel in range(c):
+            start = (image * c + channel) * h * w
+            blank = [0] * width
+            rows.append(
+                [blank] * ph
+                + [
+                    [0] * pw + list(values[r : r + w]) + [0] * pw
+                    for r in range(start, start + h * w, w)
+                ]
+                + [blank] * ph
+            )
+        for top in range(0, h + 2 * ph - kh + 1, sh):
+            for left in range(0, width - kw + 1, sw):
+                yield [
+                    v
+                    for channel in rows
+                    for row in channel[top : top + kh]
+                    for v in row[left : left + kw]
+                ]
+
+
+class Quantize(Operation):
+    """Quantize to int8, per tensor or per channel along ``axis``."""
+
+    def __call__(
+        self,
+        a: Tensor,
+        axis: int | None = None,
+        out: Tensor | None = None,
+    ) -> Tensor:
+        if out is not None:
+            raise TypeError(
+                "Quantized results cannot be written into an output tensor."
+            )
+        return QuantizedTensor.quantize(a, axis)
+
+
+class Dequantize(Operation):
+    def __call__(self, a: Tensor, out: Tensor | None = None) -> Tensor:
+        if isinstance(a, QuantizedTensor):
+            return _store(a.dequantize(), out)
+        return _store(a.copy(), out)
+
+
+# The reference kernel for each operation, keyed by ``OpType`` value.
+OPERATIONS: dict[str, Operation] = {
+    "add": Add(),
+    "subtract": Subtract(),
+    "multiply": Multiply(),
+    "divide": Divide(),
+    "matmul": MatrixMultiply(),
+    "sum": Sum(),
+    "mean": Mean(),
+    "max": Max(),
+    "exp": Exp(),
+    "relu": Relu(),
+    "negative": Negative(),
+    "linear": Linear(),
+    "einsum": Einsum(),
+    "conv2d": Conv2D(),
+    "quantize": Quantize(),
+    "dequantize": Dequantize(),
+}
+
+
+def get_activation(name: str) -> UnaryOperation:
+    """The unary operation a fused kernel applies as its activation."""
+    operation = OPERATIONS.get(name)
+    if not isinstance(operation, UnaryOperation):
+        raise ValueError(f"Unsupported activation: {name}")
+    return operation
 
 
 # Operation factory
 def get_operation(
     op: Literal["add", "subtract", "multiply", "divide", "matmul"],
 ) -> Operation:
-    operations: dict[str, Operation] = {
-        "add": Add(),
-        "subtract": Subtract(),
-        "multiply": Multiply(),
-        "divide": Divide(),
-        "matmul": MatrixMultiply(),
-    }
-    return operations[op]
+    return OPERATIONS[op]
 
 
 # Main function
@@ -250,27 +1224,132 @@ def operate(
     a: Tensor,
     b: Tensor,
     op: Literal["add", "subtract", "multiply", "divide", "matmul"],
+    out: Tensor | None = None,
 ) -> Tensor:
     operation = get_operation(op)
-    return operation(a, b)
+    return operation(a, b, out)
 
 
 # Convenience functions
-def add(a: Tensor, b: Tensor) -> Tensor:
-    return operate(a, b, "add")
+def add(a: Tensor, b: Tensor, out: Tensor | None = None) -> Tensor:
+    return operate(a, b, "add", out)
+
+
+def subtract(a: Tensor, b: Tensor, out: Tensor | None = None) -> Tensor:
+    return operate(a, b, "subtract", out)
+
+
+def multiply(a: Tensor, b: Tensor, out: Tensor | None = None) -> Tensor:
+    return operate(a, b, "multiply", out)
+
+
+def divide(a: Tensor, b: Tensor, out: Tensor | None = None) -> Tensor:
+    return operate(a, b, "divide", out)
+
 
+def matmul(a: Tensor, b: Tensor, out: Tensor | None = None) -> Tensor:
+    return operate(a, b, "matmul", out)
 
-def subtract(a: Tensor, b: Tensor) -> Tensor:
-    return operate(a, b, "subtract")
 
+# In-place variants, which write the result into ``a``
+def add_(a: Tensor, b: Tensor) -> Tensor:
+    return add(a, b, out=a)
 
-def multiply(a: Tensor, b: Tensor) -> Tensor:
-    return operate(a, b, "multiply")
+
+def subtract_(a: Tensor, b: Tensor) -> Tensor:
+    return subtract(a, b, out=a)
+
+
+def multiply_(a: Tensor, b: Tensor) -> Tensor:
+    return multiply(a, b, out=a)
+
+
+def divide_(a: Tensor, b: Tensor) -> Tensor:
+    return divide(a, b, out=a)
+
+
+# Unary operations
+def exp(a: Tensor, out: Tensor | None = None) -> Tensor:
+    return OPERATIONS["exp"](a, out=out)
+
+
+def relu(a: Tensor, out: Tensor | None = None) -> Tensor:
+    return OPERATIONS["relu"](a, out=out)
+
+
+def negative(a: Tensor, out: Tensor | None = None) -> Tensor:
+    return OPERATIONS["negative"](a, out=out)
+
+
+# Reductions
+def reduce_sum(
+    a: Tensor,
+    axis: int | None = None,
+    keepdims: bool = False,
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["sum"](a, axis=axis, keepdims=keepdims, out=out)
+
+
+def reduce_mean(
+    a: Tensor,
+    axis: int | None = None,
+    keepdims: bool = False,
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["mean"](a, axis=axis, keepdims=keepdims, out=out)
+
+
+def reduce_max(
+    a: Tensor,
+    axis: int | None = None,
+    keepdims: bool = False,
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["max"](a, axis=axis, keepdims=keepdims, out=out)
+
+
+# Fused operations
+def linear(
+    x: Tensor,
+    weight: Tensor,
+    bias: Tensor | None = None,
+    activation: str | None = None,
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["linear"](
+        x, weight, bias, activation=activation, out=out
+    )
+
+
+def einsum(
+    equation: str,
+    *operands: Tensor,
+    strategy: Strategy = "auto",
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["einsum"](
+        *operands, equation=equation, strategy=strategy, out=out
+    )
+
+
+def conv2d(
+    x: Tensor,
+    weight: Tensor,
+    bias: Tensor | None = None,
+    stride: int | tuple[int, int] = 1,
+    padding: int | tuple[int, int] = 0,
+    out: Tensor | None = None,
+) -> Tensor:
+    return OPERATIONS["conv2d"](
+        x, weight, bias, stride=stride, padding=padding, out=out
+    )
 
 
-def divide(a: Tensor, b: Tensor) -> Tensor:
-    return operate(a, b, "divide")
+# Quantization
+def quantize(a: Tensor, axis: int | None = None) -> Tensor:
+    return OPERATIONS["quantize"](a, axis=axis)
 
 
-def matmul(a: Tensor, b: Tensor) -> Tensor:
-    return operate(a, b, "matmul")
+def dequantize(a: Tensor, out: Tensor | None = None) -> Tensor:
+    return OPERATIONS["dequantize"](a, out=out)
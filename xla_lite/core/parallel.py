@@ -0,0 +1,134 @@
+"""Row-partitioned matmul across a process pool.
+
+Operands are copied once into ``multiprocessing.shared_memory`` blocks
+and workers attach to them by name, so only block names and row ranges
+are pickled. Each worker writes its rows of the result straight into a
+shared output block.
+"""
+
+from __future__ import annotations
+
+import atexit
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Sequence, cast
+
+from .dtype import DType
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Return a process pool of ``workers``, reused across calls."""
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _pools[workers]
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown(cancel_futures=True)
+    _pools.clear()
+
+
+def parallel_matmul(
+    a: array,
+    b_columns: array,
+    shape: tuple[int, int, int],
+    dtype: DType,
+    workers: int,
+    block_size: int,
+) -> array:
+    """Multiply ``a`` (m x k) by B, given as its packed columns (n x k).
+
+    Returns the m x n result as a flat array of ``dtype``.
+    """
+    m, k, n = shape
+    result = array(dtype.typecode)
+    blocks: list[SharedMemory] = []
+    try:
+        for source in (a, b_columns):
+            blocks.append(_share(source))
+        out = SharedMemory(create=True, size=max(m * n * dtype.itemsize, 1))
+        blocks.append(out)
+
+        chunk = -(-m // workers)
+        tasks = [
+            (
+                blocks[0].name,
+                a.typecode,
+                blocks[1].name,
+                b_columns.typecode,
+                out.name,
+                dtype,
+                shape,
+                start,
+                min(start + chunk, m),
+                block_size,
+            )
+            for start in range(0, m, chunk)
+        ]
+        pool = get_pool(workers)
+        for future in [pool.submit(_matmul_rows, *task) for task in tasks]:
+            future.result()
+        result.frombytes(_buffer(out)[: m * n * dtype.itemsize])
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return result
+
+
+def _share(values: array) -> SharedMemory:
+    size = len(values) * values.itemsize
+    block = SharedMemory(create=True, size=max(size, 1))
+    _buffer(block)[:size] = values.tobytes()
+    return block
+
+
+def _buffer(block: SharedMemory) -> memoryview:
+    return cast(memoryview, block.buf)
+
+
+def _attach(name: str) -> SharedMemory:
+    # Workers share the parent's resource tracker whatever the start
+    # method, so they must not unregister the block: the parent owns it
+    # and unlinks it, which also drops the tracker's entry.
+    return SharedMemory(name=name)
+
+
+def _matmul_rows(
+    a_name: str,
+    a_typecode: str,
+    b_name: str,
+    b_typecode: str,
+    out_name: str,
+    dtype: DType,
+    shape: tuple[int, int, int],
+    start: int,
+    stop: int,
+    block_size: int,
+) -> None:
+    from .ops import blocked_matmul
+
+    m, k, n = shape
+    blocks = [_attach(name) for name in (a_name, b_name, out_name)]
+    try:
+        a_view = _buffer(blocks[0]).cast(a_typecode)  # type: ignore
+        b_view = _buffer(blocks[1]).cast(b_typecode)  # type: ignore
+        a_rows: list[Sequence[int | float]] = [
+            a_view[i * k : (i + 1) * k].tolist() for i in range(start, stop)
+        ]
+        b_columns: list[Sequence[int | float]] = [
+            b_view[j * k : (j + 1) * k].tolist() for j in range(n)
+        ]
+        values = dtype.pack(blocked_matmul(a_rows, b_columns, block_size))
+        out = _buffer(blocks[2])
+        itemsize = dtype.itemsize
+        out[start * n * itemsize : stop * n * itemsize] = values.tobytes()
+        del a_view, b_view, out
+    finally:
+        for block in blocks:
+            block.close()
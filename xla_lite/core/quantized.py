@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from array import array
+from math import prod
+from typing import Any, Iterable, Sequence
+
+from .dtype import DType
+from .tensor import Tensor, contiguous_strides
+
+QMIN, QMAX = -128, 127
+
+
+class QuantizedTensor(Tensor):
+    """An int8 tensor standing for ``scale * (q - zero_point)``.
+
+    The scale and zero point are shared by the whole tensor, or given
+    per channel along ``axis``. Like sparse tensors these are ``Tensor``
+    instances: kernels with a quantized variant, such as matmul, read
+    the int8 storage directly, while any other access (``data``,
+    ``buffer``, views) materializes the dequantized values in ``dtype``.
+    """
+
+    def __init__(
+        self,
+        values: Iterable[int],
+        shape: Sequence[int],
+        scale: float | Sequence[float],
+        zero_point: int | Sequence[int] = 0,
+        axis: int | None = None,
+        dtype: DType | str = DType.FLOAT64,
+    ) -> None:
+        shape = tuple(shape)
+        target = DType.of(dtype)
+        if not target.is_floating:
+            raise TypeError(
+                "Quantized tensors dequantize to a floating dtype, not "
+                + f"{target.value}."
+            )
+        self._setup(None, None, shape, contiguous_strides(shape), 0, target)
+        self._qvalues = DType.INT8.pack(values)
+        if len(self._qvalues) != self.size:
+            raise ValueError(
+                f"{len(self._qvalues)} values cannot fill a tensor of shape "
+                + f"{shape}."
+            )
+        channels = 1
+        if axis is not None:
+            axis = self._normalize_axis(axis, self.ndim)
+            channels = shape[axis]
+        self.axis = axis
+        self.scales = array("d", _per_channel(scale, channels))
+        self.zero_points = DType.INT8.pack(_per_channel(zero_point, channels))
+        if len(self.scales) != channels or len(self.zero_points) != channels:
+            raise ValueError(
+                f"Expected {channels} scales and zero points for axis {axis}."
+            )
+        if any(s <= 0 for s in self.scales):
+            raise ValueError("Quantization scales must be positive.")
+
+    @classmethod
+    def quantize(
+        cls,
+        tensor: Tensor,
+        axis: int | None = None,
+        dtype: DType | str | None = None,
+    ) -> QuantizedTensor:
+        """Quantize ``tensor`` with an affine int8 mapping of its range.
+
+        Each channel's range is widened to include zero, so zero is
+        represented exactly, then mapped onto ``[-128, 127]``.
+        """
+        if isinstance(tensor, QuantizedTensor) and tensor.axis == axis:
+            return tensor
+        if dtype is None:
+            dtype = tensor.dtype if tensor.dtype.is_floating else "float64"
+        values = tensor._values()
+        if axis is None:
+            index, groups = [0] * len(values), [list(values)]
+        else:
+            axis = cls._normalize_axis(axis, tensor.ndim)
+            index = _channel_index(tensor.shape, axis)
+            groups = [[] for _ in range(tensor.shape[axis])]
+            for v, c in zip(values, index):
+                groups[c].append(v)
+
+        params = [_affine(group) for group in groups]
+        q = [
+            min(QMAX, max(QMIN, round(v / params[c][0]) + params[c][1]))
+            for v, c in zip(values, index)
+        ]
+        return cls(
+            q,
+            tensor.shape,
+            [s for s, _ in params],
+            [z for _, z in params],
+            axis,
+            dtype,
+        )
+
+    @property
+    def qvalues(self) -> array:
+        """The int8 values in row-major order."""
+        return self._qvalues
+
+    def channel_params(self, axis: int) -> tuple[list[float], list[int]]:
+        """Scale and zero point for each index along ``axis``.
+
+        Per-tensor parameters are repeated; per-channel parameters must
+        be along ``axis``.
+        """
+        if self.axis is None:
+            n = self.shape[axis]
+            return [self.scales[0]] * n, [self.zero_points[0]] * n
+        if self.axis != self._normalize_axis(axis, self.ndim):
+            raise ValueError(
+                f"Parameters are per channel along axis {self.axis}, not "
+                + f"{axis}."
+            )
+        return list(self.scales), list(self.zero_points)
+
+    def dequantize(self) -> Tensor:
+        return Tensor._from_values(self._dequantized(), self.shape, self.dtype)
+
+    def _dequantized(self) -> list[float]:
+        if self.axis is None:
+            scale, zero = self.scales[0], self.zero_points[0]
+            return [scale * (q - zero) for q in self._qvalues]
+        scales, zeros = self.scales, self.zero_points
+        return [
+            scales[c] * (q - zeros[c])
+            for q, c in zip(
+                self._qvalues, _channel_index(self.shape, self.axis)
+            )
+        ]
+
+    def _pack_data(self) -> None:
+        self._buffer = self.dtype.pack(self._dequantized())
+
+    def astype(self, dtype: DType | str) -> Tensor:
+        if DType.of(dtype).is_floating:
+            return QuantizedTensor(
+                self._qvalues,
+                self.shape,
+                self.scales,
+                self.zero_points,
+                self.axis,
+                dtype,
+            )
+        return super().astype(dtype)
+
+    def copy(self) -> QuantizedTensor:
+        return QuantizedTensor(
+            self._qvalues,
+            self.shape,
+            self.scales,
+            self.zero_points,
+            self.axis,
+            self.dtype,
+        )
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise TypeError("Quantized tensors do not support item assignment.")
+
+    def _make_writable(self, replacement: Any = None) -> None:
+        raise TypeError("Quantized tensors cannot be written in place.")
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantizedTensor(shape={self.shape!r}, axis={self.axis}, "
+            + f"dtype={self.dtype.value})"
+        )
+
+
+def _per_channel(value: Any, channels: int) -> list[Any]:
+    if isinstance(value, (int, float)):
+        return [value] * channels
+    return list(value)
+
+
+def _channel_index(shape: tuple[int, ...], axis: int) -> list[int]:
+    """The index along ``axis`` of each element, in row-major order."""
+    stride, channels = contiguous_strides(shape)[axis], shape[axis]
+    return [i // stride % channels for i in range(prod(shape))]
+
+
+def _affine(values: Iterable[int | float]) -> tuple[float, int]:
+    """Scale and zero point mapping ``values`` onto the int8 range."""
+    values = list(values)
+    low = min(min(values, default=0), 0)
+    high = max(max(values, default=0), 0)
+    if high == low:
+        return 1.0, 0
+    scale = (high - low) / (QMAX - QMIN)
+    zero = round(QMIN - low / scale)
+    return scale, min(QMAX, max(QMIN, zero))
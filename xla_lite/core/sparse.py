@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import operator
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from typing import Any, Callable, Iterable, Sequence
+
+from .dtype import DType
+from .tensor import Tensor, contiguous_strides
+
+
+class SparseTensor(Tensor, ABC):
+    """A 2-D tensor that stores only its nonzero elements.
+
+    Sparse tensors are ``Tensor`` instances, so graphs, the executor and
+    the optimizers carry them unchanged. Kernels in ``core.ops`` that
+    have a sparse variant use the compressed storage directly; any other
+    access (``data``, ``buffer``, views) materializes the dense form.
+    """
+
+    def _init_sparse(self, shape: Sequence[int], dtype: DType) -> None:
+        shape = tuple(shape)
+        if len(shape) != 2:
+            raise ValueError("Sparse tensors must be two-dimensional.")
+        self._setup(None, None, shape, contiguous_strides(shape), 0, dtype)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.values)
+
+    @property
+    @abstractmethod
+    def values(self) -> array:
+        pass
+
+    @abstractmethod
+    def tocsr(self) -> CSRTensor:
+        pass
+
+    def to_dense(self) -> Tensor:
+        return Tensor._from_values(
+            self._dense_values(), self.shape, self.dtype
+        )
+
+    def _dense_values(self) -> list[int | float]:
+        csr = self.tocsr()
+        n = self.shape[1]
+        dense: list[int | float] = [0] * self.size
+        for i in range(self.shape[0]):
+            for p in range(csr.indptr[i], csr.indptr[i + 1]):
+                dense[i * n + csr.indices[p]] = csr.values[p]
+        return dense
+
+    def _pack_data(self) -> None:
+        self._buffer = self.dtype.pack(self._dense_values())
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise TypeError("Sparse tensors do not support item assignment.")
+
+    def _make_writable(self, replacement: Any = None) -> None:
+        raise TypeError("Sparse tensors cannot be written in place.")
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(shape={self.shape!r}, nnz={self.nnz}, "
+            + f"dtype={self.dtype.value})"
+        )
+
+
+class COOTensor(SparseTensor):
+    """Coordinate format: parallel row, column and value arrays.
+
+    Convenient for construction; entries may be unsorted and repeated
+    coordinates are summed when converting to CSR.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[int],
+        cols: Iterable[int],
+        values: Iterable[int | float],
+        shape: Sequence[int],
+        dtype: DType | str | None = None,
+    ) -> None:
+        values = list(values)
+        target = DType.of(dtype) if dtype is not None else DType.infer(values)
+        self._init_sparse(shape, target)
+        self.rows = array("q", rows)
+        self.cols = array("q", cols)
+        self._nonzeros = target.pack(values)
+        if not len(self.rows) == len(self.cols) == len(self._nonzeros):
+            raise ValueError(
+                "Rows, columns and values must have the same length."
+            )
+        m, n = self.shape
+        if any(not 0 <= r < m for r in self.rows) or any(
+            not 0 <= c < n for c in self.cols
+        ):
+            raise ValueError(
+                f"Coordinates are out of bounds for shape {self.shape}."
+            )
+
+    @property
+    def values(self) -> array:
+        return self._nonzeros
+
+    def tocsr(self) -> CSRTensor:
+        m = self.shape[0]
+        order = sorted(
+            range(len(self._nonzeros)),
+            key=lambda p: (self.rows[p], self.cols[p]),
+        )
+        counts = [0] * m
+        indices: list[int] = []
+        values: list[int | float] = []
+        last = (-1, -1)
+        for p in order:
+            coord = (self.rows[p], self.cols[p])
+            if coord == last:
+                values[-1] += self._nonzeros[p]
+                continue
+            last = coord
+            counts[coord[0]] += 1
+            indices.append(coord[1])
+            values.append(self._nonzeros[p])
+
+        indptr = [0]
+        for count in counts:
+            indptr.append(indptr[-1] + count)
+        return CSRTensor(indptr, indices, values, self.shape, self.dtype)
+
+    def copy(self) -> COOTensor:
+        return COOTensor(
+            self.rows, self.cols, self._nonzeros, self.shape, self.dtype
+        )
+
+
+class CSRTensor(SparseTensor):
+    """Compressed sparse row format.
+
+    The column indices and values of row ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]`` and the matching slice of
+    ``values``, sorted by column.
+    """
+
+    def __init__(
+        self,
+        indptr: Iterable[int],
+        indices: Iterable[int],
+        values: Iterable[int | float],
+        shape: Sequence[int],
+        dtype: DType | str | None = None,
+    ) -> None:
+        values = list(values)
+        target = DType.of(dtype) if dtype is not None else DType.infer(values)
+        self._init_sparse(shape, target)
+        self.indptr = array("q", indptr)
+        self.indices = array("q", indices)
+        self._nonzeros = target.pack(values)
+        if len(self.indptr) != self.shape[0] + 1 or self.indptr[0] != 0:
+            raise ValueError(
+                f"indptr must have {self.shape[0] + 1} entries starting "
+                + "at 0."
+            )
+        if not self.indptr[-1] == len(self.indices) == len(self._nonzeros):
+            raise ValueError(
+                "indptr, indices and values describe different numbers of "
+                + "nonzeros."
+            )
+
+    @classmethod
+    def from_dense(cls, tensor: Tensor) -> CSRTensor:
+        if tensor.ndim != 2:
+            raise ValueError("Sparse tensors must be two-dimensional.")
+        n = tensor.shape[1]
+        dense = tensor._values()
+        indptr, indices, values = [0], [], []
+        for i in range(tensor.shape[0]):
+            for j in range(n):
+                value = dense[i * n + j]
+                if value:
+                    indices.append(j)
+                    values.append(value)
+            indptr.append(len(indices))
+        return cls(indptr, indices, values, tensor.shape, tensor.dtype)
+
+    @property
+    def values(self) -> array:
+        return self._nonzeros
+
+    def tocsr(self) -> CSRTensor:
+        return self
+
+    def row(self, i: int) -> tuple[Sequence[int], Sequence[int | float]]:
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self._nonzeros[start:stop]
+
+    def transpose(self, *axes: int) -> CSRTensor:
+        if axes and tuple(axes) != (1, 0):
+            raise ValueError(f"Axes {axes} are not valid for a 2-D tensor.")
+        rows = [
+            i
+            for i in range(self.shape[0])
+            for _ in range(self.indptr[i + 1] - self.indptr[i])
+        ]
+        return COOTensor(
+            self.indices,
+            rows,
+            self._nonzeros,
+            (self.shape[1], self.shape[0]),
+            self.dtype,
+        ).tocsr()
+
+    def astype(self, dtype: DType | str) -> CSRTensor:
+        return CSRTensor(
+            self.indptr, self.indices, self._nonzeros, self.shape, dtype
+        )
+
+    def copy(self) -> CSRTensor:
+        return self.astype(self.dtype)
+
+
+def sparse_matmul_dense(a: SparseTensor, b: Tensor, dtype: DType) -> Tensor:
+    """Multiply sparse ``a`` by dense ``b``; work scales with nnz(a)."""
+    csr = a.tocsr()
+    n = b.shape[1]
+    b_values = b._values()
+    result: list[int | float] = []
+    for i in range(a.shape[0]):
+        acc: list[Any] = [0] * n
+        for k, v in zip(*csr.row(i)):
+            row = b_values[k * n : (k + 1) * n]
+            acc = list(
+                map(operator.add, acc, map(operator.mul, repeat(v), row))
+            )
+        result.extend(acc)
+    return Tensor._from_values(result, (a.shape[0], n), dtype)
+
+
+def dense_matmul_sparse(a: Tensor, b: SparseTensor, dtype: DType) -> Tensor:
+    """Multiply dense ``a`` by sparse ``b``, scattering rows of ``b``."""
+    csr = b.tocsr()
+    m, k = a.shape
+    n = b.shape[1]
+    a_values = a._values()
+    rows = [csr.row(p) for p in range(k)]
+    result: list[int | float] = []
+    for i in range(m):
+        acc: list[Any] = [0] * n
+        for p in range(k):
+            scale = a_values[i * k + p]
+            if scale:
+                for j, v in zip(*rows[p]):
+                    acc[j] += scale * v
+        result.extend(acc)
+    return Tensor._from_values(result, (m, n), dtype)
+
+
+def sparse_matmul_sparse(
+    a: SparseTensor, b: SparseTensor, dtype: DType
+) -> CSRTensor:
+    """Gustavson's row-by-row product; the result stays sparse."""
+    a_csr, b_csr = a.tocsr(), b.tocsr()
+    indptr, indices, values = [0], [], []
+    for i in range(a.shape[0]):
+        acc: dict[int, Any] = {}
+        for k, v in zip(*a_csr.row(i)):
+            for j, w in zip(*b_csr.row(k)):
+                acc[j] = acc.get(j, 0) + v * w
+        for j in sorted(acc):
+            indices.append(j)
+            values.append(acc[j])
+        indptr.append(len(indices))
+    return CSRTensor(indptr, indices, values, (a.shape[0], b.shape[1]), dtype)
+
+
+def sparse_combine(
+    a: SparseTensor,
+    b: SparseTensor,
+    op: Callable[[Any, Any], Any],
+    dtype: DType,
+    union: bool,
+) -> CSRTensor:
+    """Apply ``op`` over the union (or intersection) of both patterns.
+
+    Missing entries count as zero, so ``union`` suits ``+`` and ``-``
+    while the intersection is enough for ``*``.
+    """
+    a_csr, b_csr = a.tocsr(), b.tocsr()
+    indptr, indices, values = [0], [], []
+    for i in range(a.shape[0]):
+        left = dict(zip(*a_csr.row(i)))
+        right = dict(zip(*b_csr.row(i)))
+        cols = (
+            left.keys() | right.keys() if union else left.keys() & right.keys()
+        )
+        for j in sorted(cols):
+            indices.append(j)
+            values.append(op(left.get(j, 0), right.get(j, 0)))
+        indptr.append(len(indices))
+    return CSRTensor(indptr, indices, values, a.shape, dtype)
+
+
+def sparse_scale(
+    a: SparseTensor,
+    b: Tensor,
+    op: Callable[[Any, Any], Any],
+    dtype: DType,
+) -> CSRTensor:
+    """Apply ``op(a, b)`` at the nonzeros of ``a`` only.
+
+    ``b`` is a scalar or a dense tensor of the same shape. Only valid
+    for ops where ``op(0, x) == 0``, such as ``*``.
+    """
+    csr = a.tocsr()
+    if b.is_scalar():
+        scalar = b.item()
+        values: Iterable[Any] = map(op, csr.values, repeat(scalar))
+    else:
+        n = a.shape[1]
+        dense = b._values()
+        values = [
+            op(v, dense[i * n + j])
+            for i in range(a.shape[0])
+            for j, v in zip(*csr.row(i))
+        ]
+    return CSRTensor(csr.indptr, csr.indices, values, a.shape, dtype)
@@ -1,20 +1,311 @@
 from __future__ import annotations
 
-import copy
-from dataclasses import dataclass, field
-from typing import cast
+import os
+import sys
+import weakref
+from array import array
+from itertools import repeat
+from math import prod
+from typing import Iterable, Iterator, Sequence, cast
 
+from .dtype import DType
+
+Index = int | slice | tuple[int | slice, ...]
 Data = int | float | list["Data"]
+Buffer = array | memoryview
+
+
+def contiguous_strides(shape: tuple[int, ...]) -> tuple[int, ...]:
+    strides: list[int] = []
+    step = 1
+    for dim in reversed(shape):
+        strides.append(step)
+        step *= dim
+    return tuple(reversed(strides))
+
+
+def broadcast_shapes(*shapes: tuple[int, ...]) -> tuple[int, ...]:
+    """Combine shapes under NumPy broadcasting rules.
+
+    Shapes are aligned on their trailing dimensions; each pair of
+    dimensions must match or one of them must be 1.
+    """
+    ndim = max((len(shape) for shape in shapes), default=0)
+    result = [1] * ndim
+    for shape in shapes:
+        for i, dim in enumerate(shape, ndim - len(shape)):
+            if dim != result[i]:
+                if result[i] != 1 and dim != 1:
+                    raise ValueError(
+                        f"Shapes {' and '.join(map(str, shapes))} cannot "
+                        + "be broadcast together."
+                    )
+                result[i] = dim if result[i] == 1 else result[i]
+    return tuple(result)
+
+
+def row_spans(
+    shape: tuple[int, ...], strides: tuple[int, ...], offset: int = 0
+) -> tuple[list[int], int, int]:
+    """Return the start of every innermost row, the row length and step."""
+    if not shape:
+        return [offset], 1, 1
+
+    *outer_shape, length = shape
+    *outer_strides, step = strides
+    starts = [offset]
+    for dim, stride in zip(outer_shape, outer_strides):
+        starts = [start + i * stride for start in starts for i in range(dim)]
+    return starts, length, step
+
+
+def iter_rows(
+    buffer: Buffer,
+    shape: tuple[int, ...],
+    strides: tuple[int, ...],
+    offset: int = 0,
+) -> Iterator[Sequence[int | float]]:
+    """Yield the innermost rows of a strided buffer in row-major order."""
+    starts, length, step = row_spans(shape, strides, offset)
+    for start in starts:
+        if step == 0:
+            yield [buffer[start]] * length
+        else:
+            yield buffer[start : start + length * step : step]
+
+
+class _Aliases:
+    """The live tensors sharing one buffer, held by weak reference."""
+
+    __slots__ = ("_refs", "__weakref__")
+
+    def __init__(self) -> None:
+        self._refs: dict[int, weakref.ref[Tensor]] = {}
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def add(self, tensor: Tensor) -> None:
+        key = id(tensor)
+        aliases = weakref.ref(self)
+
+        def forget(_: weakref.ref[Tensor]) -> None:
+            alive = aliases()
+            if alive is not None:
+                alive._refs.pop(key, None)
+
+        self._refs[key] = weakref.ref(tensor, forget)
+
+    def discard(self, tensor: Tensor) -> None:
+        self._refs.pop(id(tensor), None)
 
 
-@dataclass
 class Tensor:
-    data: Data
-    shape: tuple[int, ...] | None = field(init=False)
+    """A dense tensor stored as nested lists or as a flat typed buffer.
+
+    Tensors built from nested lists without a dtype keep the lists as-is
+    and pack them into a buffer the first time a kernel needs one. From
+    then on, as with an explicit ``dtype`` or ``from_flat``, the elements
+    live only in one contiguous ``array`` (or ``memoryview``) whose
+    layout is described by ``shape``, ``strides`` (in elements) and
+    ``offset``; ``data`` then materializes the nested list view on first
+    access. ``data`` is read-only and the lists passed in must not be
+    modified afterwards: changes to them are not packed.
+    """
 
-    def __post_init__(self):
+    def __init__(self, data: Data, dtype: DType | str | None = None) -> None:
+        self._data: Data | None = data
+        self._buffer: Buffer | None = None
         self.validate_tensor()
-        self.shape = self.compute_shape(self.data)
+        self._dtype = DType.of(dtype) if dtype is not None else None
+        self._aliases: _Aliases | None = None
+        self._foreign = False
+        self.shape: tuple[int, ...] = self.compute_shape(data)
+        self.strides: tuple[int, ...] = contiguous_strides(self.shape)
+        self.offset = 0
+        if self._dtype is not None:
+            self._pack_data()
+
+    @classmethod
+    def from_flat(
+        cls,
+        values: Iterable[int | float] | Buffer,
+        shape: Sequence[int],
+        dtype: DType | str | None = None,
+    ) -> Tensor:
+        if isinstance(values, (array, memoryview)):
+            buffer: Buffer = values
+            if dtype is not None and DType.of(dtype) is not cls._dtype_of(
+                buffer
+            ):
+                buffer = DType.of(dtype).pack(buffer, wrap=True)
+        else:
+            values = list(values)
+            buffer = (
+                DType.of(dtype) if dtype is not None else DType.infer(values)
+            ).pack(values)
+        shape = tuple(shape)
+        if len(buffer) != prod(shape):
+            raise ValueError(
+                f"Buffer of {len(buffer)} elements cannot be viewed with "
+                + f"shape {shape}."
+            )
+        return cls._from_storage(buffer, shape)
+
+    @classmethod
+    def from_buffer(
+        cls,
+        obj: object,
+        shape: Sequence[int] | None = None,
+        dtype: DType | str | None = None,
+    ) -> Tensor:
+        """Wrap any object supporting the buffer protocol without copying.
+
+        The element type comes from the buffer's format unless ``dtype``
+        reinterprets the raw bytes, and the shape defaults to the
+        buffer's own. Buffers that are not C-contiguous or not in native
+        byte order are copied. The tensor treats the memory as shared:
+        writes through the tensor copy it first, while writes by the
+        owner stay visible.
+        """
+        view = memoryview(obj)  # type: ignore[arg-type]
+        if dtype is None:
+            target = DType.from_format(view.format, view.itemsize)
+            if shape is None:
+                shape = view.shape
+        else:
+            target = DType.of(dtype)
+
+        order = view.format[:1]
+        swap = order in "<>!" and (order == "<") != (sys.byteorder == "little")
+        if swap or not view.c_contiguous:
+            copied = array(target.typecode)
+            copied.frombytes(view.tobytes())
+            if swap:
+                copied.byteswap()
+            buffer: Buffer = copied
+        else:
+            buffer = view.cast("B").cast(target.format)  # type: ignore
+        if shape is None:
+            shape = (len(buffer),)
+        tensor = cls.from_flat(buffer, shape, target)
+        tensor._foreign = True
+        return tensor
+
+    @classmethod
+    def from_file(
+        cls, path: str | os.PathLike[str], mmap: bool = True
+    ) -> Tensor:
+        from .io import load_tensor
+
+        return load_tensor(path, mmap=mmap)
+
+    def to_file(self, path: str | os.PathLike[str]) -> None:
+        from .io import save_tensor
+
+        save_tensor(self, path)
+
+    @classmethod
+    def _from_values(
+        cls,
+        values: Iterable[int | float],
+        shape: tuple[int, ...],
+        dtype: DType,
+    ) -> Tensor:
+        """Pack a kernel's flat row-major output, skipping validation."""
+        return cls._new(
+            None,
+            dtype.pack(values),
+            shape,
+            contiguous_strides(shape),
+            0,
+            dtype,
+        )
+
+    @classmethod
+    def _from_storage(
+        cls,
+        buffer: Buffer,
+        shape: tuple[int, ...],
+        strides: tuple[int, ...] | None = None,
+        offset: int = 0,
+        dtype: DType | None = None,
+    ) -> Tensor:
+        if strides is None:
+            strides = contiguous_strides(shape)
+        if dtype is None:
+            dtype = cls._dtype_of(buffer)
+        return cls._new(None, buffer, shape, strides, offset, dtype)
+
+    @classmethod
+    def _new(
+        cls,
+        data: Data | None,
+        buffer: Buffer | None,
+        shape: tuple[int, ...],
+        strides: tuple[int, ...],
+        offset: int,
+        dtype: DType | None,
+    ) -> Tensor:
+        tensor = cls.__new__(cls)
+        tensor._setup(data, buffer, shape, strides, offset, dtype)
+        return tensor
+
+    def _setup(
+        self,
+        data: Data | None,
+        buffer: Buffer | None,
+        shape: tuple[int, ...],
+        strides: tuple[int, ...],
+        offset: int,
+        dtype: DType | None,
+    ) -> None:
+        self._data = data
+        self._buffer = buffer
+        self._dtype = dtype
+        self._aliases = None
+        self._foreign = False
+        self.shape = shape
+        self.strides = strides
+        self.offset = offset
+
+    @property
+    def data(self) -> Data:
+        if self._data is not None:
+            return self._data
+        data = self._materialize()
+        # Foreign code may write to an exported buffer at any time, so
+        # the nested view is only cached while we own the memory.
+        if not self._foreign:
+            self._data = data
+        return data
+
+    @property
+    def buffer(self) -> Buffer:
+        if self._buffer is None:
+            self._pack_data()
+        return cast(Buffer, self._buffer)
+
+    @property
+    def dtype(self) -> DType:
+        if self._dtype is None:
+            self._pack_data()
+        return cast(DType, self._dtype)
+
+    @property
+    def size(self) -> int:
+        return prod(self.shape)
+
+    def is_flat(self) -> bool:
+        return self._buffer is not None
+
+    def is_contiguous(self) -> bool:
+        expected = 1
+        for dim, stride in zip(reversed(self.shape), reversed(self.strides)):
+            if dim != 1 and stride != expected:
+                return False
+            expected *= dim
+        return True
 
     def compute_shape(self, data: Data) -> tuple[int, ...]:
         shape: list[int] = []
@@ -27,7 +318,12 @@ class Tensor:
         return tuple(shape)
 
     def validate_tensor(self) -> None:
-        if not isinstance(self.data, (int, float, list)):
+        # Check the nested data as given; only tensors stored in a buffer
+        # materialize it.
+        data = self._data
+        if data is None and self._buffer is not None:
+            data = self.data
+        if not isinstance(data, (int, float, list)):
             raise TypeError(
                 "Tensor data must be an int, float, or nested list."
             )
@@ -42,46 +338,395 @@ class Tensor:
                         raise TypeError(
                             "All elements must be of the same type."
                         )
+                    if isinstance(elem, list) and len(elem) != len(
+                        cast(list[Data], first_elem)
+                    ):
+                        raise ValueError("All rows must have the same length.")
                     check_uniform(elem, depth + 1)
 
-        check_uniform(self.data)
+        check_uniform(data)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
 
     def is_scalar(self) -> bool:
-        return isinstance(self.data, (int, float))
+        return not self.shape
 
     def is_vector(self) -> bool:
         return self.is_row_vector() or self.is_column_vector()
 
     def is_row_vector(self) -> bool:
-        return (
-            self.is_matrix()
-            and self.shape is not None
-            and self.shape[0] == 1
-            and self.shape[1] >= 1
-        )
+        return self.is_matrix() and self.shape[0] == 1 and self.shape[1] >= 1
 
     def is_column_vector(self) -> bool:
-        return (
-            self.is_matrix()
-            and self.shape is not None
-            and self.shape[1] == 1
-            and self.shape[0] >= 1
-        )
+        return self.is_matrix() and self.shape[1] == 1 and self.shape[0] >= 1
 
     def is_matrix(self) -> bool:
-        if not isinstance(self.data, list):
-            return False
-        if len(self.data) == 0:
-            return False
-        if not all(isinstance(row, list) for row in self.data):
-            return False
-        return all(
-            all(
-                isinstance(elem, (int, float))
-                for elem in cast(list[int | float], row)
+        return len(self.shape) == 2 and self.shape[0] > 0
+
+    def copy(self) -> Tensor:
+        return Tensor._from_storage(self._pack(), self.shape, dtype=self.dtype)
+
+    def astype(self, dtype: DType | str) -> Tensor:
+        dtype = DType.of(dtype)
+        return Tensor._from_storage(
+            dtype.pack(self._values(), wrap=True), self.shape, dtype=dtype
+        )
+
+    def item(self) -> int | float:
+        if self.size != 1:
+            raise ValueError(
+                "Only tensors with one element can be converted to a Python "
+                + "scalar."
             )
-            for row in self.data
+        return self.dtype.unpack([self.buffer[self.offset]])[0]
+
+    @property
+    def T(self) -> Tensor:
+        return self.transpose()
+
+    def transpose(self, *axes: int) -> Tensor:
+        if not axes:
+            axes = tuple(reversed(range(self.ndim)))
+        if sorted(axes) != list(range(self.ndim)):
+            raise ValueError(
+                f"Axes {axes} are not a permutation of the dimensions of a "
+                + f"tensor with shape {self.shape}."
+            )
+        return self._view(
+            tuple(self.shape[axis] for axis in axes),
+            tuple(self.strides[axis] for axis in axes),
+            self.offset,
         )
 
-    def copy(self) -> Tensor:
-        return Tensor(copy.deepcopy(self.data))
+    def reshape(self, *shape: int | tuple[int, ...]) -> Tensor:
+        dims = cast(
+            tuple[int, ...],
+            shape[0]
+            if len(shape) == 1 and isinstance(shape[0], tuple)
+            else shape,
+        )
+        if dims.count(-1) > 1:
+            raise ValueError("Only one dimension can be inferred.")
+        if -1 in dims:
+            known = prod(dim for dim in dims if dim != -1)
+            if known == 0 or self.size % known != 0:
+                raise ValueError(
+                    f"Cannot reshape tensor of shape {self.shape} into {dims}."
+                )
+            dims = tuple(self.size // known if d == -1 else d for d in dims)
+        if prod(dims) != self.size:
+            raise ValueError(
+                f"Cannot reshape tensor of shape {self.shape} into {dims}."
+            )
+
+        if self.is_contiguous():
+            return self._view(dims, contiguous_strides(dims), self.offset)
+        return Tensor._from_storage(self._pack(), dims, dtype=self.dtype)
+
+    def squeeze(self, axis: int | None = None) -> Tensor:
+        if axis is None:
+            keep = [i for i, dim in enumerate(self.shape) if dim != 1]
+        else:
+            axis = self._normalize_axis(axis, self.ndim)
+            if self.shape[axis] != 1:
+                raise ValueError(
+                    f"Cannot squeeze axis {axis} of size {self.shape[axis]}."
+                )
+            keep = [i for i in range(self.ndim) if i != axis]
+        return self._view(
+            tuple(self.shape[i] for i in keep),
+            tuple(self.strides[i] for i in keep),
+            self.offset,
+        )
+
+    def expand_dims(self, axis: int) -> Tensor:
+        axis = self._normalize_axis(axis, self.ndim + 1)
+        stride = (
+            self.shape[axis] * self.strides[axis] if axis < self.ndim else 1
+        )
+        return self._view(
+            self.shape[:axis] + (1,) + self.shape[axis:],
+            self.strides[:axis] + (stride,) + self.strides[axis:],
+            self.offset,
+        )
+
+    def broadcast_to(self, *shape: int | tuple[int, ...]) -> Tensor:
+        """Return a view that repeats this tensor over ``shape``.
+
+        New leading dimensions and size-1 dimensions get a stride of 0,
+        so the elements are never copied.
+        """
+        dims = cast(
+            tuple[int, ...],
+            shape[0]
+            if len(shape) == 1 and isinstance(shape[0], tuple)
+            else shape,
+        )
+        try:
+            compatible = broadcast_shapes(self.shape, dims) == dims
+        except ValueError:
+            compatible = False
+        if not compatible:
+            raise ValueError(
+                f"Cannot broadcast a tensor of shape {self.shape} to {dims}."
+            )
+        lead = len(dims) - self.ndim
+        strides = (0,) * lead + tuple(
+            0 if dim == 1 and target != 1 else stride
+            for dim, target, stride in zip(
+                self.shape, dims[lead:], self.strides
+            )
+        )
+        return self._view(dims, strides, self.offset)
+
+    def __getitem__(self, key: Index) -> Tensor:
+        return self._view(*self._locate(key))
+
+    def __setitem__(self, key: Index, value: Tensor | int | float) -> None:
+        self._make_writable()
+        shape, strides, offset = self._locate(key)
+        starts, length, step = row_spans(shape, strides, offset)
+        if isinstance(value, Tensor) and value.shape:
+            if value.shape != shape:
+                raise ValueError(
+                    f"Cannot assign a tensor of shape {value.shape} to a "
+                    + f"region of shape {shape}."
+                )
+            rows: Iterable[Sequence[int | float]] = value._rows()
+        else:
+            if isinstance(value, Tensor):
+                value = value.item()
+            rows = repeat([value] * length)
+        if length == 0:
+            return
+
+        buffer = self.buffer
+        dtype = self.dtype
+        step = step or 1
+        for start, row in zip(starts, rows):
+            buffer[start : start + length * step : step] = dtype.pack(row)
+        self._data = None
+
+    def _locate(
+        self, key: Index
+    ) -> tuple[tuple[int, ...], tuple[int, ...], int]:
+        keys = key if isinstance(key, tuple) else (key,)
+        if len(keys) > self.ndim:
+            raise IndexError(
+                f"Too many indices for a tensor of rank {self.ndim}."
+            )
+
+        shape: list[int] = []
+        strides: list[int] = []
+        offset = self.offset
+        for axis, index in enumerate(keys):
+            dim, stride = self.shape[axis], self.strides[axis]
+            if isinstance(index, slice):
+                start, stop, step = index.indices(dim)
+                if step < 0:
+                    raise ValueError("Negative slice steps are not supported.")
+                shape.append(len(range(start, stop, step)))
+                strides.append(stride * step)
+                offset += start * stride
+            elif isinstance(index, int):
+                if not -dim <= index < dim:
+                    raise IndexError(
+                        f"Index {index} is out of bounds for axis {axis} "
+                        + f"with size {dim}."
+                    )
+                offset += (index % dim) * stride
+            else:
+                raise TypeError(
+                    "Tensors can only be indexed by ints and slices."
+                )
+
+        shape.extend(self.shape[len(keys) :])
+        strides.extend(self.strides[len(keys) :])
+        return tuple(shape), tuple(strides), offset
+
+    def _view(
+        self, shape: tuple[int, ...], strides: tuple[int, ...], offset: int
+    ) -> Tensor:
+        view = Tensor._from_storage(
+            self.buffer, shape, strides, offset, self.dtype
+        )
+        if self._aliases is None:
+            self._aliases = _Aliases()
+            self._aliases.add(self)
+        self._aliases.add(view)
+        view._aliases = self._aliases
+        view._foreign = self._foreign
+        return view
+
+    @property
+    def _shared(self) -> bool:
+        """Whether another live tensor or foreign code sees the buffer.
+
+        Views are tracked weakly, so the views kernels take internally
+        stop counting as soon as they are dropped.
+        """
+        return self._foreign or (
+            self._aliases is not None and len(self._aliases) > 1
+        )
+
+    def _detach(self, buffer: Buffer) -> None:
+        """Move onto a contiguous buffer of our own."""
+        if self._aliases is not None:
+            self._aliases.discard(self)
+            self._aliases = None
+        self._buffer = buffer
+        self.strides = contiguous_strides(self.shape)
+        self.offset = 0
+        self._foreign = False
+
+    def _needs_copy(self) -> bool:
+        buffer = self.buffer
+        return self._shared or (
+            isinstance(buffer, memoryview) and buffer.readonly
+        )
+
+    def _make_writable(self, replacement: array | None = None) -> None:
+        """Move onto a buffer of our own if anyone else can see ours.
+
+        A ``replacement`` holding every element in row-major order is
+        adopted instead of a copy of the old elements.
+        """
+        if self._needs_copy():
+            self._detach(self._pack() if replacement is None else replacement)
+
+    def _write(self, values: Iterable[int | float]) -> None:
+        """Overwrite every element with a kernel's row-major output."""
+        packed = self.dtype.pack(values)
+        self._make_writable(packed)
+        buffer = self.buffer
+        if buffer is packed:
+            pass
+        elif self.is_contiguous():
+            buffer[self.offset : self.offset + self.size] = packed
+        else:
+            starts, length, step = row_spans(
+                self.shape, self.strides, self.offset
+            )
+            step = step or 1
+            for i, start in enumerate(starts):
+                buffer[start : start + length * step : step] = packed[
+                    i * length : (i + 1) * length
+                ]
+        self._data = None
+
+    def _export(self) -> Buffer:
+        """Return the buffer for a zero-copy export to foreign code.
+
+        Foreign writers may change the buffer behind our back, so the
+        nested view is no longer cached and our own writes copy first.
+        """
+        buffer = self.buffer
+        self._data = None
+        self._foreign = True
+        return buffer
+
+    def _pack(self) -> array:
+        """Copy this tensor's elements into a new contiguous array."""
+        return self.dtype.pack(self._values())
+
+    def _pack_data(self) -> None:
+        values = self._flatten(self.data, self.ndim)
+        if self._dtype is None:
+            self._dtype = DType.infer(values)
+        self._buffer = self._dtype.pack(values)
+        # The buffer is the only copy of the elements from now on, so
+        # ``data`` cannot disagree with what kernels read.
+        self._data = None
+
+    def _values(self) -> Sequence[int | float]:
+        """Return the stored elements in row-major order."""
+        buffer = self.buffer
+        if self.is_contiguous():
+            return buffer[self.offset : self.offset + self.size]
+        if self.size and not any(self.strides):
+            return [buffer[self.offset]] * self.size
+        return [v for row in self._rows() for v in row]
+
+    @staticmethod
+    def _dtype_of(buffer: Buffer) -> DType:
+        return DType.from_typecode(
+            buffer.typecode if isinstance(buffer, array) else buffer.format
+        )
+
+    @staticmethod
+    def _normalize_axis(axis: int, ndim: int) -> int:
+        if not -ndim <= axis < ndim:
+            raise ValueError(
+                f"Axis {axis} is out of bounds for a tensor of rank {ndim}."
+            )
+        return axis % ndim
+
+    def _rows(self) -> Iterator[Sequence[int | float]]:
+        return iter_rows(self.buffer, self.shape, self.strides, self.offset)
+
+    def _materialize(self) -> Data:
+        if not self.shape:
+            return self.item()
+        if self.size == 0:
+            return self._empty(self.shape)
+
+        nested: list = self.dtype.unpack(self._values())
+        for dim in reversed(self.shape[1:]):
+            nested = [nested[i : i + dim] for i in range(0, len(nested), dim)]
+        return nested
+
+    @staticmethod
+    def _empty(shape: tuple[int, ...]) -> list[Data]:
+        if shape[0] == 0 or len(shape) == 1:
+            return []
+        return [Tensor._empty(shape[1:]) for _ in range(shape[0])]
+
+    @staticmethod
+    def _flatten(data: Data, ndim: int) -> list[int | float]:
+        values: list = [data]
+        for _ in range(ndim):
+            values = [elem for row in values for elem in row]
+        return values
+
+    @property
+    def __array_interface__(self) -> dict[str, object]:
+        """Let NumPy wrap the tensor's buffer without copying it.
+
+        The tensor is marked shared, so its own later writes copy the
+        buffer instead of changing the exported array.
+        """
+        buffer = self._export()
+        itemsize = self.dtype.itemsize
+        return {
+            "version": 3,
+            "shape": self.shape,
+            "typestr": self.dtype.typestr,
+            "data": buffer,
+            "offset": self.offset * itemsize,
+            "strides": None
+            if self.is_contiguous()
+            else tuple(stride * itemsize for stride in self.strides),
+        }
+
+    def __buffer__(self, flags: int) -> memoryview:
+        if self.is_contiguous():
+            buffer, offset = self._export(), self.offset
+        else:
+            buffer, offset = self._pack(), 0
+        return (
+            memoryview(buffer)[offset : offset + self.size]
+            .cast("B")
+            .cast(self.dtype.format, self.shape)  # type: ignore
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        return (self.data, self.shape) == (other.data, other.shape)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Tensor(data={self.data!r}, shape={self.shape!r})"
@@ -1,15 +1,41 @@
 from typing import Any
 
-from ..core import Graph, OpType, Tensor
-from ..core.ops import add, divide, matmul, multiply, subtract
+from ..backends import Backend, get_backend
+from ..core import Graph, OpType, QuantizedTensor, SparseTensor, Tensor
 
 
 class Executor:
-    def __init__(self, graph: Graph) -> None:
+    """Run a graph node by node on a kernel backend.
+
+    With ``reuse_buffers`` every op node writes into the tensor it
+    produced on the previous run instead of allocating a new one, so a
+    graph executed in a loop reaches a steady state without allocating
+    results. Tensors returned by an earlier run are then overwritten.
+
+    ``workers`` lets the backend spread large kernels over that many
+    processes; the Python backend splits big matmuls by rows.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        backend: Backend | str | None = None,
+        reuse_buffers: bool = False,
+        workers: int = 1,
+    ) -> None:
         self.graph = graph
+        self.backend = get_backend(backend).with_workers(workers)
+        self.reuse_buffers = reuse_buffers
         self.tensor_vals: dict[Any, Tensor] = {}
 
-    def execute(self) -> dict[Any, Tensor]:
+    def execute(
+        self, out: dict[Any, Tensor] | None = None
+    ) -> dict[Any, Tensor]:
+        """Execute the graph, writing results into ``out`` where given.
+
+        ``out`` maps node ids to preallocated tensors of the result's
+        shape and of a dtype the result can be safely cast to.
+        """
         exec_order = self.graph.topological_sort()
 
         for node in exec_order:
@@ -29,21 +55,30 @@ class Executor:
                         f"Missing input tensor for node '{node.node_id}': {e}"
                     )
 
-                result_tensor = self.exec_op(node.op, input_tensors)
+                buffer = out.get(node.node_id) if out else None
+                if buffer is None and self.reuse_buffers:
+                    buffer = self._reusable(node.node_id)
+                result_tensor = self.exec_op(
+                    node.op, input_tensors, buffer, node.attrs
+                )
                 self.tensor_vals[node.node_id] = result_tensor
 
         return self.tensor_vals
 
-    def exec_op(self, op: str, inputs: list) -> Tensor:
-        if op == OpType.ADD.value:
-            return add(*inputs)
-        elif op == OpType.SUBTRACT.value:
-            return subtract(*inputs)
-        elif op == OpType.MULTIPLY.value:
-            return multiply(*inputs)
-        elif op == OpType.DIVIDE.value:
-            return divide(*inputs)
-        elif op == OpType.MATMUL.value:
-            return matmul(*inputs)
-        else:
-            raise ValueError(f"Unsupported operation: {op}")
+    def exec_op(
+        self,
+        op: str,
+        inputs: list,
+        out: Tensor | None = None,
+        attrs: dict[str, Any] | None = None,
+    ) -> Tensor:
+        return self.backend.execute(op, inputs, out, attrs)
+
+    def _reusable(self, node_id: Any) -> Tensor | None:
+        previous = self.tensor_vals.get(node_id)
+        # Compressed results are immutable and are never reused.
+        if previous is None or isinstance(
+            previous, (SparseTensor, QuantizedTensor)
+        ):
+            return None
+        return previous
@@ -1,3 +1,19 @@
-from .builder import BinOpNode, ConstantNode, GraphBuilder
+from .builder import (
+    BinOpNode,
+    ConstantNode,
+    Conv2DNode,
+    EinsumNode,
+    GraphBuilder,
+    LinearNode,
+    UnaryOpNode,
+)
 
-__all__ = ["GraphBuilder", "ConstantNode", "BinOpNode"]
+__all__ = [
+    "GraphBuilder",
+    "ConstantNode",
+    "BinOpNode",
+    "UnaryOpNode",
+    "LinearNode",
+    "EinsumNode",
+    "Conv2DNode",
+]
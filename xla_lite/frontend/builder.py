@@ -4,7 +4,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Generic, Protocol, TypeVar
 
-from xla_lite.core import Graph, Node, OpType, Tensor
+from xla_lite.core import DType, Graph, Node, OpType, Tensor
+from xla_lite.core.ops import get_activation
 from xla_lite.utils import validate_tensor
 
 T = TypeVar("T")
@@ -53,12 +54,110 @@ class BinOpNode(OpNode, Generic[T]):
         return self.node_id
 
 
+@dataclass
+class UnaryOpNode(OpNode, Generic[T]):
+    op: OpType
+    operand: T
+    attrs: dict[str, Any] = field(default_factory=dict)
+    node_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.node_id = f"{self.op.value}_{id(self)}"
+
+    def build(self, graph: Graph) -> str:
+        node = Node(
+            self.node_id,
+            op=self.op.value,
+            inputs=[self.operand],
+            attrs=dict(self.attrs),
+        )
+        graph.add_node(node)
+        return self.node_id
+
+
+@dataclass
+class LinearNode(OpNode, Generic[T]):
+    x: T
+    weight: T
+    bias: T | None = None
+    activation: str | None = None
+    node_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.activation is not None:
+            get_activation(self.activation)
+        self.node_id = f"{OpType.LINEAR.value}_{id(self)}"
+
+    def build(self, graph: Graph) -> str:
+        inputs = [self.x, self.weight]
+        if self.bias is not None:
+            inputs.append(self.bias)
+        attrs = (
+            {} if self.activation is None else {"activation": self.activation}
+        )
+        node = Node(
+            self.node_id, op=OpType.LINEAR.value, inputs=inputs, attrs=attrs
+        )
+        graph.add_node(node)
+        return self.node_id
+
+
+@dataclass
+class EinsumNode(OpNode, Generic[T]):
+    equation: str
+    operands: list[T]
+    strategy: str = "auto"
+    node_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.node_id = f"{OpType.EINSUM.value}_{id(self)}"
+
+    def build(self, graph: Graph) -> str:
+        node = Node(
+            self.node_id,
+            op=OpType.EINSUM.value,
+            inputs=list(self.operands),
+            attrs={"equation": self.equation, "strategy": self.strategy},
+        )
+        graph.add_node(node)
+        return self.node_id
+
+
+@dataclass
+class Conv2DNode(OpNode, Generic[T]):
+    x: T
+    weight: T
+    bias: T | None = None
+    stride: int | tuple[int, int] = 1
+    padding: int | tuple[int, int] = 0
+    node_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.node_id = f"{OpType.CONV2D.value}_{id(self)}"
+
+    def build(self, graph: Graph) -> str:
+        inputs = [self.x, self.weight]
+        if self.bias is not None:
+            inputs.append(self.bias)
+        node = Node(
+            self.node_id,
+            op=OpType.CONV2D.value,
+            inputs=inputs,
+            attrs={"stride": self.stride, "padding": self.padding},
+        )
+        graph.add_node(node)
+        return self.node_id
+
+
 class GraphBuilder:
     def __init__(self) -> None:
         self.ops: list[OpNode] = []
 
-    def constant(self, value: Any) -> ConstantNode:
-        node = ConstantNode(Tensor(value))
+    def constant(
+        self, value: Any, dtype: DType | str | None = None
+    ) -> ConstantNode:
+        tensor = value if isinstance(value, Tensor) else Tensor(value, dtype)
+        node = ConstantNode(tensor)
         self.ops.append(node)
         return node
 
@@ -77,6 +176,115 @@ class GraphBuilder:
     def matmul(self, a: NodeProtocol, b: NodeProtocol) -> BinOpNode:
         return self._binary_op(OpType.MATMUL, a, b)
 
+    def batch_matmul(self, a: NodeProtocol, b: NodeProtocol) -> BinOpNode:
+        """Multiply batches of matrices in a single node.
+
+        Inputs have a leading batch dimension. A rank-2 input, such as a
+        shared weight matrix, is applied to every item of the batch.
+        """
+        return self._binary_op(OpType.MATMUL, a, b)
+
+    def exp(self, a: NodeProtocol) -> UnaryOpNode:
+        return self._unary_op(OpType.EXP, a)
+
+    def relu(self, a: NodeProtocol) -> UnaryOpNode:
+        return self._unary_op(OpType.RELU, a)
+
+    def negative(self, a: NodeProtocol) -> UnaryOpNode:
+        return self._unary_op(OpType.NEGATIVE, a)
+
+    def reduce_sum(
+        self, a: NodeProtocol, axis: int | None = None, keepdims: bool = False
+    ) -> UnaryOpNode:
+        """Sum over ``axis``, or over every element when it is None."""
+        return self._unary_op(OpType.SUM, a, axis=axis, keepdims=keepdims)
+
+    def reduce_mean(
+        self, a: NodeProtocol, axis: int | None = None, keepdims: bool = False
+    ) -> UnaryOpNode:
+        return self._unary_op(OpType.MEAN, a, axis=axis, keepdims=keepdims)
+
+    def reduce_max(
+        self, a: NodeProtocol, axis: int | None = None, keepdims: bool = False
+    ) -> UnaryOpNode:
+        return self._unary_op(OpType.MAX, a, axis=axis, keepdims=keepdims)
+
+    def linear(
+        self,
+        x: NodeProtocol,
+        weight: NodeProtocol,
+        bias: NodeProtocol | None = None,
+        activation: OpType | str | None = None,
+    ) -> LinearNode:
+        """A dense layer, ``activation(x @ weight + bias)``, in one node.
+
+        ``activation`` is a unary op such as ``OpType.RELU``. The fused
+        kernel never materializes the product or the biased product.
+        """
+        if isinstance(activation, OpType):
+            activation = activation.value
+        node = LinearNode(
+            x.node_id,
+            weight.node_id,
+            None if bias is None else bias.node_id,
+            activation,
+        )
+        self.ops.append(node)
+        return node
+
+    def einsum(
+        self, equation: str, *operands: NodeProtocol, strategy: str = "auto"
+    ) -> EinsumNode:
+        """Contract ``operands`` as described by ``equation``.
+
+        The contraction order is chosen when the graph runs, from the
+        operand shapes, and cached for later runs.
+        """
+        node = EinsumNode(
+            equation, [operand.node_id for operand in operands], strategy
+        )
+        self.ops.append(node)
+        return node
+
+    def conv2d(
+        self,
+        x: NodeProtocol,
+        weight: NodeProtocol,
+        bias: NodeProtocol | None = None,
+        stride: int | tuple[int, int] = 1,
+        padding: int | tuple[int, int] = 0,
+    ) -> Conv2DNode:
+        """A 2-D convolution of NCHW input with OIHW weights, as one node."""
+        node = Conv2DNode(
+            x.node_id,
+            weight.node_id,
+            None if bias is None else bias.node_id,
+            stride,
+            padding,
+        )
+        self.ops.append(node)
+        return node
+
+    def quantize(
+        self, a: NodeProtocol, axis: int | None = None
+    ) -> UnaryOpNode:
+        """Quantize to int8, per tensor or per channel along ``axis``.
+
+        Quantizing a constant folds to an int8 constant, and matmuls
+        with quantized operands accumulate in int32.
+        """
+        return self._unary_op(OpType.QUANTIZE, a, axis=axis)
+
+    def dequantize(self, a: NodeProtocol) -> UnaryOpNode:
+        return self._unary_op(OpType.DEQUANTIZE, a)
+
+    def _unary_op(
+        self, op: OpType, a: NodeProtocol, **attrs: Any
+    ) -> UnaryOpNode:
+        node = UnaryOpNode(op, a.node_id, attrs)
+        self.ops.append(node)
+        return node
+
     def _binary_op(
         self, op: OpType, a: NodeProtocol, b: NodeProtocol
     ) -> BinOpNode:
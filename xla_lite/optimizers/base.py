@@ -1,9 +1,9 @@
 import abc
 from functools import wraps
-from typing import Callable
+from typing import Any
 
-from xla_lite.core import Graph, OpType, Tensor
-from xla_lite.core.ops import add, divide, matmul, multiply, subtract
+from xla_lite.backends import Backend, get_backend
+from xla_lite.core import Graph, Tensor
 
 
 def timing(func):
@@ -31,15 +31,14 @@ class Optimizer:
         self.graph = graph
 
     @staticmethod
-    def _execute_operation(op: str, inputs: list[Tensor]) -> Tensor:
-        op_map: dict[str, Callable] = {
-            OpType.ADD.value: add,
-            OpType.SUBTRACT.value: subtract,
-            OpType.MULTIPLY.value: multiply,
-            OpType.DIVIDE.value: divide,
-            OpType.MATMUL.value: matmul,
-        }
-        if op in op_map:
-            return op_map[op](*inputs)
+    def _execute_operation(
+        op: str,
+        inputs: list[Tensor],
+        backend: Backend | str | None = None,
+        attrs: dict[str, Any] | None = None,
+    ) -> Tensor:
+        kernels = get_backend(backend)
+        if kernels.supports(op):
+            return kernels.execute(op, inputs, attrs=attrs)
         else:
             raise ValueError(f"Unsupported operation for optimization: {op}")
@@ -1,7 +1,13 @@
-import struct
 from typing import Any
 
-from xla_lite.core import Data, Graph, Node, OpType
+from xla_lite.core import (
+    CSRTensor,
+    Graph,
+    Node,
+    OpType,
+    QuantizedTensor,
+    SparseTensor,
+)
 from xla_lite.optimizers import OptStrategy
 
 
@@ -9,7 +15,7 @@ class CommonSubexpressionElimination(OptStrategy):
     def apply(self, graph: Graph) -> None:
         op_signature_map: dict[tuple[str, tuple[Any, ...]], str] = {}
 
-        for node in graph.nodes:
+        for node in list(graph.nodes):
             if node.op:
                 signature = self._get_node_signature(node)
 
@@ -21,18 +27,11 @@ class CommonSubexpressionElimination(OptStrategy):
                         + f"duplicate of '{original_node_id}'"
                     )
 
-                    node.inputs = [original_node_id]
+                    graph.replace_all_uses_with(node.node_id, original_node_id)
+                    graph.set_inputs(node.node_id, [original_node_id])
                     node.op = OpType.CONST.value
                     node.tensor = None
 
-                    for other_node in graph.nodes:
-                        other_node.inputs = [
-                            original_node_id
-                            if input_id == node.node_id
-                            else input_id
-                            for input_id in other_node.inputs
-                        ]
-
                     print(
                         f"Node '{node.node_id}' replaced with constant node "
                         + "'{original_node_id}'"
@@ -46,30 +45,58 @@ class CommonSubexpressionElimination(OptStrategy):
 
     @staticmethod
     def _get_node_signature(node: Node) -> tuple:
-        if node.op == OpType.CONST.value and node.tensor:
+        if node.op == OpType.CONST.value and isinstance(
+            node.tensor, SparseTensor
+        ):
+            # Compare the compressed arrays instead of densifying.
+            csr: CSRTensor = node.tensor.tocsr()
             return (
                 node.op,
-                CommonSubexpressionElimination._data_to_bytes(
-                    node.tensor.data
-                ),
+                csr.shape,
+                csr.dtype,
+                csr.indptr.tobytes(),
+                csr.indices.tobytes(),
+                csr.values.tobytes(),
             )
-        elif node.op in {OpType.ADD.value, OpType.MULTIPLY.value}:
-            return (node.op, tuple(sorted(node.inputs)))
-        else:
-            return (node.op, tuple(node.inputs))
-
-    @staticmethod
-    def _data_to_bytes(data: Data) -> bytes:
-        if isinstance(data, int):
-            return data.to_bytes(
-                (data.bit_length() + 7) // 8, byteorder="big", signed=True
+        elif node.op == OpType.CONST.value and isinstance(
+            node.tensor, QuantizedTensor
+        ):
+            # Compare the int8 values and parameters instead of
+            # dequantizing.
+            quantized = node.tensor
+            return (
+                node.op,
+                quantized.shape,
+                quantized.dtype,
+                quantized.axis,
+                quantized.scales.tobytes(),
+                quantized.zero_points.tobytes(),
+                quantized.qvalues.tobytes(),
             )
-        elif isinstance(data, float):
-            return struct.pack("!d", data)
-        elif isinstance(data, list):
-            return b"".join(
-                CommonSubexpressionElimination._data_to_bytes(item)
-                for item in data
+        elif node.op == OpType.CONST.value and node.tensor is not None:
+            # Pack the elements rather than build nested lists, which
+            # would load a memory-mapped constant in full.
+            tensor = node.tensor
+            return (
+                node.op,
+                tensor.shape,
+                tensor.dtype,
+                tensor._pack().tobytes(),
             )
-        else:
-            raise TypeError(f"Unsupported data type: {type(data)}")
+        attrs = _hashable(node.attrs)
+        if node.op in {OpType.ADD.value, OpType.MULTIPLY.value}:
+            return (node.op, tuple(sorted(node.inputs)), attrs)
+        return (node.op, tuple(node.inputs), attrs)
+
+
+def _hashable(value: Any) -> Any:
+    """Turn the lists and dicts in attrs into tuples, recursively.
+
+    Attrs such as a conv2d ``stride`` may be given as lists, which
+    cannot be hashed; a list and a tuple of the same values sign alike.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
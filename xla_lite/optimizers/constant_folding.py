@@ -1,18 +1,20 @@
+from xla_lite.backends import Backend, get_backend
 from xla_lite.core import Graph, Node, OpType, Tensor
 from xla_lite.optimizers import Optimizer, OptStrategy
 
 
 class ConstantFolding(OptStrategy):
+    def __init__(self, backend: Backend | str | None = None) -> None:
+        self.backend = get_backend(backend)
+
     def apply(self, graph: Graph) -> None:
-        changed = True
-        while changed:
-            changed = False
-            for node in graph.nodes:
-                if node.op and node.op != OpType.CONST.value:
-                    if self._can_fold(graph, node):
-                        self._fold_node(graph, node)
-                        changed = True
-                        print(f"Folded node {node.node_id}")
+        # Inputs come first in topological order, so one pass folds
+        # every chain of constants.
+        for node in graph.topological_sort():
+            if node.op and node.op != OpType.CONST.value:
+                if self._can_fold(graph, node):
+                    self._fold_node(graph, node, self.backend)
+                    print(f"Folded node {node.node_id}")
 
     @staticmethod
     def _can_fold(graph: Graph, node: Node) -> bool:
@@ -26,7 +28,9 @@ class ConstantFolding(OptStrategy):
         )
 
     @staticmethod
-    def _fold_node(graph: Graph, node: Node) -> None:
+    def _fold_node(
+        graph: Graph, node: Node, backend: Backend | None = None
+    ) -> None:
         inputs: list[Tensor] = []
         for input_id in node.inputs:
             input_node = graph.get_node(input_id)
@@ -39,11 +43,11 @@ class ConstantFolding(OptStrategy):
         if node.op is None:
             raise ValueError(f"Node {node.node_id} has no operation")
 
-        if len(inputs) < 2:
-            return  # Don't fold if there are not enough inputs.
-
-        folded = Optimizer._execute_operation(node.op, inputs)
+        folded = Optimizer._execute_operation(
+            node.op, inputs, backend, node.attrs
+        )
 
         node.op = OpType.CONST.value
-        node.inputs = []
+        graph.set_inputs(node.node_id, [])
         node.tensor = folded
+        node.attrs = {}
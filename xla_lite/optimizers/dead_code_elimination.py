@@ -34,14 +34,13 @@ class DeadCodeElimination(OptStrategy):
 
         print(f"Reachable nodes: {reachable}")
 
-        graph.nodes = [
-            node for node in graph.nodes if node.node_id in reachable
-        ]
-        graph.node_map = {
-            node_id: node
-            for node_id, node in graph.node_map.items()
-            if node_id in reachable
-        }
+        # Users of a dead node are dead too, so once the dead nodes drop
+        # their inputs none of them is used any more, even in a cycle.
+        dead = [node for node in graph.nodes if node.node_id not in reachable]
+        for node in dead:
+            graph.set_inputs(node.node_id, [])
+        for node in dead:
+            graph.remove_node(node.node_id)
 
         print(
             "Nodes after elimination: "
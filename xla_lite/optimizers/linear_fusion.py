@@ -0,0 +1,60 @@
+from xla_lite.core import Graph, Node, OpType
+from xla_lite.optimizers import OptStrategy
+
+ACTIVATIONS = {OpType.EXP.value, OpType.RELU.value, OpType.NEGATIVE.value}
+
+
+class LinearFusion(OptStrategy):
+    """Rewrite ``matmul -> add -> activation`` chains as ``linear`` nodes.
+
+    The bias add and the activation are each optional, but at least one
+    must follow the matmul. Intermediate nodes are only absorbed when
+    the chain is their sole consumer and they are not graph outputs.
+    The last node of the chain keeps its id, so its consumers are
+    unaffected.
+    """
+
+    def apply(self, graph: Graph) -> None:
+        for node in list(graph.nodes):
+            if node.op == OpType.MATMUL.value and len(node.inputs) == 2:
+                self._fuse(graph, node)
+
+    @staticmethod
+    def _fuse(graph: Graph, matmul: Node) -> None:
+        chain = [matmul]
+        inputs = list(matmul.inputs)
+        attrs = {}
+
+        consumer = LinearFusion._sole_consumer(graph, matmul)
+        if consumer is not None and consumer.op == OpType.ADD.value:
+            bias = [i for i in consumer.inputs if i != matmul.node_id]
+            if len(bias) == 1:
+                inputs.append(bias[0])
+                chain.append(consumer)
+                consumer = LinearFusion._sole_consumer(graph, consumer)
+        if consumer is not None and consumer.op in ACTIVATIONS:
+            attrs["activation"] = consumer.op
+            chain.append(consumer)
+
+        if len(chain) == 1:
+            return
+
+        target = chain[-1]
+        target.op = OpType.LINEAR.value
+        target.attrs = attrs
+        graph.set_inputs(target.node_id, inputs)
+        for node in reversed(chain[:-1]):
+            graph.remove_node(node.node_id)
+        print(
+            f"Fused {[node.node_id for node in chain]} into linear node "
+            + f"'{target.node_id}'"
+        )
+
+    @staticmethod
+    def _sole_consumer(graph: Graph, node: Node) -> Node | None:
+        users = graph.users(node.node_id)
+        if node.is_output or len(users) != 1:
+            return None
+        if users[0].inputs.count(node.node_id) != 1:
+            return None
+        return users[0]